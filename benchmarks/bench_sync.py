@@ -0,0 +1,261 @@
+"""
+End-to-end throughput benchmarks of `tap_mailjet.sync.sync`.
+
+Every scenario syncs a synthetic dataset (tests/unittests/synthetic_data.py)
+from the local stand-in server (tests/unittests/fake_mailjet.py) in its own
+process, and reports records and output bytes per second, request latency
+percentiles and peak RSS. Throughput counts the RECORD messages actually
+written, and a scenario that writes more or fewer than its dataset holds
+fails. Results are compared with `baselines.json`; a scenario whose
+throughput drops, or whose memory grows, by more than the tolerance fails
+the run.
+
+    python benchmarks/bench_sync.py                 # run and check against the baselines
+    python benchmarks/bench_sync.py --update        # run and store new baselines
+    python benchmarks/bench_sync.py -s incremental  # one scenario
+
+Baselines depend on the machine, regenerate them with --update before
+comparing changes on a new one. There is no parent/child scenario since no
+stream of the tap currently has children.
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests", "unittests")]
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+TOLERANCE = 0.25
+SEED = 0
+# Start of a RECORD message line, as written by singer-python or by the output buffer
+RECORD_PREFIXES = (b'{"type": "RECORD"', b'{"type":"RECORD"')
+
+SCENARIOS = {
+    "full_table": {
+        "stream": "contacts",
+        "records": 20000,
+        "config": {},
+    },
+    "full_table_tuned": {
+        "stream": "contacts",
+        "records": 20000,
+        "config": {
+            "page_sizes": {"contacts": 1000},
+            "compiled_transform": True,
+            "stream_pages": True,
+            "output_buffer_bytes": 1048576,
+        },
+    },
+    "incremental": {
+        "stream": "messages",
+        "records": 20000,
+        "config": {},
+    },
+    "incremental_windowed": {
+        "stream": "messages",
+        "records": 20000,
+        "config": {"incremental_window_days": 7, "window_concurrency": 4, "compiled_transform": True},
+    },
+}
+
+# Metric -> whether a higher value is better. Latencies are reported but too noisy to gate on.
+CHECKED_METRICS = {"records_per_second": True, "peak_rss_mb": False}
+
+
+class ScenarioFailed(Exception):
+    """A scenario whose sync did not write its dataset exactly once."""
+
+
+class CountingSink:
+    """Stands in for stdout, counting the bytes and RECORD messages the tap writes."""
+
+    def __init__(self) -> None:
+        self.bytes = 0
+        self.records = 0
+        self.tail = b""
+        self.buffer = self
+
+    def write(self, data) -> int:
+        encoded = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        self.bytes += len(encoded)
+        lines = (self.tail + encoded).split(b"\n")
+        self.tail = lines.pop()
+        self.records += sum(1 for line in lines if line.startswith(RECORD_PREFIXES))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def get_catalog(stream_name: str):
+    """The discovered catalog with `stream_name` and all its fields selected."""
+    from singer.catalog import Catalog
+    from tap_mailjet.discover import discover
+
+    catalog = discover()
+    entries = [entry for entry in catalog.streams if entry.tap_stream_id == stream_name]
+    for entry in entries:
+        for item in entry.metadata:
+            item["metadata"]["selected"] = True
+    return Catalog(entries)
+
+
+def percentile(values: List[float], share: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+def run_scenario(name: str, data_dir: str) -> Dict:
+    """Sync one scenario in this process and return its measurements."""
+    from fake_mailjet import Dataset, FakeMailjet
+    from synthetic_data import write_stream
+    from tap_mailjet.client import Client
+    from tap_mailjet.sync import sync
+
+    scenario = SCENARIOS[name]
+    directory = os.path.join(data_dir, f"{scenario['stream']}-{scenario['records']}-{SEED}")
+    if not os.path.exists(os.path.join(directory, f"{scenario['stream']}.json")):
+        os.makedirs(directory, exist_ok=True)
+        write_stream(directory, scenario["stream"], scenario["records"], SEED)
+
+    latencies = []
+    with FakeMailjet(Dataset.from_directory(directory)) as fake:
+        config = {
+            "api_key": "key",
+            "secret_key": "secret",
+            "start_date": "2024-12-31T00:00:00Z",
+            "base_url": fake.base_url,
+            **scenario["config"],
+        }
+        client = Client(config)
+        request = client._session.request
+
+        def timed_request(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return request(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - started)
+
+        client._session.request = timed_request
+        catalog = get_catalog(scenario["stream"])
+
+        sink = CountingSink()
+        stdout = sys.stdout
+        sys.stdout = sink
+        started = time.perf_counter()
+        try:
+            sync(client, config, catalog, {})
+        finally:
+            seconds = time.perf_counter() - started
+            sys.stdout = stdout
+
+    if sink.records != scenario["records"]:
+        raise ScenarioFailed(f"wrote {sink.records} RECORD messages for {scenario['records']} records")
+    return {
+        "records": sink.records,
+        "seconds": round(seconds, 3),
+        "records_per_second": round(sink.records / seconds, 1),
+        "output_mb_per_second": round(sink.bytes / seconds / 1048576, 2),
+        "requests": len(latencies),
+        "latency_p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+        "latency_p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "latency_p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_isolated(name: str, data_dir: str, repeat: int) -> Dict:
+    """Run a scenario `repeat` times in fresh processes and keep the median of each metric."""
+    runs = []
+    for _ in range(repeat):
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", name, "--data-dir", data_dir],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        if child.returncode:
+            raise ScenarioFailed((child.stderr.strip().splitlines() or ["no output"])[-1])
+        runs.append(json.loads(child.stdout.strip().splitlines()[-1]))
+    return {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+
+
+def check(results: Dict[str, Dict], baselines: Dict, tolerance: float) -> List[str]:
+    """Describe every checked metric that regressed beyond `tolerance`."""
+    failures = []
+    for name, result in results.items():
+        baseline = baselines.get("scenarios", {}).get(name)
+        if not baseline:
+            continue
+        for metric, higher_is_better in CHECKED_METRICS.items():
+            expected = baseline[metric]
+            change = (result[metric] - expected) / expected if expected else 0.0
+            if (-change if higher_is_better else change) > tolerance:
+                failures.append(f"{name}: {metric} {result[metric]} vs baseline {expected} ({change:+.0%})")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS), help="scenarios to run, all by default")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario, the median is kept")
+    parser.add_argument("--tolerance", type=float, help=f"allowed regression, {TOLERANCE} by default or the baselines' own")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baselines")
+    parser.add_argument("--data-dir", help="where to keep the generated datasets between runs")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        try:
+            print(json.dumps(run_scenario(args.child, args.data_dir)))
+        except ScenarioFailed as err:
+            print(err, file=sys.stderr)
+            return 1
+        return 0
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = args.data_dir or temp_dir
+        results, failed = {}, []
+        for name in args.scenario or SCENARIOS:
+            try:
+                results[name] = run_isolated(name, data_dir, args.repeat)
+            except ScenarioFailed as err:
+                failed.append(name)
+                print(f"{name:>22}: FAILED {err}", flush=True)
+                continue
+            print(f"{name:>22}: " + ", ".join(f"{metric}={value}" for metric, value in results[name].items()), flush=True)
+    if failed:
+        return 1
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES, encoding="utf-8") as baselines_file:
+            baselines = json.load(baselines_file)
+
+    if args.update:
+        baselines.setdefault("tolerance", TOLERANCE)
+        baselines.setdefault("scenarios", {}).update(results)
+        with open(BASELINES, "w", encoding="utf-8") as baselines_file:
+            json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+            baselines_file.write("\n")
+        print(f"Stored baselines in {BASELINES}")
+        return 0
+
+    tolerance = args.tolerance if args.tolerance is not None else baselines.get("tolerance", TOLERANCE)
+    failures = check(results, baselines, tolerance)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Per-record overhead of the incremental sync loop, with and without a SyncPlan.
+
+Runs the catalog lookups the loop used to make for every record against the
+local variables it now reads, then times a full `Messages.sync` over
+in-memory records with output discarded.
+
+    python benchmarks/bench_sync_plan.py [records]
+"""
+import sys
+import timeit
+from unittest.mock import MagicMock, patch
+
+from singer import Transformer
+
+from tap_mailjet.plan import SyncPlan
+from tap_mailjet.streams.messages import Messages
+
+
+def get_stream() -> Messages:
+    client = MagicMock()
+    client.config = {"start_date": "2025-01-01T00:00:00Z", "compiled_transform": True}
+    catalog = MagicMock()
+    catalog.schema.to_dict.return_value = {
+        "type": "object",
+        "properties": {"ID": {"type": "integer"}, "ArrivedAt": {"type": "string", "format": "date-time"}}
+    }
+    catalog.metadata = [
+        {"breadcrumb": [], "metadata": {"selected": True}},
+        {"breadcrumb": ["properties", "ID"], "metadata": {"inclusion": "automatic"}},
+        {"breadcrumb": ["properties", "ArrivedAt"], "metadata": {"inclusion": "automatic"}},
+    ]
+    return Messages(client=client, catalog=catalog)
+
+
+def per_record_lookups(stream: Messages, count: int) -> None:
+    for _ in range(count):
+        if not stream.replication_keys:
+            raise ValueError
+        stream.replication_keys[0]
+        stream.is_selected()
+        for _ in stream.child_to_sync:
+            pass
+
+
+def planned_lookups(stream: Messages, count: int) -> None:
+    plan = SyncPlan(stream)
+    selected = plan.selected
+    replication_key = plan.replication_key
+    children = plan.children
+    for _ in range(count):
+        if replication_key is None:
+            raise ValueError
+        if selected:
+            pass
+        for _ in children:
+            pass
+
+
+def sync(count: int) -> None:
+    stream = get_stream()
+    records = [{"ID": i, "ArrivedAt": f"2025-02-01T00:00:{i % 60:02d}Z"} for i in range(count)]
+    stream.get_records = MagicMock(return_value=iter(records))
+    with patch("tap_mailjet.streams.abstracts.write_record"), patch("tap_mailjet.checkpoint.write_state"):
+        stream.sync({}, Transformer())
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    stream = get_stream()
+
+    for name, func in (("per record lookups", per_record_lookups), ("sync plan", planned_lookups)):
+        seconds = min(timeit.repeat(lambda: func(stream, count), number=1, repeat=5))
+        print(f"{name:>20}: {seconds / count * 1e9:8.1f} ns/record")
+
+    seconds = min(timeit.repeat(lambda: sync(count), number=1, repeat=3))
+    print(f"{'Messages.sync':>20}: {seconds / count * 1e6:8.2f} us/record ({count / seconds:,.0f} records/s)")
+
+
+if __name__ == "__main__":
+    main()
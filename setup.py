@@ -16,6 +16,17 @@ setup(name="tap-mailjet",
         "backoff==2.2.1",
         "parameterized"
       ],
+      extras_require={
+          "async": [
+              "aiohttp==3.14.5"
+          ],
+          "orjson": [
+              "orjson==3.8.3"
+          ],
+          "zstd": [
+              "zstandard==0.23.0"
+          ]
+      },
       entry_points="""
           [console_scripts]
           tap-mailjet=tap_mailjet:main
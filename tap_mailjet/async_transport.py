@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import backoff
+import requests
+from requests.structures import CaseInsensitiveDict
+from singer import metrics
+
+from tap_mailjet.client import MAX_TRIES, raise_for_error, retry_waits
+from tap_mailjet.exceptions import MailjetBackoffError
+from tap_mailjet.rate_limiter import RateLimiter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+BACKOFF_EXCEPTIONS = (
+    ConnectionResetError,
+    asyncio.TimeoutError,
+    MailjetBackoffError
+)
+if aiohttp is not None:
+    BACKOFF_EXCEPTIONS += (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
+
+def build_response(status: int, headers: Mapping[str, str], content: bytes, url: str) -> requests.Response:
+    """
+    Wrap a raw HTTP result in a requests.Response so the synchronous error
+    mapping and response parsing can be reused unchanged.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.url = url
+    response.encoding = "utf-8"
+    return response
+
+
+class AsyncTransport:
+    """
+    Multiplexes Mailjet requests on a single asyncio event loop.
+    ~~~
+    The loop runs in a daemon thread, so synchronous callers submit requests
+    from any thread and either wait on them (`request`) or collect the
+    returned futures (`submit`). At most `concurrency` requests are in flight.
+    """
+
+    def __init__(self, concurrency: int, rate_limiter: RateLimiter) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "async_transport requires aiohttp, install it with `pip install tap-mailjet[async]`"
+            )
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.loop = asyncio.new_event_loop()
+        self._session = None
+        self._semaphore = None
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="mailjet-async-transport", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, method: str, endpoint: str, **kwargs) -> Future:
+        """Schedule a request on the event loop and return its future."""
+        return asyncio.run_coroutine_threadsafe(self.make_request(method, endpoint, **kwargs), self.loop)
+
+    def request(self, method: str, endpoint: str, **kwargs) -> Optional[Mapping[Any, Any]]:
+        """Schedule a request on the event loop and wait for its result."""
+        return self.submit(method, endpoint, **kwargs).result()
+
+    def close(self) -> None:
+        """Close the HTTP session and stop the event loop."""
+        if self.loop.is_closed():
+            return
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    @backoff.on_exception(
+        wait_gen=retry_waits,
+        exception=BACKOFF_EXCEPTIONS,
+        max_tries=MAX_TRIES,
+    )
+    async def make_request(
+        self, method: str, endpoint: str, **kwargs
+    ) -> Optional[Mapping[Any, Any]]:
+        """Performs HTTP Operations."""
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported method: {method}")
+        if method == "GET":
+            kwargs.pop("data", None)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            with metrics.http_request_timer(endpoint):
+                response = await self._send(method, endpoint, **kwargs)
+                self.rate_limiter.update(response.status_code, response.headers)
+                raise_for_error(response)
+
+        return response.json()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        timeout: Optional[float] = None,
+        auth: Optional[Tuple[str, str]] = None
+    ) -> requests.Response:
+        """Send one request with aiohttp and read the full body."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        async with self._session.request(
+            method,
+            endpoint,
+            params=params,
+            headers=headers,
+            data=data,
+            auth=aiohttp.BasicAuth(*auth) if auth else None,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            content = await resp.read()
+            return build_response(resp.status, resp.headers, content, str(resp.url))
@@ -0,0 +1,139 @@
+import gzip
+import os
+import uuid
+from typing import Any, Dict, List, Optional
+
+from tap_mailjet.helpers import encode_json_line, get_config_number
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BATCH_MAX_ROWS = 100000
+BATCH_MAX_BYTES = 100 * 1024 * 1024
+
+FILE_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class BatchMessage:
+    """A Singer BATCH message pointing the target at finished record files."""
+
+    def __init__(self, stream: str, encoding: Dict, manifest: List[str]) -> None:
+        self.stream = stream
+        self.encoding = encoding
+        self.manifest = manifest
+
+    def asdict(self) -> Dict:
+        return {
+            "type": "BATCH",
+            "stream": self.stream,
+            "encoding": self.encoding,
+            "manifest": self.manifest,
+        }
+
+
+class BatchFileWriter:
+    """
+    Writes one stream's records to compressed JSONL files.
+    ~~~
+    A file is closed once it holds `max_rows` records or `max_bytes` of
+    uncompressed JSON, and every closed file is returned as a BATCH message
+    for the emitter to write. Open files are finished before each STATE
+    message, so a bookmark only ever covers records in announced files.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        directory: str,
+        compression: str = "gzip",
+        max_rows: int = BATCH_MAX_ROWS,
+        max_bytes: int = BATCH_MAX_BYTES,
+    ) -> None:
+        self.stream_name = stream_name
+        self.directory = directory
+        self.compression = compression
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.prefix = f"{stream_name}-{uuid.uuid4().hex[:12]}"
+        self.file_count = 0
+        self.file = None
+        self.path = None
+        self.rows = 0
+        self.size = 0
+
+    def open(self) -> None:
+        """Start a new batch file."""
+        self.file_count += 1
+        self.path = os.path.join(
+            self.directory, f"{self.prefix}-{self.file_count:05d}.jsonl{FILE_EXTENSIONS[self.compression]}"
+        )
+        if self.compression == "zstd":
+            self.file = zstandard.ZstdCompressor().stream_writer(open(self.path, "wb"), closefd=True)
+        else:
+            self.file = gzip.open(self.path, "wb")
+        self.rows = 0
+        self.size = 0
+
+    def write(self, record: Dict) -> Optional[BatchMessage]:
+        """Append a record, returning a BATCH message when the file is rotated."""
+        if self.file is None:
+            self.open()
+        line = encode_json_line(record)
+        self.file.write(line)
+        self.rows += 1
+        self.size += len(line)
+        if self.rows >= self.max_rows or self.size >= self.max_bytes:
+            return self.finish()
+        return None
+
+    def finish(self) -> Optional[BatchMessage]:
+        """Close the open file, returning its BATCH message."""
+        if self.file is None:
+            return None
+        self.file.close()
+        self.file = None
+        return BatchMessage(
+            self.stream_name,
+            {"format": "jsonl", "compression": self.compression},
+            [f"file://{os.path.abspath(self.path)}"]
+        )
+
+
+class BatchOutput:
+    """Batch settings from the config, and a file writer per stream."""
+
+    def __init__(self, config: Dict[str, Any], directory: str) -> None:
+        self.directory = directory
+        self.compression = config.get("batch_compression") or "gzip"
+        self.max_rows = get_config_number(config, "batch_max_rows", BATCH_MAX_ROWS)
+        self.max_bytes = get_config_number(config, "batch_max_bytes", BATCH_MAX_BYTES)
+        streams = config.get("batch_streams") or []
+        if isinstance(streams, str):
+            streams = [name.strip() for name in streams.split(",") if name.strip()]
+        self.streams = set(streams)
+        self.writers = {}
+        if self.compression not in FILE_EXTENSIONS:
+            raise ValueError(f"Unsupported batch compression: {self.compression!r}")
+        if self.compression == "zstd" and zstandard is None:
+            raise ValueError("batch_compression 'zstd' requires the zstandard package")
+        os.makedirs(directory, exist_ok=True)
+
+    def handles(self, stream_name: str) -> bool:
+        """Whether records of this stream go to batch files."""
+        return not self.streams or stream_name in self.streams
+
+    def write(self, stream_name: str, record: Dict) -> Optional[BatchMessage]:
+        """Write a record to the stream's current batch file."""
+        writer = self.writers.get(stream_name)
+        if writer is None:
+            writer = self.writers[stream_name] = BatchFileWriter(
+                stream_name, self.directory, self.compression, self.max_rows, self.max_bytes
+            )
+        return writer.write(record)
+
+    def finish(self) -> List[BatchMessage]:
+        """Close every open batch file, returning their BATCH messages."""
+        messages = [writer.finish() for writer in self.writers.values()]
+        return [message for message in messages if message]
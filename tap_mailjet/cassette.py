@@ -0,0 +1,180 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from singer import get_logger
+
+from tap_mailjet.exceptions import MailjetCassetteMissError
+from tap_mailjet.helpers import format_datetime, parse_datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOGGER = get_logger()
+MODES = ("record", "replay")
+INDEX_FILE = "index.jsonl"
+CLOCK_FILE = "clock.json"
+SEGMENT_BYTES = 1024 * 1024 * 1024
+CHUNK_SIZE = 65536
+
+def request_key(method: str, endpoint: str, params: Optional[Mapping] = None, body: Optional[Mapping] = None) -> str:
+    """
+    Identify a request by its method, URL path, query parameters and body.
+    The host is left out, so a capture replays whatever `base_url` it was made with.
+    """
+    url = urlsplit(endpoint)
+    request = [method.upper(), url.path.rstrip("/"), url.query, {str(k): str(v) for k, v in (params or {}).items()}]
+    if body:
+        request.append(body)
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+
+def decode(page: memoryview) -> Any:
+    # orjson is a C extension pylint cannot inspect
+    return orjson.loads(page) if orjson is not None else json.loads(bytes(page))  # pylint: disable=no-member
+
+
+class Cassette:
+    """
+    Append-only store of raw response pages.
+    ~~~
+    Pages are appended to segment files of at most `segment_bytes`, and
+    `index.jsonl` maps each request key to the segment, offset and length of
+    its page. A page is written before its index line, so an interrupted
+    capture still replays every page it indexed. When a request was recorded
+    more than once, the last page wins.
+
+    Replayed pages are sliced from memory-mapped segments, so a replay only
+    reads the pages it serves and never holds the capture in memory.
+    `recorded_at` is the time the recording started, kept in `clock.json`.
+    """
+
+    def __init__(self, directory: str, mode: str, segment_bytes: int = SEGMENT_BYTES) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode!r}")
+        self.directory = directory
+        self.mode = mode
+        self.segment_bytes = segment_bytes
+        self.index: Dict[str, Tuple[int, int, int]] = {}
+        self.segments: Dict[int, mmap.mmap] = {}
+        self.lock = threading.Lock()
+        self.segment = None
+        self.segment_number = 0
+        self.index_file = None
+
+        if mode == "replay":
+            self.load_index()
+            with open(os.path.join(directory, CLOCK_FILE), encoding="utf-8") as clock_file:
+                self.recorded_at = parse_datetime(json.load(clock_file)["recorded_at"])
+            LOGGER.info(
+                f"Replaying {len(self.index)} pages recorded at {format_datetime(self.recorded_at)} from {directory}"
+            )
+        else:
+            os.makedirs(directory, exist_ok=True)
+            numbers = [int(name[8:13]) for name in os.listdir(directory) if name.startswith("segment-")]
+            self.segment_number = max(numbers, default=0)
+            self.segment = open(self.segment_path(self.segment_number), "ab")
+            self.index_file = open(os.path.join(directory, INDEX_FILE), "a", encoding="utf-8")
+            self.recorded_at = datetime.now(timezone.utc)
+            with open(os.path.join(directory, CLOCK_FILE), "w", encoding="utf-8") as clock_file:
+                json.dump({"recorded_at": format_datetime(self.recorded_at)}, clock_file)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> Optional["Cassette"]:
+        """The cassette set up by `cassette_mode` and `cassette_dir`, if any."""
+        mode = config.get("cassette_mode")
+        if not mode:
+            return None
+        directory = config.get("cassette_dir")
+        if not directory:
+            raise ValueError("cassette_mode requires cassette_dir")
+        return cls(directory, mode)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"segment-{number:05d}.bin")
+
+    def load_index(self) -> None:
+        """Read the index, ignoring a last line cut short by an interrupted capture."""
+        path = os.path.join(self.directory, INDEX_FILE)
+        if not os.path.exists(path):
+            raise ValueError(f"No cassette index found in {self.directory}")
+        with open(path, encoding="utf-8") as index_file:
+            for line in index_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                self.index[entry["key"]] = (entry["segment"], entry["offset"], entry["length"])
+
+    def record(self, key: str, page: bytes) -> None:
+        """Append a page and index it under `key`."""
+        with self.lock:
+            offset = self.segment.tell()
+            if offset and offset + len(page) > self.segment_bytes:
+                self.segment.close()
+                self.segment_number += 1
+                self.segment = open(self.segment_path(self.segment_number), "ab")
+                offset = 0
+            self.segment.write(page)
+            self.segment.flush()
+            entry = {"key": key, "segment": self.segment_number, "offset": offset, "length": len(page)}
+            self.index_file.write(json.dumps(entry) + "\n")
+            self.index_file.flush()
+
+    def record_chunks(self, key: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass a streamed body through, recording it once it has been read to the end."""
+        page = []
+        for chunk in chunks:
+            page.append(chunk)
+            yield chunk
+        self.record(key, b"".join(page))
+
+    def get_view(self, key: str) -> memoryview:
+        """The recorded page of `key`, without copying it."""
+        try:
+            number, offset, length = self.index[key]
+        except KeyError:
+            raise MailjetCassetteMissError(f"No page recorded for request {key} in {self.directory}") from None
+        segment = self.segments.get(number)
+        if segment is None:
+            with self.lock:
+                segment = self.segments.get(number)
+                if segment is None:
+                    with open(self.segment_path(number), "rb") as segment_file:
+                        segment = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    self.segments[number] = segment
+        return memoryview(segment)[offset:offset + length]
+
+    def get(self, key: str) -> Any:
+        """The decoded page of `key`."""
+        return decode(self.get_view(key))
+
+    def iter_chunks(self, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """The page of `key` in chunks, for the streaming decoder."""
+        view = self.get_view(key)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+
+    def close(self) -> None:
+        if self.segment:
+            self.segment.close()
+            self.index_file.close()
+            self.segment = self.index_file = None
+        # Views handed out by get_view may still be alive, the maps are then left to the GC
+        segments, self.segments = self.segments, {}
+        for segment in segments.values():
+            try:
+                segment.close()
+            except BufferError:
+                pass
@@ -0,0 +1,57 @@
+import time
+from typing import Any, Dict, Mapping
+
+from tap_mailjet.emitter import write_state
+from tap_mailjet.helpers import get_config_number
+
+CHECKPOINT_RECORDS = 10000
+CHECKPOINT_SECONDS = 60.0
+
+
+class Checkpointer:
+    """
+    Decides when a stream emits STATE while it syncs.
+    ~~~
+    A checkpoint is due once `records` records have been synced or `seconds`
+    have passed since the last one, whichever comes first. STATE is only
+    written when the bookmark has moved since the previous checkpoint.
+    """
+
+    def __init__(self, records: int = CHECKPOINT_RECORDS, seconds: float = CHECKPOINT_SECONDS) -> None:
+        self.records = records
+        self.seconds = seconds
+        self.pending = 0
+        self.last_time = time.monotonic()
+        self.last_marker = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "Checkpointer":
+        return cls(
+            get_config_number(config, "checkpoint_records", CHECKPOINT_RECORDS),
+            get_config_number(config, "checkpoint_seconds", CHECKPOINT_SECONDS, cast=float)
+        )
+
+    def count(self, records: int = 1) -> None:
+        """Add synced records."""
+        self.pending += records
+
+    def due(self) -> bool:
+        """Whether enough records or time have gone by since the last checkpoint."""
+        if not self.pending:
+            return False
+        return self.pending >= self.records or time.monotonic() - self.last_time >= self.seconds
+
+    def tick(self) -> bool:
+        """Count one record and return whether a checkpoint is due."""
+        self.pending += 1
+        return self.due()
+
+    def write(self, state: Dict, marker: Any) -> bool:
+        """Emit STATE if `marker` (the bookmark) moved since the last checkpoint."""
+        self.pending = 0
+        self.last_time = time.monotonic()
+        if marker == self.last_marker:
+            return False
+        self.last_marker = marker
+        write_state(state)
+        return True
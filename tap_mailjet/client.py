@@ -1,15 +1,38 @@
-from typing import Any, Dict, Mapping, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Generator, Iterable, Iterator, Mapping, Optional, Tuple
 
 import backoff
 import requests
 from requests import session
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
 from requests.exceptions import Timeout, ConnectionError, ChunkedEncodingError
 from singer import get_logger, metrics
 
-from tap_mailjet.exceptions import ERROR_CODE_EXCEPTION_MAPPING, MailjetError, MailjetBackoffError
+from tap_mailjet import profiling
+from tap_mailjet.cassette import Cassette, decode, request_key
+from tap_mailjet.exceptions import (
+    ERROR_CODE_EXCEPTION_MAPPING,
+    MailjetError,
+    MailjetBackoffError,
+    MailjetRateLimitError,
+    MailjetStreamInterruptedError
+)
+from tap_mailjet.helpers import get_config_flag, get_config_number, ordered_results
+from tap_mailjet.json_stream import JSONArrayReader
+from tap_mailjet.rate_limiter import RateLimiter
+from tap_mailjet.response_cache import ResponseCache
 
 LOGGER = get_logger()
+BASE_URL = "https://api.mailjet.com/v3/REST"
 REQUEST_TIMEOUT = 300
+ASYNC_CONCURRENCY = 10
+STREAM_CHUNK_SIZE = 65536
+# Retry policy of failed requests, also applied to streamed pages cut short
+MAX_TRIES = 5
+BACKOFF_FACTOR = 2
+BODY_ERRORS = (ConnectionResetError, ConnectionError, ChunkedEncodingError, Timeout)
 
 def raise_for_error(response: requests.Response) -> None:
     """Raises the associated response exception. Takes in a response object,
@@ -18,11 +41,12 @@ def raise_for_error(response: requests.Response) -> None:
 
     :param resp: requests.Response object
     """
-    try:
-        response_json = response.json()
-    except Exception:
-        response_json = {}
-    if response.status_code not in [200, 201, 204]:
+    if response.status_code not in [200, 201, 204, 304]:
+        # Only error bodies are read here, successful (possibly streamed) bodies are left to the caller
+        try:
+            response_json = response.json()
+        except Exception:
+            response_json = {}
         if response_json.get("error"):
             message = f"HTTP-error-code: {response.status_code}, Error: {response_json.get('error')}"
         else:
@@ -41,6 +65,29 @@ def raise_for_error(response: requests.Response) -> None:
 
         raise exc(message, response) from None
 
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    """
+    Rate limit errors are retried without exponential waits, the shared
+    RateLimiter already holds requests until Mailjet accepts them again.
+    """
+    return isinstance(exc, MailjetRateLimitError)
+
+
+def retry_waits(factor: float = BACKOFF_FACTOR) -> Generator[float, Exception, None]:
+    """
+    Backoff wait generator sharing one try budget between all retryable
+    errors: rate limit errors are retried at once, every other error after
+    an exponential wait.
+    """
+    exponential = backoff.expo(factor=factor)
+    next(exponential)
+    error = yield
+    for wait in exponential:
+        while is_rate_limit_error(error):
+            error = yield 0
+        error = yield wait
+
 class Client:
     """
     A Wrapper class.
@@ -54,16 +101,44 @@ class Client:
     def __init__(self, config: Mapping[str, Any]) -> None:
         self.config = config
         self._session = session()
-        self.base_url = "https://api.mailjet.com/v3/REST"
-        config_request_timeout = config.get("request_timeout")
+        self.base_url = (config.get("base_url") or BASE_URL).rstrip("/")
         # Treat None, empty string, or 0 as default timeout
-        if config_request_timeout is None or config_request_timeout == "" or config_request_timeout == 0:
-            self.request_timeout = REQUEST_TIMEOUT
-        else:
-            try:
-                self.request_timeout = float(config_request_timeout)
-            except (TypeError, ValueError):
-                raise ValueError(f"Invalid value for request_timeout: {config_request_timeout!r}")
+        self.request_timeout = get_config_number(config, "request_timeout", REQUEST_TIMEOUT, cast=float)
+
+        # Keep one pooled connection per concurrent page request of every concurrent stream
+        pool_size = (
+            get_config_number(config, "page_concurrency", 1)
+            * get_config_number(config, "stream_concurrency", 1)
+        )
+        if pool_size > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
+        self.rate_limiter = RateLimiter(
+            get_config_number(config, "max_requests_per_second", None, cast=float)
+        )
+
+        # Replays are served from disk and recordings need the raw bodies, so a cassette uses the requests session
+        self.cassette = Cassette.from_config(config)
+
+        self._async_transport = None
+        if self.cassette and get_config_flag(config, "async_transport"):
+            LOGGER.warning("async_transport is ignored while a cassette is recorded or replayed")
+        elif get_config_flag(config, "async_transport"):
+            # Imported here so aiohttp is only needed when the option is enabled
+            from tap_mailjet.async_transport import AsyncTransport
+            self._async_transport = AsyncTransport(
+                get_config_number(config, "async_concurrency", ASYNC_CONCURRENCY),
+                self.rate_limiter
+            )
+
+        # Cached pages are stored raw, which neither a cassette nor the async transport hands over
+        self.response_cache = ResponseCache.from_config(config)
+        if self.response_cache and (self.cassette or self._async_transport):
+            LOGGER.warning("response_cache_dir is ignored with a cassette or async_transport")
+            self.response_cache.close()
+            self.response_cache = None
 
     def __enter__(self):
         self.check_api_credentials()
@@ -71,6 +146,21 @@ class Client:
 
     def __exit__(self, exception_type, exception_value, traceback):
         self._session.close()
+        if self._async_transport:
+            self._async_transport.close()
+        if self.cassette:
+            self.cassette.close()
+        if self.response_cache:
+            self.response_cache.close()
+
+    def now(self) -> datetime:
+        """
+        The time syncs run up to. With a cassette it is the time the recording
+        started, so a replay sends the same ToTS values as its recording.
+        """
+        if self.cassette:
+            return self.cassette.recorded_at
+        return datetime.now(timezone.utc)
 
     def check_api_credentials(self) -> None:
         pass
@@ -87,47 +177,183 @@ class Client:
         """
         Sends an HTTP request to the specified API endpoint.
         """
+        method, endpoint, kwargs = self._prepare_request(method, endpoint, params, headers, body, path)
+        if self.cassette and self.cassette.replaying:
+            with profiling.stage(endpoint, "decode"):
+                return self.cassette.get(self.get_request_key(method, endpoint, kwargs))
+        if self._async_transport:
+            return self._async_transport.request(method, endpoint, **kwargs)
+        ttl = self.get_cache_ttl(method, endpoint)
+        if ttl:
+            return self.get_cached_page(method, endpoint, ttl, kwargs)
+        return self.__make_request(method, endpoint, **kwargs)
+
+    def get_cache_ttl(self, method: str, endpoint: str) -> Optional[float]:
+        """The response cache TTL of a request, None when it is not cached."""
+        if self.response_cache and method.upper() == "GET":
+            return self.response_cache.get_ttl(endpoint)
+        return None
+
+    def get_cached_page(self, method: str, endpoint: str, ttl: float, kwargs: Dict[str, Any]) -> Any:
+        """
+        Serve a page from the response cache while its stream's scan is
+        younger than `ttl`. A page of an older scan is requested again with
+        its validators, and served from the cache if the API answers 304.
+        """
+        cache = self.response_cache
+        key = self.get_request_key(method, endpoint, kwargs)
+        scan = cache.get_scan(endpoint, ttl)
+        cached = cache.get(key)
+        if cached and cached.is_fresh(scan):
+            cache.count("hits")
+            with profiling.stage(endpoint, "decode"):
+                return decode(cached.body)
+
+        if cached:
+            kwargs = {**kwargs, "headers": {**kwargs["headers"], **cached.get_conditional_headers()}}
+        response = self.__make_request(method, endpoint, stream=True, **kwargs)
+        try:
+            if cached and response.status_code == 304:
+                cache.count("revalidated")
+                cache.touch(key, scan)
+                body = cached.body
+            else:
+                cache.count("misses")
+                body = response.content
+                cache.put(key, body, scan, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        finally:
+            response.close()
+        with profiling.stage(endpoint, "decode"):
+            return decode(body)
+
+    @staticmethod
+    def get_request_key(method: str, endpoint: str, kwargs: Mapping[str, Any]) -> str:
+        """The cassette key of a prepared request. GET bodies are never sent, so they are left out."""
+        return request_key(method, endpoint, kwargs.get("params"), None if method.upper() == "GET" else kwargs.get("data"))
+
+    def _prepare_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        path: Optional[str] = None
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Resolve the endpoint and build the keyword arguments shared by both transports.
+        """
         params = params or {}
         headers = headers or {}
         body = body or {}
         endpoint = endpoint or f"{self.base_url}/{path}"
 
         auth = (self.config["api_key"], self.config["secret_key"])
-        
-        return self.__make_request(
-            method, endpoint,
-            headers=headers,
-            params=params,
-            data=body,
-            timeout=self.request_timeout,
-            auth=auth
-        )
+
+        return method, endpoint, {
+            "headers": headers,
+            "params": params,
+            "data": body,
+            "timeout": self.request_timeout,
+            "auth": auth
+        }
+
+    def stream_request(
+        self,
+        method: str,
+        endpoint: str,
+        data_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        path: Optional[str] = None
+    ) -> Iterator[Any]:
+        """
+        Sends an HTTP request and yields the items of the `data_key` array as
+        they are decoded from the response body, without buffering the page.
+        Retries cover the request up to the response headers. A body cut short
+        raises MailjetStreamInterruptedError, so the caller can request the
+        rest of the page. The async transport has no streaming mode and
+        decodes the whole page instead.
+        """
+        # Cached pages are decoded whole, like the pages of the async transport
+        if self._async_transport or self.get_cache_ttl(method, endpoint or f"{self.base_url}/{path}"):
+            yield from self.make_request(method, endpoint, params, headers, body, path).get(data_key, [])
+            return
+
+        method, endpoint, kwargs = self._prepare_request(method, endpoint, params, headers, body, path)
+        if self.cassette and self.cassette.replaying:
+            chunks = self.cassette.iter_chunks(self.get_request_key(method, endpoint, kwargs), STREAM_CHUNK_SIZE)
+            yield from profiling.timed(endpoint, "decode", JSONArrayReader(chunks, data_key))
+            return
+
+        response = self.__make_request(method, endpoint, stream=True, **kwargs)
+        try:
+            chunks = response.iter_content(STREAM_CHUNK_SIZE)
+            if self.cassette:
+                chunks = self.cassette.record_chunks(self.get_request_key(method, endpoint, kwargs), chunks)
+            # The body is read while it is decoded, so both are timed as decode
+            yield from profiling.timed(endpoint, "decode", JSONArrayReader(chunks, data_key))
+            if self.cassette:
+                # Read what follows the array so the whole page is recorded
+                for _ in chunks:
+                    pass
+        except BODY_ERRORS as err:
+            raise MailjetStreamInterruptedError(f"Response body of {endpoint} was cut short: {err}") from err
+        finally:
+            response.close()
+
+    def make_requests(self, request_kwargs: Iterable[Dict[str, Any]], max_workers: int) -> Iterator[Any]:
+        """
+        Sends several requests concurrently and yields the responses in request order.
+        Each item holds the keyword arguments for `make_request`, and at most
+        `max_workers` requests are in flight at any time.
+        """
+        if self._async_transport:
+            def submit(kwargs):
+                method, endpoint, prepared = self._prepare_request(**kwargs)
+                return self._async_transport.submit(method, endpoint, **prepared)
+
+            yield from ordered_results(submit, request_kwargs, max_workers)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from ordered_results(
+                lambda kwargs: executor.submit(self.make_request, **kwargs),
+                request_kwargs,
+                max_workers
+            )
 
     @backoff.on_exception(
-        wait_gen=backoff.expo,
-        exception=(
-            ConnectionResetError,
-            ConnectionError,
-            ChunkedEncodingError,
-            Timeout,
-            MailjetBackoffError
-        ),
-        max_tries=5,
-        factor=2,
+        wait_gen=retry_waits,
+        exception=BODY_ERRORS + (MailjetBackoffError,),
+        max_tries=MAX_TRIES,
     )
     def __make_request(
         self, method: str, endpoint: str, **kwargs
     ) -> Optional[Mapping[Any, Any]]:
-        """Performs HTTP Operations."""
+        """Performs HTTP Operations. Streamed requests return the open response."""
         method = method.upper()
         with metrics.http_request_timer(endpoint):
             if method in ("GET", "POST"):
                 if method == "GET":
                     kwargs.pop("data", None)
+                with profiling.stage(endpoint, "rate_limit"):
+                    self.rate_limiter.acquire()
+                started = time.perf_counter()
                 response = self._session.request(method, endpoint, **kwargs)
+                if profiling.PROFILER:
+                    size = int(response.headers.get("Content-Length") or 0) if kwargs.get("stream") else len(response.content)
+                    profiling.PROFILER.add(endpoint, "http", time.perf_counter() - started, size)
+                self.rate_limiter.update(response.status_code, response.headers)
                 raise_for_error(response)
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
-        return response.json()
+        if kwargs.get("stream"):
+            return response
+        if self.cassette:
+            self.cassette.record(self.get_request_key(method, endpoint, kwargs), response.content)
+        with profiling.stage(endpoint, "decode"):
+            return response.json()
 
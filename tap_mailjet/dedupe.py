@@ -0,0 +1,73 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from tap_mailjet.emitter import write_bookmark
+from tap_mailjet.transform import format_datetime
+
+BOUNDARY_KEYS_LIMIT = 10000
+
+
+class BoundaryKeys:
+    """
+    Primary keys of the records synced at the bookmark instant.
+    ~~~
+    Incremental requests start one second before the bookmark, so every run
+    gets back the rows at the bookmark timestamp again. Their keys are kept
+    in the state next to the bookmark, and those rows are dropped from the
+    next run before they are transformed. When more than `limit` rows share
+    the bookmark timestamp no keys are stored and the rows are re-emitted.
+    """
+
+    def __init__(
+        self,
+        key_properties: List[str],
+        replication_key: str,
+        value: str,
+        saved: Optional[Dict] = None,
+        limit: int = BOUNDARY_KEYS_LIMIT,
+    ) -> None:
+        self.key_properties = key_properties
+        self.replication_key = replication_key
+        self.limit = limit
+        self.value = value
+        self.keys = set()
+        self.overflow = False
+        if isinstance(saved, dict) and saved.get("value") == value and saved.get("keys") is not None:
+            self.keys = {tuple(key) for key in saved["keys"]}
+        # The previous run's instant, fixed while `add` moves `value` forward
+        self.skip_value = value
+        self.skip_keys = frozenset(self.keys)
+
+    def get_key(self, record: Dict) -> Tuple:
+        return tuple(record.get(key) for key in self.key_properties)
+
+    def add(self, value: str, record: Dict) -> None:
+        """Track a synced record whose transformed replication value is `value`."""
+        if value > self.value:
+            self.value = value
+            self.keys = set()
+            self.overflow = False
+        if value == self.value and not self.overflow:
+            self.keys.add(self.get_key(record))
+            if len(self.keys) > self.limit:
+                self.overflow = True
+                self.keys = set()
+
+    def filter(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        """Drop raw records already synced at the bookmark instant by the previous run."""
+        if not self.skip_keys:
+            yield from records
+            return
+        for record in records:
+            if (
+                self.get_key(record) in self.skip_keys
+                and format_datetime(record.get(self.replication_key)) == self.skip_value
+            ):
+                continue
+            yield record
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"value": self.value, "keys": None if self.overflow else [list(key) for key in self.keys]}
+
+    def write(self, state: Dict, stream: str) -> Dict:
+        """Store the keys in the stream's bookmark, next to the replication value."""
+        return write_bookmark(state, stream, "boundary_keys", self.to_state())
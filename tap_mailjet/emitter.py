@@ -0,0 +1,157 @@
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Mapping
+
+import singer
+from singer.messages import RecordMessage
+
+from tap_mailjet import profiling
+from tap_mailjet.batch import BatchOutput
+from tap_mailjet.helpers import encode_json_line, get_config_number
+
+FLUSH_SECONDS = 1.0
+
+# Guards stdout and the shared state dict, so messages from concurrently
+# syncing streams never interleave and STATE never sees a half-written bookmark.
+LOCK = threading.RLock()
+
+
+def encode_message(message: Any) -> bytes:
+    """Encode a singer message as one JSON line."""
+    return encode_json_line(message.asdict())
+
+
+class MessageBuffer:
+    """
+    Collects encoded messages and writes them to stdout in large chunks.
+    ~~~
+    The buffer is flushed once it holds `max_bytes`, when `max_seconds` have
+    passed since the last flush, and always before a STATE message is written,
+    so a target never receives a bookmark ahead of the records it covers.
+    """
+
+    def __init__(self, max_bytes: int, max_seconds: float = FLUSH_SECONDS) -> None:
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.chunks = []
+        self.size = 0
+        self.last_flush = time.monotonic()
+
+    def write(self, message: Any) -> None:
+        """Buffer one message, flushing when a threshold is reached."""
+        line = encode_message(message)
+        self.chunks.append(line)
+        self.size += len(line)
+        if self.size >= self.max_bytes or time.monotonic() - self.last_flush >= self.max_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write everything buffered to stdout."""
+        self.last_flush = time.monotonic()
+        if not self.chunks:
+            return
+        data = b"".join(self.chunks)
+        self.chunks = []
+        self.size = 0
+        stdout = sys.stdout
+        if hasattr(stdout, "buffer"):
+            stdout.flush()
+            stdout.buffer.write(data)
+            stdout.buffer.flush()
+        else:
+            stdout.write(data.decode("utf-8"))
+            stdout.flush()
+
+
+BUFFER = None
+BATCH_OUTPUT = None
+
+
+def configure(config: Mapping[str, Any]) -> None:
+    """
+    Enable output buffering when `output_buffer_bytes` is set, and BATCH
+    output when `batch_output_dir` is set.
+    """
+    global BUFFER, BATCH_OUTPUT
+    with LOCK:
+        flush()
+        max_bytes = get_config_number(config, "output_buffer_bytes", 0)
+        BUFFER = MessageBuffer(
+            max_bytes,
+            get_config_number(config, "output_flush_seconds", FLUSH_SECONDS, cast=float)
+        ) if max_bytes > 0 else None
+        batch_dir = config.get("batch_output_dir")
+        BATCH_OUTPUT = BatchOutput(config, batch_dir) if batch_dir else None
+
+
+def write_message(message: Any) -> None:
+    """Write any singer message, through the buffer when enabled."""
+    if BUFFER:
+        BUFFER.write(message)
+    else:
+        singer.write_message(message)
+
+
+def flush() -> None:
+    """Finish open batch files and write any buffered messages."""
+    with LOCK:
+        if BATCH_OUTPUT:
+            for message in BATCH_OUTPUT.finish():
+                write_message(message)
+        if BUFFER:
+            BUFFER.flush()
+
+
+def write_record(stream_name: str, record: Dict) -> None:
+    """Write a RECORD message, or add the record to the stream's batch file."""
+    profiler = profiling.PROFILER
+    if profiler:
+        started = time.perf_counter()
+    with LOCK:
+        if BATCH_OUTPUT and BATCH_OUTPUT.handles(stream_name):
+            message = BATCH_OUTPUT.write(stream_name, record)
+            if message:
+                write_message(message)
+        elif BUFFER:
+            BUFFER.write(RecordMessage(stream=stream_name, record=record))
+        else:
+            singer.write_record(stream_name, record)
+    if profiler:
+        profiler.add(stream_name, "emit", time.perf_counter() - started)
+
+
+def write_schema(stream_name: str, schema: Dict, key_properties: List) -> None:
+    """Write a SCHEMA message."""
+    with LOCK:
+        if BUFFER:
+            BUFFER.flush()
+        singer.write_schema(stream_name, schema, key_properties)
+
+
+def write_state(state: Dict) -> None:
+    """
+    Write a STATE message, after every message buffered before it and the
+    BATCH messages for every record written so far.
+    """
+    with profiling.stage(None, "state"), LOCK:
+        flush()
+        singer.write_state(state)
+
+
+def write_bookmark(state: Dict, stream: str, key: str, value: Any) -> Dict:
+    """Update a bookmark in the shared state."""
+    with profiling.stage(stream, "bookmark"), LOCK:
+        return singer.write_bookmark(state, stream, key, value)
+
+
+def clear_bookmark(state: Dict, stream: str, keys: Iterable[str]) -> Dict:
+    """Remove bookmark keys from the shared state, and the stream's bookmark once it is empty."""
+    with LOCK:
+        bookmarks = state.get("bookmarks", {})
+        if stream in bookmarks:
+            for key in keys:
+                singer.clear_bookmark(state, stream, key)
+            if not bookmarks[stream]:
+                del bookmarks[stream]
+        return state
@@ -44,6 +44,14 @@ class MailjetInternalServerError(MailjetBackoffError):
     """class representing 500 status code."""
     pass
 
+class MailjetStreamInterruptedError(MailjetError):
+    """class representing a streamed response body cut short while it was read."""
+    pass
+
+class MailjetCassetteMissError(MailjetError):
+    """class representing a request missing from the replayed cassette."""
+    pass
+
 ERROR_CODE_EXCEPTION_MAPPING = {
     400: {
         "raise_exception": MailjetBadRequestError,
@@ -0,0 +1,82 @@
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+import simplejson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+API_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 bookmark or API timestamp into an aware datetime."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a UTC datetime the way Mailjet expects FromTS/ToTS values."""
+    return value.astimezone(timezone.utc).strftime(API_DATETIME_FORMAT)
+
+
+def encode_json_line(value: Any) -> bytes:
+    """
+    Encode a value as one newline-terminated JSON line, with orjson when it is
+    installed. Values orjson cannot encode (e.g. Decimal) use simplejson, as singer does.
+    """
+    if orjson is not None:
+        try:
+            # orjson is a C extension pylint cannot inspect
+            return orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE)  # pylint: disable=no-member
+        except TypeError:
+            pass
+    return (simplejson.dumps(value, use_decimal=True) + "\n").encode("utf-8")
+
+
+def get_config_number(config: Mapping[str, Any], key: str, default: Any, cast: Callable = int) -> Any:
+    """
+    Read an optional numeric value from the config.
+    None, empty string, or 0 are treated as unset and return the default.
+    """
+    value = config.get(key)
+    if value is None or value == "" or value == 0:
+        return default
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid value for {key}: {value!r}")
+
+
+def get_config_flag(config: Mapping[str, Any], key: str) -> bool:
+    """
+    Read an optional boolean from the config, accepting "true"/"false" strings.
+    """
+    value = config.get(key)
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+def ordered_results(submit: Callable[[Any], Future], items: Iterable, max_in_flight: int) -> Iterator:
+    """
+    Submit every item with `submit` while keeping at most `max_in_flight`
+    futures pending, and yield their results in submission order.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(submit(item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Drop queued work if the consumer stops early or a request failed
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,107 @@
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+# Bytes of consumed text kept in the buffer before it is compacted
+COMPACT_THRESHOLD = 65536
+
+
+class JSONArrayReader:
+    """
+    Incrementally decodes a JSON object read in chunks.
+    ~~~
+    The items of the array stored under `array_key` are yielded one at a
+    time as soon as they are complete, so only the current item and the
+    unread part of the last chunk are held in memory, whatever the size of
+    the array. Every other top-level field is decoded into `fields`.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], array_key: str) -> None:
+        self.chunks = iter(chunks)
+        self.array_key = array_key
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.fields: Dict[str, Any] = {}
+
+    def read_more(self) -> bool:
+        """Append the next chunk to the buffer, returning False at the end of the input."""
+        if self.eof:
+            return False
+        if self.pos > COMPACT_THRESHOLD:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        for chunk in self.chunks:
+            text = self.text_decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+        self.buffer += self.text_decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def skip_whitespace(self) -> None:
+        while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+            self.pos += 1
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        self.skip_whitespace()
+        while self.pos >= len(self.buffer) and self.read_more():
+            self.skip_whitespace()
+        if self.pos >= len(self.buffer):
+            raise json.JSONDecodeError("Unexpected end of data", self.buffer, self.pos)
+        return self.buffer[self.pos]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of `chars`."""
+        char = self.peek()
+        if char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input until it is whole."""
+        self.peek()
+        value, end = None, self.pos
+        is_complete = False
+        while not is_complete:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.read_more():
+                    raise
+                continue
+            # A number ending with the buffer may continue in the next chunk
+            is_complete = end < len(self.buffer) or not self.read_more()
+        self.pos = end
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        has_more_fields = True
+        while has_more_fields:
+            key = self.decode_value()
+            self.expect(":")
+            if key == self.array_key and self.peek() == "[":
+                yield from self.iter_array()
+            else:
+                self.fields[key] = self.decode_value()
+            has_more_fields = self.expect(",}") == ","
+
+    def iter_array(self) -> Iterator[Any]:
+        """Yield the items of the array starting at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        has_more_items = True
+        while has_more_items:
+            yield self.decode_value()
+            has_more_items = self.expect(",]") == ","
@@ -0,0 +1,70 @@
+import threading
+
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
+
+from tap_mailjet.exceptions import MailjetBackoffError, MailjetStreamInterruptedError
+
+MIN_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 1000
+TARGET_PAGE_SECONDS = 5.0
+
+
+def is_page_size_error(exc: Exception) -> bool:
+    """Timeouts, dropped connections and 5xx responses, which a smaller page may avoid."""
+    if isinstance(exc, (Timeout, ConnectionError, ChunkedEncodingError, MailjetStreamInterruptedError)):
+        return True
+    response = getattr(exc, "response", None)
+    return isinstance(exc, MailjetBackoffError) and response is not None and response.status_code >= 500
+
+
+class PageSizer:
+    """
+    Tunes the `Limit` of a stream's page requests.
+    ~~~
+    Starts from the given size (the largest page Mailjet serves by default)
+    and adjusts it after every full page: pages slower than `target_seconds`
+    shrink in proportion and pages well under it double. A failed page
+    halves the size, which then becomes the ceiling for the rest of the run.
+    The size with the best records per second is kept as `best_size` so the
+    next run can start from it.
+    """
+
+    def __init__(
+        self,
+        size: int = MAX_PAGE_SIZE,
+        min_size: int = MIN_PAGE_SIZE,
+        max_size: int = MAX_PAGE_SIZE,
+        target_seconds: float = TARGET_PAGE_SECONDS,
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.size = self.clamp(size)
+        self.best_size = self.size
+        self.best_throughput = 0.0
+        self.lock = threading.Lock()
+
+    def clamp(self, size: int) -> int:
+        return max(self.min_size, min(self.max_size, int(size)))
+
+    def record(self, page_size: int, record_count: int, seconds: float) -> None:
+        """Adjust the size from the latency of a page of `page_size` records."""
+        if record_count < page_size:
+            # The last page of a result set says nothing about the API's speed
+            return
+        with self.lock:
+            throughput = record_count / max(seconds, 1e-6)
+            if throughput > self.best_throughput:
+                self.best_throughput = throughput
+                self.best_size = page_size
+            if seconds > self.target_seconds:
+                self.size = self.clamp(page_size * self.target_seconds / seconds)
+            elif seconds < self.target_seconds / 2:
+                self.size = self.clamp(page_size * 2)
+
+    def shrink(self) -> None:
+        """Halve the size after a failed page, and never grow back to the failed size."""
+        with self.lock:
+            self.size = self.clamp(self.size // 2)
+            self.max_size = self.size
+            self.best_size = min(self.best_size, self.size)
@@ -0,0 +1,139 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List
+
+from tap_mailjet.helpers import ordered_results
+
+PUT_TIMEOUT = 0.1
+
+
+class FetchFailed:
+    """Carries an exception raised by the fetch stage over to the consumer."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+END_OF_RECORDS = object()
+
+
+class RecordPipeline:
+    """
+    Three stage sync pipeline: fetch -> transform -> emit.
+    ~~~
+    A fetcher thread drains the records iterator (the HTTP side) into a
+    bounded queue of chunks, a worker pool applies the transform to each
+    chunk, and the caller iterates the results in fetch order and emits
+    them from its own thread. The queue depth and the number of chunks
+    being transformed bound memory and give back-pressure to the fetcher.
+    """
+
+    def __init__(self, workers: int, queue_size: int, chunk_size: int) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.chunk_size = chunk_size
+
+    def process(self, records: Iterable, func: Callable[[Any], Any]) -> Iterator:
+        """Yield `func(record)` for every record, in the order records were fetched."""
+        chunks = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        fetcher = threading.Thread(
+            target=self.fetch, args=(records, chunks, stop), name="mailjet-fetcher", daemon=True
+        )
+        fetcher.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for results in ordered_results(
+                    lambda chunk: executor.submit(self.apply, func, chunk),
+                    self.drain(chunks),
+                    self.workers
+                ):
+                    yield from results
+        finally:
+            stop.set()
+            fetcher.join()
+
+    @staticmethod
+    def apply(func: Callable[[Any], Any], chunk: List) -> List:
+        """Transform stage, run on the worker pool."""
+        return [func(record) for record in chunk]
+
+    def fetch(self, records: Iterable, chunks: queue.Queue, stop: threading.Event) -> None:
+        """Fetch stage, run on its own thread until the records run out or the consumer stops."""
+        try:
+            chunk = []
+            for record in records:
+                chunk.append(record)
+                if len(chunk) >= self.chunk_size:
+                    if not self.put(chunks, chunk, stop):
+                        return
+                    chunk = []
+            if chunk and not self.put(chunks, chunk, stop):
+                return
+            self.put(chunks, END_OF_RECORDS, stop)
+        except Exception as err:
+            self.put(chunks, FetchFailed(err), stop)
+
+    @staticmethod
+    def put(chunks: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Block on the bounded queue, giving up once the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def drain(chunks: queue.Queue) -> Iterator[List]:
+        """Read chunks until the fetcher signals the end, re-raising fetch errors."""
+        has_more_chunks = True
+        while has_more_chunks:
+            item = chunks.get()
+            if item is END_OF_RECORDS:
+                has_more_chunks = False
+            elif isinstance(item, FetchFailed):
+                raise item.error
+            else:
+                yield item
+
+
+class OrderedPrefetch(RecordPipeline):
+    """
+    Reads several record iterables ahead of the consumer, in order.
+    ~~~
+    Up to `workers` iterables are drained at once, each by its own thread
+    into its own bounded queue of chunks, and the caller reads them back
+    one after the other in their original order. Memory stays bounded by
+    `workers * queue_size * chunk_size` records whatever the size of each
+    iterable. Each yielded iterator must be read to the end before the next.
+    """
+
+    def read_ahead(self, iterables: Iterable[Iterable]) -> Iterator[Iterator]:
+        """Yield an iterator over the records of every iterable, in order."""
+        iterables = iter(iterables)
+        stop = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def start(records: Iterable) -> queue.Queue:
+                chunks = queue.Queue(maxsize=self.queue_size)
+                executor.submit(self.fetch, records, chunks, stop)
+                return chunks
+
+            try:
+                pending = deque(start(records) for records in islice(iterables, self.workers))
+                while pending:
+                    yield self.read(pending.popleft())
+                    records = next(iterables, None)
+                    if records is not None:
+                        pending.append(start(records))
+            finally:
+                stop.set()
+
+    def read(self, chunks: queue.Queue) -> Iterator:
+        for chunk in self.drain(chunks):
+            yield from chunk
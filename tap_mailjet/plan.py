@@ -0,0 +1,31 @@
+from typing import Dict, FrozenSet
+
+
+def get_selected_fields(schema: Dict, mdata: Dict) -> FrozenSet[str]:
+    """Top-level properties kept by singer's filter_data_by_metadata."""
+    selected = set()
+    for field in schema.get("properties", {}):
+        entry = mdata.get(("properties", field), {})
+        if entry.get("inclusion") == "automatic" or not (
+            entry.get("selected") is False or entry.get("inclusion") == "unsupported"
+        ):
+            selected.add(field)
+    return frozenset(selected)
+
+
+class SyncPlan:
+    """
+    The catalog facts a stream's sync loops need, resolved once per sync.
+    ~~~
+    Selection lives in the metadata map and the replication key in a list
+    attribute. The record loops used to look them up for every record; they
+    now read them from the plan, built when the stream starts syncing.
+    """
+
+    def __init__(self, stream) -> None:
+        self.stream_id = stream.tap_stream_id
+        self.selected = bool(stream.is_selected())
+        self.selected_fields = get_selected_fields(stream.schema, stream.metadata)
+        self.replication_key = stream.replication_keys[0] if stream.replication_keys else None
+        self.children = tuple(stream.child_to_sync)
+
@@ -0,0 +1,167 @@
+import cProfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from singer import get_logger
+
+from tap_mailjet.helpers import get_config_flag
+
+LOGGER = get_logger()
+
+STAGES = ("rate_limit", "http", "decode", "transform", "emit", "bookmark", "state")
+TAP = "tap"
+
+
+class StageStats:
+    """Time, calls and bytes spent in one stage."""
+
+    __slots__ = ("seconds", "calls", "bytes")
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.calls = 0
+        self.bytes = 0
+
+
+class Profiler:
+    """
+    Accumulates per-stream stage timings while the tap syncs.
+    ~~~
+    Stages are timed where they happen: the client times rate limiting, the
+    HTTP request and JSON decoding for each endpoint, streams time the
+    transform of every record, and the emitter times records, bookmarks and
+    STATE. Client timings are filed under the stream whose `path` ends the
+    endpoint. Stages that run on worker threads overlap, so their sum can be
+    larger than the stream's wall time.
+    """
+
+    def __init__(self, output: Optional[str] = None) -> None:
+        self.stats: Dict[str, Dict[str, StageStats]] = {}
+        self.lock = threading.Lock()
+        self.keys = {}
+        self.output = output
+        self.cprofile = cProfile.Profile() if output else None
+
+    def get_stream(self, key: Optional[str]) -> str:
+        """The stream a stream name or a request endpoint belongs to."""
+        if key in self.keys:
+            return self.keys[key]
+        # Imported here, the streams import this module
+        from tap_mailjet.streams import STREAMS, get_stream_name
+        if not key:
+            return TAP
+        if key in STREAMS:
+            stream = key
+        else:
+            stream = get_stream_name(key)
+            if stream is None:
+                # Endpoints that are not a stream's path are reported as they are, but not cached
+                return key
+        self.keys[key] = stream
+        return stream
+
+    def add(self, key: Optional[str], stage: str, seconds: float, nbytes: int = 0) -> None:
+        """Add one call of `stage` for the stream or endpoint `key`."""
+        stream = self.get_stream(key)
+        with self.lock:
+            stats = self.stats.setdefault(stream, {}).get(stage)
+            if stats is None:
+                stats = self.stats[stream][stage] = StageStats()
+            stats.seconds += seconds
+            stats.calls += 1
+            stats.bytes += nbytes
+
+    def report(self, stream: str, seconds: float) -> None:
+        """Log the breakdown of a finished stream."""
+        with self.lock:
+            stages = self.stats.pop(stream, {})
+        LOGGER.info(f"Profile of {stream}: {seconds:.3f}s wall time")
+        for stage in sorted(stages, key=lambda name: STAGES.index(name) if name in STAGES else len(STAGES)):
+            stats = stages[stage]
+            share = stats.seconds / seconds * 100 if seconds else 0.0
+            line = f"  {stage:<10} {stats.seconds:10.3f}s {share:6.1f}% {stats.calls:>10} calls"
+            if stats.bytes:
+                line += f" {stats.bytes / 1048576:10.2f} MB"
+            LOGGER.info(line)
+
+    def finish(self) -> None:
+        """Log what no stream reported and write the cProfile dump."""
+        for stream in list(self.stats):
+            self.report(stream, 0.0)
+        if self.cprofile:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.output)
+            LOGGER.info(f"Wrote cProfile stats to {self.output}")
+
+
+PROFILER: Optional[Profiler] = None
+
+
+def configure(config: Mapping[str, Any]) -> None:
+    """Enable profiling when `profile` is set, with a cProfile dump when `profile_output` is set."""
+    global PROFILER
+    output = config.get("profile_output")
+    PROFILER = Profiler(output) if output or get_config_flag(config, "profile") else None
+    if PROFILER and PROFILER.cprofile:
+        PROFILER.cprofile.enable()
+
+
+def finish() -> None:
+    """Stop profiling the sync."""
+    global PROFILER
+    if PROFILER:
+        PROFILER.finish()
+        PROFILER = None
+
+
+@contextmanager
+def stage(key: Optional[str], name: str) -> Iterator[None]:
+    """Time the block as stage `name` of `key`, when profiling is enabled."""
+    profiler = PROFILER
+    if not profiler:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add(key, name, time.perf_counter() - started)
+
+
+def timed(key: Optional[str], name: str, items: Iterable) -> Iterator:
+    """
+    Yield from `items`, timing only the time spent producing them as one
+    call of stage `name` of `key`.
+    """
+    profiler = PROFILER
+    if not profiler:
+        yield from items
+        return
+    seconds = 0.0
+    # None while the consumer holds an item, so only the time spent in `next` counts
+    started = time.perf_counter()
+    try:
+        for item in items:
+            seconds += time.perf_counter() - started
+            started = None
+            yield item
+            started = time.perf_counter()
+    finally:
+        if started is not None:
+            seconds += time.perf_counter() - started
+        profiler.add(key, name, seconds)
+
+
+@contextmanager
+def profile_stream(stream) -> Iterator[None]:
+    """Report the breakdown of a top-level stream and of its children once they have synced."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if PROFILER:
+            seconds = time.perf_counter() - started
+            for name in [stream.tap_stream_id] + [child.tap_stream_id for child in stream.child_to_sync]:
+                PROFILER.report(name, seconds)
@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping, Optional
+
+from singer import get_logger
+
+LOGGER = get_logger()
+
+MIN_RATE = 0.1
+DECREASE_FACTOR = 0.5
+INCREASE_STEP = 0.5
+THROTTLE_DELAY = 1
+MAX_THROTTLE_DELAY = 60
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Return the Retry-After header value in seconds, accepting both the
+    delay-seconds and HTTP-date forms.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_reset(value: Any) -> Optional[float]:
+    """
+    Return the X-RateLimit-Reset header value in seconds from now. Large
+    values are treated as a unix timestamp.
+    """
+    try:
+        reset = float(value)
+    except (TypeError, ValueError):
+        return None
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+class RateLimiter:
+    """
+    Adaptive request pacing shared by every stream and worker of a Client.
+    ~~~
+    Requests are spaced with a token bucket (GCRA). The rate follows AIMD:
+    each successful response raises it a little, each 429 halves it and
+    holds every caller until the server's Retry-After has passed. Without a
+    configured `max_rate` requests are not paced until the first 429.
+    """
+
+    def __init__(self, max_rate: Optional[float] = None, burst: int = 1) -> None:
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+        self._blocked_until = 0.0
+        self._throttle_streak = 0
+        self._recent = deque(maxlen=50)
+
+    def reserve(self) -> float:
+        """Claim the next request slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._blocked_until)
+            if self.rate:
+                interval = 1 / self.rate
+                tolerance = (self.burst - 1) * interval
+                start = max(start, self._next_time - tolerance)
+                self._next_time = max(self._next_time, start) + interval
+            self._recent.append(start)
+            return start - now
+
+    def acquire(self) -> None:
+        """Block the calling thread until it may send a request."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def observed_rate(self, now: float) -> float:
+        """Requests per second sent recently, used as a starting point after the first 429."""
+        if len(self._recent) < 2 or now <= self._recent[0]:
+            return 1.0
+        return len(self._recent) / (now - self._recent[0])
+
+    def update(self, status_code: int, headers: Optional[Mapping[str, Any]]) -> None:
+        """Adjust the rate from a response status code and its rate-limit headers."""
+        headers = headers or {}
+        with self._lock:
+            now = time.monotonic()
+            if status_code == 429:
+                self._throttle_streak += 1
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+                if retry_after is None:
+                    retry_after = min(THROTTLE_DELAY * 2 ** (self._throttle_streak - 1), MAX_THROTTLE_DELAY)
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                self.rate = max(MIN_RATE, (self.rate or self.observed_rate(now)) * DECREASE_FACTOR)
+                LOGGER.warning(
+                    f"Rate limited by Mailjet, pausing requests for {retry_after:.2f}s "
+                    f"and pacing at {self.rate:.2f} requests/s"
+                )
+                return
+
+            if status_code >= 500:
+                return
+
+            self._throttle_streak = 0
+            if str(headers.get("X-RateLimit-Remaining")) == "0":
+                reset = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+                if reset:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+
+            if self.rate:
+                self.rate += INCREASE_STEP / self.rate
+                if self.max_rate:
+                    self.rate = min(self.rate, self.max_rate)
@@ -0,0 +1,166 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from singer import get_logger
+
+from tap_mailjet.helpers import get_config_number
+
+LOGGER = get_logger()
+CACHE_FILE = "responses.sqlite"
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Rows removed at a time while the cache is over its size
+EVICT_BATCH = 100
+
+
+class CachedResponse:
+    """A stored page, the validators it was served with and the scan that stored it."""
+
+    def __init__(self, body: bytes, etag: Optional[str], last_modified: Optional[str], scan: float) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.scan = scan
+
+    def is_fresh(self, scan: float) -> bool:
+        """Whether the page was stored or revalidated by its stream's current scan."""
+        return self.scan == scan
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the API to answer 304 if the page has not changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Persistent cache of response pages for slowly changing streams.
+    ~~~
+    Only GET pages of the streams given a TTL in `ttls` are cached, keyed
+    like cassette pages. Pages are stamped with the scan of their stream
+    that stored them, so that all pages of a stream expire together: while
+    the scan is younger than the TTL its pages are served without a
+    request. Once it is older, the next run starts a new scan, in which
+    every page is revalidated with its ETag or Last-Modified when the API
+    sent one, and a 304 moves the page over to the new scan. Pages live in
+    one SQLite file; once it holds more than `max_bytes` of bodies, the
+    least recently used pages are dropped.
+    """
+
+    def __init__(self, directory: str, ttls: Mapping[str, float], max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.ttls = {stream: float(ttl) for stream, ttl in ttls.items() if ttl}
+        self.max_bytes = max_bytes
+        self.scans: Dict[str, float] = {}
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(directory, CACHE_FILE), check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, etag TEXT, last_modified TEXT, "
+            "scan REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE TABLE IF NOT EXISTS scans (stream TEXT PRIMARY KEY, started_at REAL NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+        self.connection.commit()
+        self.size = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> Optional["ResponseCache"]:
+        """The cache set up by `response_cache_dir` and `response_cache_ttls`, if any."""
+        directory = config.get("response_cache_dir")
+        ttls = config.get("response_cache_ttls") or {}
+        if not directory or not ttls:
+            return None
+        return cls(directory, ttls, get_config_number(config, "response_cache_max_bytes", CACHE_MAX_BYTES))
+
+    def get_ttl(self, endpoint: str) -> Optional[float]:
+        """The TTL of the stream an endpoint belongs to, None if its pages are not cached."""
+        # Imported here, the streams import the client
+        from tap_mailjet.streams import get_stream_name
+        return self.ttls.get(get_stream_name(endpoint))
+
+    def get_scan(self, endpoint: str, ttl: float) -> float:
+        """
+        The start of the current scan of an endpoint's stream. A new scan is
+        started if the stored one is older than `ttl`, at most once per run,
+        so every page of a stream is judged by the same scan within a sync.
+        """
+        # Imported here, the streams import the client
+        from tap_mailjet.streams import get_stream_name
+        stream = get_stream_name(endpoint)
+        with self.lock:
+            if stream not in self.scans:
+                row = self.connection.execute("SELECT started_at FROM scans WHERE stream = ?", (stream,)).fetchone()
+                now = time.time()
+                if row is not None and now - row[0] < ttl:
+                    self.scans[stream] = row[0]
+                else:
+                    self.connection.execute("INSERT OR REPLACE INTO scans VALUES (?, ?)", (stream, now))
+                    self.connection.commit()
+                    self.scans[stream] = now
+            return self.scans[stream]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """The stored page of `key`, marked as recently used."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body, etag, last_modified, scan FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+        return CachedResponse(*row)
+
+    def put(
+        self, key: str, body: bytes, scan: float, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> None:
+        """Store a page in `scan`, then evict the least recently used pages while the cache is too large."""
+        with self.lock:
+            previous = self.connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, len(body), etag, last_modified, scan, time.time())
+            )
+            self.size += len(body) - (previous[0] if previous else 0)
+            while self.size > self.max_bytes:
+                rows = self.connection.execute(
+                    "SELECT key, size FROM responses WHERE key != ? ORDER BY used_at LIMIT ?", (key, EVICT_BATCH)
+                ).fetchall()
+                if not rows:
+                    break
+                for evicted, size in rows:
+                    self.connection.execute("DELETE FROM responses WHERE key = ?", (evicted,))
+                    self.size -= size
+                    if self.size <= self.max_bytes:
+                        break
+            self.connection.commit()
+
+    def count(self, outcome: str) -> None:
+        """Count a page served locally ("hits"), revalidated or downloaded ("misses")."""
+        with self.lock:
+            self.stats[outcome] += 1
+
+    def touch(self, key: str, scan: float) -> None:
+        """Move a page the API confirmed unchanged over to `scan`."""
+        with self.lock:
+            self.connection.execute(
+                "UPDATE responses SET scan = ?, used_at = ? WHERE key = ?", (scan, time.time(), key)
+            )
+            self.connection.commit()
+
+    def close(self) -> None:
+        if any(self.stats.values()):
+            LOGGER.info(
+                f"Response cache: {self.stats['hits']} pages served locally, "
+                f"{self.stats['revalidated']} revalidated, {self.stats['misses']} downloaded"
+            )
+        with self.lock:
+            self.connection.close()
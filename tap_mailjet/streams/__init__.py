@@ -1,3 +1,5 @@
+from typing import Optional
+
 from tap_mailjet.streams.messages import Messages
 from tap_mailjet.streams.contacts import Contacts
 from tap_mailjet.streams.contacts_list import ContactsList
@@ -24,3 +26,10 @@ STREAMS = {
     "campaign_overview": CampaignOverview,
 }
 
+STREAMS_BY_PATH = {stream.path: name for name, stream in STREAMS.items()}
+
+
+def get_stream_name(endpoint: str) -> Optional[str]:
+    """The stream whose path an endpoint requests, None if it is no stream's."""
+    return STREAMS_BY_PATH.get(endpoint.rstrip("/").rsplit("/", 1)[-1])
+
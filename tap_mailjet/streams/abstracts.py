@@ -1,20 +1,49 @@
 from abc import ABC, abstractmethod
 import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Tuple, List, Iterator
+from typing import Any, Dict, Tuple, List, Iterable, Iterator
+
+import backoff
 from singer import (
     Transformer,
     get_bookmark,
     get_logger,
     metrics,
-    write_bookmark,
-    write_record,
-    write_schema,
     metadata
 )
+from tap_mailjet import profiling
+from tap_mailjet.checkpoint import Checkpointer
+from tap_mailjet.client import BACKOFF_FACTOR, MAX_TRIES
+from tap_mailjet.dedupe import BoundaryKeys
+from tap_mailjet.emitter import clear_bookmark, write_bookmark, write_record, write_schema
+from tap_mailjet.exceptions import MailjetStreamInterruptedError
+from tap_mailjet.filters import RecordFilter, replication_cutoff
+from tap_mailjet.helpers import (
+    format_datetime,
+    get_config_flag,
+    get_config_number,
+    parse_datetime
+)
+from tap_mailjet.page_size import MAX_PAGE_SIZE, PageSizer, is_page_size_error
+from tap_mailjet.pipeline import OrderedPrefetch, RecordPipeline
+from tap_mailjet.plan import SyncPlan
+from tap_mailjet.transform import CompiledSchema, UnsupportedSchema
 
 LOGGER = get_logger()
 
+PIPELINE_QUEUE_SIZE = 10
+WINDOW_CONCURRENCY = 4
+WINDOW_DAYS = 1
+MIN_WINDOW_SIZE = timedelta(minutes=1)
+# Chunks of records each window being fetched ahead may buffer
+WINDOW_QUEUE_SIZE = 10
+WINDOW_CHUNK_SIZE = 1000
+CURSOR_OVERLAP = 10
+
 
 class BaseStream(ABC):
     """
@@ -46,6 +75,9 @@ class BaseStream(ABC):
         self.child_to_sync = []
         self.params = {}
         self.data_payload = {}
+        self.compiled_schema = None
+        self.page_sizer = None
+        self.sync_plan = None
 
     @property
     @abstractmethod
@@ -98,40 +130,280 @@ class BaseStream(ABC):
         """
 
 
-    def get_records(self) -> Iterator:
-        """Interacts with api client interaction and pagination."""
-        self.params["Limit"] = self.page_size
-        current_page = 0
+    def get_records(self, params: Dict = None) -> Iterator:
+        """
+        Interacts with api client interaction and pagination.
+        Pages through `params` when given, otherwise through the stream params.
+        """
+        params = self.params if params is None else params
+        params["Limit"] = self.page_size
         has_more_data = True
-        
-        if "Offset" not in self.params:
-            self.params["Offset"] = 0
-        
+
+        if "Offset" not in params:
+            params["Offset"] = 0
+
+        page_concurrency = get_config_number(self.client.config, "page_concurrency", 1)
+        if page_concurrency > 1:
+            has_more_data = yield from self.get_concurrent_records(params, page_concurrency)
+
+        if self.page_sizer:
+            if has_more_data:
+                yield from self.get_adaptive_records(params)
+            return
+
         while has_more_data:
-            response = self.client.make_request(
-                self.http_method,
-                self.url_endpoint,
-                self.params,
-                self.headers,
-                body=json.dumps(self.data_payload),
-                path=self.path
-            )
-            raw_records = response.get(self.data_key, [])
-            
-            # Exit if no records returned
-            if not raw_records:
-                has_more_data = False
-                break
-            
-            yield from raw_records
-            
-            # Check if we got fewer records than page_size (last page)
-            if len(raw_records) < self.page_size:
+            record_count = 0
+            for record in self.get_page_records(params):
+                record_count += 1
+                yield record
+
+            # Check if we got fewer records than page_size (last or empty page)
+            if record_count < self.page_size:
                 has_more_data = False
             else:
                 # Move to next page
-                current_page += 1
-                self.params["Offset"] = current_page * self.page_size
+                params["Offset"] += self.page_size
+
+    def get_adaptive_records(self, params: Dict) -> Iterator:
+        """
+        Page serially with the `Limit` chosen by the stream's PageSizer.
+        Each page is timed without the time the caller spends on its records,
+        and a page that times out or fails with a 5xx is retried smaller.
+        """
+        sizer = self.page_sizer
+        has_more_data = True
+        while has_more_data:
+            page_size = sizer.size
+            params["Limit"] = page_size
+            record_count = 0
+            paused = 0.0
+            started = time.monotonic()
+            try:
+                for record in self.get_page_records(params):
+                    record_count += 1
+                    yielded_at = time.monotonic()
+                    yield record
+                    paused += time.monotonic() - yielded_at
+            except Exception as err:
+                if not is_page_size_error(err) or page_size <= sizer.min_size:
+                    raise
+                sizer.shrink()
+                LOGGER.warning(
+                    f"Page of {page_size} {self.tap_stream_id} records failed, retrying with {sizer.size}: {err}"
+                )
+                # Records already yielded from the failed page are not requested again
+                params["Offset"] += record_count
+                continue
+
+            sizer.record(page_size, record_count, time.monotonic() - started - paused)
+            if record_count < page_size:
+                has_more_data = False
+            else:
+                params["Offset"] += page_size
+
+    def setup_page_size(self, state: Dict) -> None:
+        """
+        Pick the page size for this run: a `page_sizes` override from the
+        config, or with `adaptive_page_size` a PageSizer starting from the
+        size remembered in the state.
+        """
+        overrides = self.client.config.get("page_sizes") or {}
+        if self.tap_stream_id in overrides:
+            self.page_size = get_config_number(overrides, self.tap_stream_id, self.page_size)
+            self.page_sizer = None
+        elif self.page_sizer is None and get_config_flag(self.client.config, "adaptive_page_size"):
+            remembered = get_bookmark(state, self.tap_stream_id, "page_size")
+            self.page_sizer = PageSizer(remembered or MAX_PAGE_SIZE)
+            self.page_size = self.page_sizer.size
+
+    def save_page_size(self, state: Dict) -> None:
+        """Remember the best adaptive page size for the next run."""
+        if self.page_sizer:
+            write_bookmark(state, self.tap_stream_id, "page_size", self.page_sizer.best_size)
+
+    def get_concurrent_records(self, params: Dict, page_concurrency: int) -> Iterator:
+        """
+        Fetch the first page, size the result set from its `Total` (or a
+        `countOnly` probe) and fetch the remaining pages with a bounded worker
+        pool. Records are yielded in offset order.
+
+        Returns True when the last page was full, so the caller keeps paging
+        serially to pick up rows created after the total was read.
+        """
+        response = self.fetch_page(params)
+        raw_records = response.get(self.data_key, [])
+        yield from raw_records
+        if len(raw_records) < self.page_size:
+            return False
+
+        start_offset = params["Offset"] + self.page_size
+        total = response.get("Total") or 0
+        if total <= start_offset:
+            total = self.get_total_count(params)
+
+        offsets = range(start_offset, total, self.page_size)
+        LOGGER.info(f"Fetching {len(offsets)} pages of {self.tap_stream_id} with {page_concurrency} workers")
+        page_requests = (
+            {
+                "method": self.http_method,
+                "endpoint": self.url_endpoint,
+                "params": {**params, "Offset": offset},
+                "headers": self.headers,
+                "body": json.dumps(self.data_payload),
+                "path": self.path,
+            }
+            for offset in offsets
+        )
+        last_page_full = True
+        for response in self.client.make_requests(page_requests, page_concurrency):
+            raw_records = response.get(self.data_key, [])
+            yield from raw_records
+            last_page_full = len(raw_records) >= self.page_size
+
+        params["Offset"] = offsets[-1] + self.page_size if offsets else start_offset
+        return last_page_full
+
+    def get_total_count(self, params: Dict) -> int:
+        """Ask the API for the number of records matching the given filters."""
+        count_params = {key: value for key, value in params.items() if key not in ("Limit", "Offset")}
+        count_params["countOnly"] = 1
+        response = self.fetch_page(count_params)
+        return max(response.get("Count") or 0, response.get("Total") or 0)
+
+    def get_page_records(self, params: Dict) -> Iterator[Dict]:
+        """
+        Yield the records of one page. With `stream_pages` set, records are
+        decoded while the response body arrives instead of after it is read.
+        A body cut short is retried with the client's backoff policy, asking
+        only for the rest of the page.
+        """
+        if not get_config_flag(self.client.config, "stream_pages"):
+            yield from self.fetch_page(params).get(self.data_key, [])
+            return
+
+        offset = params.get("Offset", 0)
+        limit = params.get("Limit", self.page_size)
+        yielded = 0
+        tries = 0
+        while yielded < limit:
+            page_params = params
+            if yielded:
+                page_params = {**params, "Offset": offset + yielded, "Limit": limit - yielded}
+            try:
+                for record in self.client.stream_request(
+                    self.http_method,
+                    self.url_endpoint,
+                    self.data_key,
+                    page_params,
+                    self.headers,
+                    body=json.dumps(self.data_payload),
+                    path=self.path
+                ):
+                    yielded += 1
+                    yield record
+                return
+            except MailjetStreamInterruptedError as err:
+                tries += 1
+                if tries >= MAX_TRIES:
+                    raise
+                LOGGER.warning(
+                    f"Page of {self.tap_stream_id} cut short after {yielded} records, requesting the rest: {err}"
+                )
+                time.sleep(backoff.full_jitter(BACKOFF_FACTOR * 2 ** (tries - 1)))
+
+    def fetch_page(self, params: Dict) -> Dict:
+        """Request one page of the stream with the given query parameters."""
+        return self.client.make_request(
+            self.http_method,
+            self.url_endpoint,
+            params,
+            self.headers,
+            body=json.dumps(self.data_payload),
+            path=self.path
+        )
+
+    def transform_record(self, record: Dict, transformer: Transformer, parent_obj: Dict = None) -> Tuple[Dict, Dict]:
+        """Apply `modify_object` and the schema transform to one raw record."""
+        profiler = profiling.PROFILER
+        if profiler:
+            started = time.perf_counter()
+        try:
+            record = self.modify_object(record, parent_obj)
+            if self.compiled_schema:
+                transformed_record = self.compiled_schema.transform(record, transformer)
+            else:
+                # pylint: disable=too-many-function-args
+                transformed_record = transformer.transform(
+                    record, self.schema, self.metadata
+                )
+        except Exception as err:
+            LOGGER.error(f"Failed to transform record in {self.tap_stream_id}: {record.get('ID', 'unknown')}, Error: {err}")
+            raise
+        if profiler:
+            profiler.add(self.tap_stream_id, "transform", time.perf_counter() - started)
+        return record, transformed_record
+
+    def compile_schema(self) -> None:
+        """Build the stream's compiled transformer once, when `compiled_transform` is enabled."""
+        if self.compiled_schema or not get_config_flag(self.client.config, "compiled_transform"):
+            return
+        try:
+            self.compiled_schema = CompiledSchema(self.schema, self.metadata)
+        except UnsupportedSchema as err:
+            LOGGER.warning(f"Using the generic transformer for {self.tap_stream_id}: {err}")
+
+    def get_record_filter(self) -> RecordFilter:
+        """Build the raw record predicates configured for this stream in `record_filters`."""
+        return RecordFilter.from_config(self.client.config, self.tap_stream_id)
+
+    def transform_records(
+        self,
+        records: Iterable[Dict],
+        transformer: Transformer,
+        parent_obj: Dict = None,
+        record_filter: RecordFilter = None,
+    ) -> Iterator[Tuple[Dict, Dict]]:
+        """
+        Yield (record, transformed_record) pairs in fetch order.
+        Records rejected by `record_filter` are not transformed and come out
+        as (record, None), so callers still see every fetched row.
+        With `pipeline_workers` set, fetching and transforming run in a
+        RecordPipeline while the caller keeps emitting from its own thread.
+        """
+        self.compile_schema()
+        record_filter = record_filter or None
+        workers = get_config_number(self.client.config, "pipeline_workers", 0)
+        if workers <= 0 or parent_obj:
+            for record in records:
+                if record_filter and not record_filter.matches(record):
+                    yield record, None
+                else:
+                    yield self.transform_record(record, transformer, parent_obj)
+            return
+
+        # singer's Transformer keeps per-call state, so every worker gets its own
+        local = threading.local()
+        worker_transformers = []
+
+        def transform(record):
+            if record_filter and not record_filter.matches(record):
+                return record, None
+            if not hasattr(local, "transformer"):
+                local.transformer = Transformer(transformer.integer_datetime_fmt, transformer.pre_hook)
+                worker_transformers.append(local.transformer)
+            return self.transform_record(record, local.transformer, parent_obj)
+
+        pipeline = RecordPipeline(
+            workers,
+            get_config_number(self.client.config, "pipeline_queue_size", PIPELINE_QUEUE_SIZE),
+            self.page_size
+        )
+        try:
+            yield from pipeline.process(records, transform)
+        finally:
+            for worker_transformer in worker_transformers:
+                transformer.removed.update(worker_transformer.removed)
+                transformer.filtered.update(worker_transformer.filtered)
 
     def write_schema(self) -> None:
         """
@@ -173,6 +445,8 @@ class BaseStream(ABC):
 class IncrementalStream(BaseStream):
     """Base Class for Incremental Stream."""
 
+    sort_by_replication_key = True
+
 
     def get_bookmark(self, state: dict, stream: str, key: Any = None) -> str:
         """
@@ -202,22 +476,133 @@ class IncrementalStream(BaseStream):
         return write_bookmark(
             state, stream, bookmark_key, value
         )
+
+    def write_sync_bookmark(self, state: dict, value: str, boundary: BoundaryKeys = None) -> Dict:
+        """Write the replication bookmark, preceded by the keys of the records at it."""
+        if boundary:
+            state = boundary.write(state, self.tap_stream_id)
+        return self.write_bookmark(state, self.tap_stream_id, value=value)
     
     def set_incremental_params(self, bookmark_date: str) -> None:
         """Set FromTS parameter for incremental sync with datetime adjustment.
         
         Mailjet API's FromTS parameter is exclusive (>), not inclusive (>=).
         Subtract 1 seconds to ensure we don't miss any records due to timestamp precision.
+        Results are sorted ascending on the replication key, so the running
+        maximum is a safe bookmark at any point of the sync.
         """
+        if self.sort_by_replication_key and self.replication_keys:
+            self.update_params(Sort=self.replication_keys[0])
         try:
-            dt = datetime.fromisoformat(bookmark_date.replace('Z', '+00:00'))
-            adjusted_date = (dt - timedelta(seconds=1)).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+            adjusted_date = format_datetime(parse_datetime(bookmark_date) - timedelta(seconds=1))
             LOGGER.info(f"Setting FromTS parameter for {self.tap_stream_id} stream: {adjusted_date} from (bookmark: {bookmark_date})")
             self.update_params(FromTS=adjusted_date)
         except Exception as e:
             LOGGER.warning(f"Failed to adjust bookmark date for {self.tap_stream_id}, using original: {e}")
             self.update_params(FromTS=bookmark_date)
 
+    def get_time_windows(self, start: datetime, end: datetime, window_size: timedelta) -> List[Tuple[datetime, datetime]]:
+        """Split the [start, end) range into consecutive windows of `window_size`."""
+        windows = []
+        window_start = start
+        while window_start < end:
+            window_end = min(window_start + window_size, end)
+            windows.append((window_start, window_end))
+            window_start = window_end
+        return windows
+
+    def get_window_params(self, window: Tuple[datetime, datetime]) -> Dict:
+        """Build the query parameters for one FromTS/ToTS window."""
+        window_start, window_end = window
+        params = {key: value for key, value in self.params.items() if key != "Offset"}
+        # FromTS is exclusive, keep the same 1 second overlap as set_incremental_params
+        params["FromTS"] = format_datetime(window_start - timedelta(seconds=1))
+        params["ToTS"] = format_datetime(window_end)
+        return params
+
+    def get_window_records(self, window: Tuple[datetime, datetime]) -> Iterator[Dict]:
+        """
+        Fetch the records of one FromTS/ToTS window. The FromTS overlap also
+        returns the last second of the previous window, so rows replicated
+        before the window start are dropped here and every row belongs to
+        exactly one window. Rows without a readable timestamp are kept.
+        """
+        window_start, window_end = window
+        replication_key = self.replication_keys[0]
+        for record in self.get_records(self.get_window_params(window)):
+            try:
+                value = parse_datetime(record[replication_key])
+            except (KeyError, TypeError, ValueError):
+                yield record
+                continue
+            if window_start <= value < window_end:
+                yield record
+
+    def get_window_count(self, window: Tuple[datetime, datetime]) -> int:
+        """Count the records of one FromTS/ToTS window with a countOnly request."""
+        return self.get_total_count(self.get_window_params(window))
+
+    def plan_time_windows(
+        self, windows: List[Tuple[datetime, datetime]], target_records: int, concurrency: int
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Resize windows so each holds about `target_records` records.
+        ~~~
+        Window counts are probed with countOnly. Dense windows are split into
+        equal time slices and probed again (down to MIN_WINDOW_SIZE), then
+        adjacent sparse windows are merged while they stay under the target.
+        """
+        planned = []
+        pending = windows
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while pending:
+                counts = list(executor.map(self.get_window_count, pending))
+                next_pending = []
+                for (window_start, window_end), count in zip(pending, counts):
+                    span = window_end - window_start
+                    if count > target_records and span > MIN_WINDOW_SIZE:
+                        parts = min(math.ceil(count / target_records), math.ceil(span / MIN_WINDOW_SIZE))
+                        step = span / parts
+                        next_pending.extend(
+                            (window_start + step * i, window_end if i == parts - 1 else window_start + step * (i + 1))
+                            for i in range(parts)
+                        )
+                    else:
+                        planned.append(((window_start, window_end), count))
+                pending = next_pending
+
+        merged = []
+        for window, count in sorted(planned):
+            if merged and merged[-1][1] + count <= target_records:
+                (previous_start, _), previous_count = merged[-1]
+                merged[-1] = ((previous_start, window[1]), previous_count + count)
+            else:
+                merged.append((window, count))
+
+        LOGGER.info(
+            f"Planned {len(merged)} windows for {self.tap_stream_id} holding "
+            f"{sum(count for _, count in merged)} records (target {target_records} per window)"
+        )
+        return [window for window, _ in merged]
+
+    def get_windowed_records(
+        self, bookmark_date: str, window_size: timedelta, concurrency: int, target_records: int = None
+    ) -> Iterator[Iterator[Dict]]:
+        """
+        Fetch the range from the bookmark to the sync start time as FromTS/ToTS
+        windows, `concurrency` windows at a time, and yield an iterator over
+        each window's records in window order. Windows fetched ahead buffer at
+        most WINDOW_QUEUE_SIZE chunks, so memory does not grow with the window
+        size. With `target_records` the windows are first resized to the
+        record density.
+        """
+        end = self.client.now()
+        windows = self.get_time_windows(parse_datetime(bookmark_date), end, window_size)
+        if target_records:
+            windows = self.plan_time_windows(windows, target_records, concurrency)
+        LOGGER.info(f"Syncing {self.tap_stream_id} up to {format_datetime(end)} in {len(windows)} windows with {concurrency} workers")
+        prefetch = OrderedPrefetch(concurrency, WINDOW_QUEUE_SIZE, WINDOW_CHUNK_SIZE)
+        yield from prefetch.read_ahead(self.get_window_records(window) for window in windows)
 
     def sync(
         self,
@@ -226,6 +611,8 @@ class IncrementalStream(BaseStream):
         parent_obj: Dict = None,
     ) -> Dict:
         """Implementation for `type: Incremental` stream."""
+        self.sync_plan = SyncPlan(self)
+        self.setup_page_size(state)
         bookmark_date = self.get_bookmark(state, self.tap_stream_id)
         current_max_bookmark_date = bookmark_date
         
@@ -234,59 +621,203 @@ class IncrementalStream(BaseStream):
         self.update_data_payload(**(parent_obj or {}))
         self.url_endpoint = self.get_url_endpoint(parent_obj)
 
-        batch_size = 100
-        records_since_last_bookmark = 0
+        target_records = get_config_number(self.client.config, "window_target_records", None)
+        window_days = get_config_number(
+            self.client.config, "incremental_window_days", WINDOW_DAYS if target_records else 0, cast=float
+        )
         
+        # Children sync once per parent record and share the parent's checkpoints
+        checkpointer = None if parent_obj else Checkpointer.from_config(self.client.config)
+
+        # Over unsorted pages only complete windows give a safe bookmark
+        record_checkpointer = checkpointer if self.sorted_by_replication_key() else None
+
+        record_filter = self.get_record_filter()
+        replication_key = self.sync_plan.replication_key
+        if self.is_datetime_replication_key() and replication_key in self.sync_plan.selected_fields:
+            # Rows before the bookmark are dropped before the transform rather than after it
+            record_filter.add(replication_cutoff(replication_key, bookmark_date))
+
+        # FromTS overlaps the bookmark by a second, skip the rows the last run already emitted
+        boundary = None
+        if not parent_obj and self.key_properties:
+            boundary = BoundaryKeys(
+                self.key_properties, replication_key, bookmark_date,
+                get_bookmark(state, self.tap_stream_id, "boundary_keys")
+            )
+
         with metrics.record_counter(self.tap_stream_id) as counter:
-            for record in self.get_records():
-                try:
-                    record = self.modify_object(record, parent_obj)
-                    # pylint: disable=too-many-function-args
-                    transformed_record = transformer.transform(
-                        record, self.schema, self.metadata
+            if window_days > 0 and not parent_obj:
+                concurrency = get_config_number(self.client.config, "window_concurrency", WINDOW_CONCURRENCY)
+                windowed_records = self.get_windowed_records(
+                    bookmark_date, timedelta(days=window_days), concurrency, target_records
+                )
+                for window_records in windowed_records:
+                    synced = counter.value
+                    current_max_bookmark_date = self.sync_records(
+                        window_records, state, transformer, parent_obj,
+                        bookmark_date, current_max_bookmark_date, counter,
+                        checkpointer=record_checkpointer, boundary=boundary, record_filter=record_filter
                     )
-                except Exception as err:
-                    LOGGER.error(f"Failed to transform record in {self.tap_stream_id}: {record.get('ID', 'unknown')}, Error: {err}")
-                    raise
+                    # Every window up to this one is complete, so the bookmark can move past it
+                    state = self.write_sync_bookmark(state, current_max_bookmark_date, boundary)
+                    if not record_checkpointer:
+                        checkpointer.count(counter.value - synced)
+                    if checkpointer.due():
+                        checkpointer.write(state, current_max_bookmark_date)
+            else:
+                current_max_bookmark_date = self.sync_records(
+                    self.get_records(), state, transformer, parent_obj,
+                    bookmark_date, current_max_bookmark_date, counter, batch_size=100,
+                    checkpointer=record_checkpointer, boundary=boundary, record_filter=record_filter
+                )
 
-                if not self.replication_keys:
-                    LOGGER.error(f"No replication keys defined for stream {self.tap_stream_id}")
-                    raise ValueError(f"No replication keys defined for stream {self.tap_stream_id}")
-                
-                replication_key = self.replication_keys[0]
-                if replication_key not in transformed_record:
-                    LOGGER.error(f"Replication key '{replication_key}' not found in record for stream {self.tap_stream_id}")
-                    raise KeyError(f"Replication key '{replication_key}' not found in record")
-                
-                record_bookmark = transformed_record[replication_key]
-                if record_bookmark >= bookmark_date:
-                    if self.is_selected():
-                        write_record(self.tap_stream_id, transformed_record)
-                        counter.increment()
+            # Write final bookmark
+            state = self.write_sync_bookmark(state, current_max_bookmark_date, boundary)
+            self.save_page_size(state)
+            return counter.value
 
-                    if record_bookmark:
-                        current_max_bookmark_date = max(
-                            current_max_bookmark_date, record_bookmark
-                        )
+    def is_datetime_replication_key(self) -> bool:
+        """Whether the replication key is a date-time, which the raw cutoff can compare."""
+        if not self.replication_keys:
+            return False
+        field = self.schema.get("properties", {}).get(self.replication_keys[0], {})
+        return field.get("format") == "date-time"
 
-                    for child in self.child_to_sync:
-                        child.sync(state=state, transformer=transformer, parent_obj=record)
-                    
-                    # Write state after every batch
-                    records_since_last_bookmark += 1
-                    if records_since_last_bookmark >= batch_size:
-                        state = self.write_bookmark(state, self.tap_stream_id, value=current_max_bookmark_date)
-                        records_since_last_bookmark = 0
+    def sorted_by_replication_key(self) -> bool:
+        """Whether pages are requested in ascending replication key order."""
+        if not self.replication_keys:
+            return False
+        return self.params.get("Sort") in (self.replication_keys[0], f"{self.replication_keys[0]} ASC")
 
-            # Write final bookmark
-            state = self.write_bookmark(state, self.tap_stream_id, value=current_max_bookmark_date)
-            return counter.value
+    def sync_records(
+        self,
+        records: Iterable[Dict],
+        state: Dict,
+        transformer: Transformer,
+        parent_obj: Dict,
+        bookmark_date: str,
+        current_max_bookmark_date: str,
+        counter: metrics.Counter,
+        batch_size: int = None,
+        checkpointer: Checkpointer = None,
+        boundary: BoundaryKeys = None,
+        record_filter: RecordFilter = None,
+    ) -> str:
+        """
+        Transform and write records newer than the bookmark, syncing children.
+        The bookmark is written every `batch_size` records when set, and STATE
+        is emitted whenever `checkpointer` says a checkpoint is due. Only pass
+        a checkpointer when records arrive in replication key order, otherwise
+        the running maximum could skip older rows after a crash. `boundary`
+        drops raw records already emitted at the bookmark before they are
+        transformed, and tracks the keys at the new maximum. Records rejected
+        by `record_filter` are skipped without being transformed.
+        Returns the highest replication value seen.
+        """
+        records_since_last_bookmark = 0
+        if boundary:
+            records = boundary.filter(records)
+
+        # Read once, the loop below runs for every record
+        stream_id = self.tap_stream_id
+        selected = self.sync_plan.selected
+        replication_key = self.sync_plan.replication_key
+        children = self.sync_plan.children
+
+        records = self.transform_records(records, transformer, parent_obj, record_filter)
+        for record, transformed_record in records:
+            if transformed_record is None:
+                continue
+            if replication_key is None:
+                LOGGER.error(f"No replication keys defined for stream {stream_id}")
+                raise ValueError(f"No replication keys defined for stream {stream_id}")
+            
+            if replication_key not in transformed_record:
+                LOGGER.error(f"Replication key '{replication_key}' not found in record for stream {stream_id}")
+                raise KeyError(f"Replication key '{replication_key}' not found in record")
+            
+            record_bookmark = transformed_record[replication_key]
+            if record_bookmark >= bookmark_date:
+                if selected:
+                    write_record(stream_id, transformed_record)
+                    counter.increment()
+
+                if record_bookmark:
+                    current_max_bookmark_date = max(
+                        current_max_bookmark_date, record_bookmark
+                    )
+                    if boundary:
+                        boundary.add(record_bookmark, record)
+
+                for child in children:
+                    child.sync(state=state, transformer=transformer, parent_obj=record)
+                
+                # Write state after every batch
+                records_since_last_bookmark += 1
+                if batch_size and records_since_last_bookmark >= batch_size:
+                    state = self.write_sync_bookmark(state, current_max_bookmark_date, boundary)
+                    records_since_last_bookmark = 0
+
+                if checkpointer and checkpointer.tick():
+                    state = self.write_sync_bookmark(state, current_max_bookmark_date, boundary)
+                    checkpointer.write(state, current_max_bookmark_date)
+
+        return current_max_bookmark_date
 
 
 class FullTableStream(BaseStream):
     """Base Class for Full Table Stream."""
 
     replication_keys = []
+    cursor_key = "ID"
+
+    def uses_cursor(self) -> bool:
+        """Whether the stream pages in `cursor_key` order."""
+        return bool(self.cursor_key) and get_config_flag(self.client.config, "cursor_pagination")
+
+    def get_records(self, params: Dict = None, last_id: Any = None) -> Iterator:
+        """Page by offset, or in `cursor_key` order when `cursor_pagination` is enabled."""
+        if self.uses_cursor():
+            params = self.params if params is None else params
+            yield from self.get_cursor_records(params, params.pop("Offset", 0), last_id)
+        else:
+            yield from super().get_records(params)
+
+    def get_cursor_records(self, params: Dict, offset: int = 0, last_id: Any = None) -> Iterator:
+        """
+        Page in `cursor_key` order, starting after `last_id`.
+        ~~~
+        Mailjet has no "ID greater than" filter, so pages are still addressed
+        by Offset, but sorting by ID keeps rows created during the scan at the
+        end instead of shifting every later page. Each page re-reads up to
+        `CURSOR_OVERLAP` rows before its offset and drops IDs at or below the
+        last one seen, so a few rows deleted behind the cursor neither make
+        the scan skip rows nor emit a row twice.
+        """
+        params["Sort"] = self.cursor_key
+        has_more_data = True
+        while has_more_data:
+            page_size = self.page_sizer.size if self.page_sizer else self.page_size
+            overlap = min(CURSOR_OVERLAP, offset, page_size // 2) if last_id is not None else 0
+            params["Limit"] = page_size
+            params["Offset"] = offset - overlap
+            record_count = 0
+            for record in self.get_page_records(params):
+                record_count += 1
+                record_id = record.get(self.cursor_key)
+                if last_id is not None and record_id is not None and record_id <= last_id:
+                    continue
+                if record_count == 1 and overlap:
+                    LOGGER.warning(
+                        f"More than {overlap} {self.tap_stream_id} rows were deleted behind the cursor, "
+                        f"rows after ID {last_id} may have been skipped"
+                    )
+                last_id = record_id
+                yield record
+
+            offset = params["Offset"] + record_count
+            has_more_data = record_count >= page_size
 
     def sync(
         self,
@@ -294,29 +825,74 @@ class FullTableStream(BaseStream):
         transformer: Transformer,
         parent_obj: Dict = None,
     ) -> Dict:
-        """Abstract implementation for `type: Fulltable` stream."""
+        """
+        Abstract implementation for `type: Fulltable` stream.
+        Top-level syncs checkpoint their position as the Checkpointer policy
+        says and resume from it after an interrupted run.
+        """
+        self.sync_plan = SyncPlan(self)
+        self.setup_page_size(state)
         self.url_endpoint = self.get_url_endpoint(parent_obj)
         self.update_data_payload(**(parent_obj or {}))
-        with metrics.record_counter(self.tap_stream_id) as counter:
-            for record in self.get_records():
-                try:
-                    # pylint: disable=too-many-function-args
-                    transformed_record = transformer.transform(
-                        record, self.schema, self.metadata
-                    )
-                except Exception as err:
-                    LOGGER.error(f"Failed to transform record in {self.tap_stream_id}: {record.get('ID', 'unknown')}, Error: {err}")
-                    raise
-                    
-                if self.is_selected():
-                    write_record(self.tap_stream_id, transformed_record)
-                    counter.increment()
 
-                for child in self.child_to_sync:
-                    child.sync(state=state, transformer=transformer, parent_obj=record)
+        checkpointer = None if parent_obj else Checkpointer.from_config(self.client.config)
+        offset, last_id, version = self.get_checkpoint(state) if checkpointer else (0, None, None)
+        version = version or int(time.time() * 1000)
+        self.params["Offset"] = offset
+
+        stream_id = self.tap_stream_id
+        selected = self.sync_plan.selected
+        children = self.sync_plan.children
+        uses_cursor = self.uses_cursor()
+
+        with metrics.record_counter(stream_id) as counter:
+            records = self.transform_records(
+                self.get_records(last_id=last_id), transformer, parent_obj, self.get_record_filter()
+            )
+            for position, (record, transformed_record) in enumerate(records, start=offset + 1):
+                # Rows rejected by the record filter still count towards the checkpoint offset
+                if transformed_record is not None:
+                    if selected:
+                        write_record(stream_id, transformed_record)
+                        counter.increment()
+
+                    for child in children:
+                        child.sync(state=state, transformer=transformer, parent_obj=record)
 
+                if checkpointer and checkpointer.tick():
+                    last_id = record.get(self.cursor_key) if uses_cursor else None
+                    self.write_checkpoint(state, position, last_id, version)
+                    checkpointer.write(state, position)
+
+            if checkpointer:
+                self.clear_checkpoint(state)
+            self.save_page_size(state)
             return counter.value
 
+    def get_checkpoint(self, state: Dict) -> Tuple[int, Any, Any]:
+        """
+        Return the (offset, last_id, version) an interrupted run stopped at.
+        A checkpoint written in the other pagination mode is ignored, since
+        its offset does not address the same rows.
+        """
+        offset = get_bookmark(state, self.tap_stream_id, "offset")
+        last_id = get_bookmark(state, self.tap_stream_id, "last_id")
+        version = get_bookmark(state, self.tap_stream_id, "version")
+        if not offset or (last_id is not None) != self.uses_cursor():
+            return 0, None, None
+        LOGGER.info(f"Resuming {self.tap_stream_id} sync version {version} at offset {offset}")
+        return offset, last_id, version
+
+    def write_checkpoint(self, state: Dict, offset: int, last_id: Any, version: int) -> None:
+        """Store the scan position in the stream's bookmark."""
+        write_bookmark(state, self.tap_stream_id, "offset", offset)
+        write_bookmark(state, self.tap_stream_id, "last_id", last_id)
+        write_bookmark(state, self.tap_stream_id, "version", version)
+
+    def clear_checkpoint(self, state: Dict) -> None:
+        """Drop the scan position once the table has been read completely."""
+        clear_bookmark(state, self.tap_stream_id, ("offset", "last_id", "version"))
+
 
 class ParentBaseStream(IncrementalStream):
     """Base Class for Parent Stream."""
@@ -6,4 +6,5 @@ class GeoStatistics(FullTableStream):
     replication_method = "FULL_TABLE"
     data_key = "Data"
     path = "geostatistics"
+    cursor_key = None
 
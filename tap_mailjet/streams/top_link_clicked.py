@@ -6,4 +6,5 @@ class TopLinkClicked(FullTableStream):
     replication_method = "FULL_TABLE"
     data_key = "Data"
     path = "toplinkclicked"
+    cursor_key = None
 
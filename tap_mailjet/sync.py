@@ -1,7 +1,12 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import singer
-from typing import Dict
+from typing import Dict, List
 from tap_mailjet.streams import STREAMS
 from tap_mailjet.client import Client
+from tap_mailjet import emitter, profiling
+from tap_mailjet.emitter import write_state
+from tap_mailjet.helpers import get_config_number
 
 LOGGER = singer.get_logger()
 
@@ -14,7 +19,7 @@ def update_currently_syncing(state: Dict, stream_name: str) -> None:
         del state["currently_syncing"]
     else:
         singer.set_currently_syncing(state, stream_name)
-    singer.write_state(state)
+    write_state(state)
 
 
 def write_schema(stream, client, streams_to_sync, catalog) -> None:
@@ -31,10 +36,93 @@ def write_schema(stream, client, streams_to_sync, catalog) -> None:
             stream.child_to_sync.append(child_obj)
 
 
+def get_top_level_streams(client: Client, catalog: singer.Catalog, streams_to_sync: List) -> List:
+    """
+    Return the streams to schedule, replacing selected children by their parent
+    """
+    top_level_streams = []
+    for stream_name in streams_to_sync:
+        stream = STREAMS[stream_name](client, catalog.get_stream(stream_name))
+        if stream.parent:
+            if stream.parent not in streams_to_sync:
+                streams_to_sync.append(stream.parent)
+            continue
+        top_level_streams.append(stream_name)
+    return top_level_streams
+
+
+def order_for_resume(stream_names: List, last_stream: str) -> List:
+    """
+    Start with the stream an interrupted run was syncing, keeping the rest in order
+    """
+    if last_stream not in stream_names:
+        return stream_names
+    index = stream_names.index(last_stream)
+    return stream_names[index:] + stream_names[:index]
+
+
+def sync_concurrently(
+    client: Client, catalog: singer.Catalog, state: Dict, streams_to_sync: List, concurrency: int
+) -> None:
+    """
+    Sync independent top-level streams on a thread pool.
+    ~~~
+    Streams start in schedule order, and currently_syncing always names the
+    first stream in that order which has not finished, so an interrupted run
+    resumes from it and re-syncs everything that might not have completed.
+    """
+    stream_names = order_for_resume(
+        get_top_level_streams(client, catalog, streams_to_sync),
+        singer.get_currently_syncing(state)
+    )
+    unfinished = list(stream_names)
+    lock = threading.Lock()
+
+    def sync_one(stream_name):
+        stream = STREAMS[stream_name](client, catalog.get_stream(stream_name))
+        write_schema(stream, client, streams_to_sync, catalog)
+        LOGGER.info("START Syncing: {}".format(stream_name))
+        with singer.Transformer() as transformer, profiling.profile_stream(stream):
+            total_records = stream.sync(state=state, transformer=transformer)
+
+        with lock:
+            unfinished.remove(stream_name)
+            update_currently_syncing(state, unfinished[0] if unfinished else None)
+        LOGGER.info(
+            "FINISHED Syncing: {}, total_records: {}".format(
+                stream_name, total_records
+            )
+        )
+
+    update_currently_syncing(state, unfinished[0] if unfinished else None)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(sync_one, stream_name) for stream_name in stream_names]
+        try:
+            for future in futures:
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+
 def sync(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
     """
     Sync selected streams from catalog
     """
+    emitter.configure(config)
+    profiling.configure(config)
+    try:
+        sync_streams(client, config, catalog, state)
+    finally:
+        emitter.flush()
+        profiling.finish()
+
+
+def sync_streams(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
+    """
+    Sync selected streams, one after another or concurrently
+    """
 
     streams_to_sync = []
     for stream in catalog.get_selected_streams(state):
@@ -44,6 +132,11 @@ def sync(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
     last_stream = singer.get_currently_syncing(state)
     LOGGER.info("last/currently syncing stream: {}".format(last_stream))
 
+    stream_concurrency = get_config_number(config, "stream_concurrency", 1)
+    if stream_concurrency > 1:
+        sync_concurrently(client, catalog, state, streams_to_sync, stream_concurrency)
+        return
+
     with singer.Transformer() as transformer:
         for stream_name in streams_to_sync:
 
@@ -56,7 +149,8 @@ def sync(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
             write_schema(stream, client, streams_to_sync, catalog)
             LOGGER.info("START Syncing: {}".format(stream_name))
             update_currently_syncing(state, stream_name)
-            total_records = stream.sync(state=state, transformer=transformer)
+            with profiling.profile_stream(stream):
+                total_records = stream.sync(state=state, transformer=transformer)
 
             update_currently_syncing(state, None)
             LOGGER.info(
@@ -64,4 +158,3 @@ def sync(client: Client, config: Dict, catalog: singer.Catalog, state) -> None:
                     stream_name, total_records
                 )
             )
-
@@ -0,0 +1,254 @@
+import re
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from singer.transform import NO_INTEGER_DATETIME_PARSING, Transformer, breadcrumb_path, string_to_datetime
+
+ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})?$"
+)
+
+
+class UnsupportedSchema(Exception):
+    """Raised at compile time for schema features the compiler does not handle."""
+
+
+class Mismatch(Exception):
+    """Raised at transform time when a value does not fit its schema."""
+
+
+def format_datetime(value: Any) -> Any:
+    """
+    Same result as singer's string_to_datetime, with a fast path for the
+    ISO 8601 timestamps Mailjet returns. Anything else goes through dateutil.
+    """
+    if type(value) is str:
+        match = ISO_DATETIME.match(value)
+        if match:
+            year, month, day, hour, minute, second, fraction, offset = match.groups()
+            try:
+                parsed = datetime(
+                    int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    int(fraction.ljust(6, "0")) if fraction else 0
+                )
+            except ValueError:
+                parsed = None
+            if parsed is not None:
+                if offset and offset != "Z":
+                    sign = 1 if offset[0] == "+" else -1
+                    parsed -= sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+                return (
+                    f"{parsed.year:04d}-{parsed.month:02d}-{parsed.day:02d}T"
+                    f"{parsed.hour:02d}:{parsed.minute:02d}:{parsed.second:02d}.{parsed.microsecond:06d}Z"
+                )
+    return string_to_datetime(value)
+
+
+# One function per JSON schema type, mirroring singer.Transformer._transform.
+# Each returns (success, value).
+
+def attempt_null(value):
+    if value is None or value == "":
+        return True, None
+    return False, None
+
+
+def attempt_datetime(value):
+    if value is None or value == "":
+        return False, None
+    value = format_datetime(value)
+    return value is not None, value
+
+
+def attempt_string(value):
+    if type(value) is str:
+        return True, value
+    if value is None:
+        return False, None
+    try:
+        return True, str(value)
+    except Exception:
+        return False, None
+
+
+def attempt_integer(value):
+    if type(value) is int:
+        return True, value
+    if isinstance(value, str):
+        value = value.replace(",", "")
+    try:
+        return True, int(value)
+    except Exception:
+        return False, None
+
+
+def attempt_number(value):
+    if isinstance(value, str):
+        value = value.replace(",", "")
+    try:
+        return True, float(value)
+    except Exception:
+        return False, None
+
+
+def attempt_boolean(value):
+    if type(value) is bool:
+        return True, value
+    if isinstance(value, str) and value.lower() == "false":
+        return True, False
+    try:
+        return True, bool(value)
+    except Exception:
+        return False, None
+
+
+def attempt_never(value):
+    return False, None
+
+
+SCALAR_ATTEMPTS = {
+    "string": attempt_string,
+    "integer": attempt_integer,
+    "number": attempt_number,
+    "boolean": attempt_boolean,
+}
+
+
+class CompiledSchema:
+    """
+    A record transformer specialised for one stream.
+    ~~~
+    The JSON schema and catalog metadata are walked once and turned into a
+    tree of converter functions, so transforming a record no longer looks up
+    metadata or re-reads the schema for every field. The result matches
+    singer.Transformer.transform: same type coercion, date-time formatting,
+    unselected-field dropping and removed/filtered bookkeeping. Records that
+    fail to convert are handed to the generic Transformer, so errors and
+    warnings are exactly the ones singer would produce.
+    """
+
+    def __init__(self, schema: Dict, mdata: Dict) -> None:
+        self.schema = schema
+        self.metadata = mdata
+        self.dropped = self.get_dropped_fields(mdata)
+        self._transform = self.compile_node(schema, [], self.dropped)
+
+    @staticmethod
+    def get_dropped_fields(mdata: Dict) -> Dict[str, str]:
+        """Top-level fields removed by singer's filter_data_by_metadata, with their breadcrumb path."""
+        dropped = {}
+        for breadcrumb, entry in (mdata or {}).items():
+            inclusion = entry.get("inclusion")
+            if inclusion == "automatic":
+                continue
+            if entry.get("selected") is False or inclusion == "unsupported":
+                if len(breadcrumb) != 2:
+                    raise UnsupportedSchema(f"Nested field selection is not compiled: {breadcrumb}")
+                dropped[breadcrumb[1]] = breadcrumb_path(breadcrumb)
+        return dropped
+
+    def compile_node(self, schema: Dict, path: List, dropped: Dict = None) -> Callable[[Any, Transformer], Any]:
+        """Build the converter for one schema node."""
+        if "anyOf" in schema or "$ref" in schema:
+            raise UnsupportedSchema(f"anyOf/$ref at {path} is not compiled")
+        if "type" not in schema:
+            return lambda value, transformer: value
+
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        if "null" in types:
+            types = [typ for typ in types if typ != "null"] + ["null"]
+
+        attempts = [self.compile_type(typ, schema, path, dropped) for typ in types]
+
+        if len(attempts) == 1:
+            attempt = attempts[0]
+
+            def convert(value, transformer):
+                success, result = attempt(value, transformer)
+                if not success:
+                    raise Mismatch(path)
+                return result
+            return convert
+
+        def convert_any(value, transformer):
+            for attempt in attempts:
+                try:
+                    success, result = attempt(value, transformer)
+                except Mismatch:
+                    continue
+                if success:
+                    return result
+            raise Mismatch(path)
+        return convert_any
+
+    def compile_type(self, typ: str, schema: Dict, path: List, dropped: Dict = None) -> Callable:
+        """Build the (success, value) function for one type of a schema node."""
+        if typ == "null":
+            return lambda value, transformer: attempt_null(value)
+        if schema.get("format") == "date-time":
+            return lambda value, transformer: attempt_datetime(value)
+        if schema.get("format") == "singer.decimal":
+            raise UnsupportedSchema(f"singer.decimal at {path} is not compiled")
+        if typ == "object":
+            return self.compile_object(schema, path, dropped or {})
+        if typ == "array":
+            return self.compile_array(schema, path)
+        attempt = SCALAR_ATTEMPTS.get(typ, attempt_never)
+        return lambda value, transformer: attempt(value)
+
+    def compile_object(self, schema: Dict, path: List, dropped: Dict) -> Callable:
+        """Build the converter for an object node and its properties."""
+        if schema.get("patternProperties"):
+            raise UnsupportedSchema(f"patternProperties at {path} is not compiled")
+        properties = schema.get("properties", {})
+        if not properties:
+            if dropped:
+                raise UnsupportedSchema(f"Field selection on an object without properties at {path}")
+            return lambda value, transformer: (isinstance(value, dict), value)
+
+        converters = {
+            name: self.compile_node(sub_schema, path + [name])
+            for name, sub_schema in properties.items()
+        }
+        prefix = ".".join(map(str, path)) + "." if path else ""
+
+        def attempt_object(value, transformer):
+            if not isinstance(value, dict):
+                return False, value
+            result = {}
+            for key, field_value in value.items():
+                if key in dropped:
+                    transformer.filtered.add(dropped[key])
+                    continue
+                convert = converters.get(key)
+                if convert is None:
+                    transformer.removed.add(f"{prefix}{key}")
+                    continue
+                result[key] = convert(field_value, transformer)
+            return True, result
+        return attempt_object
+
+    def compile_array(self, schema: Dict, path: List) -> Callable:
+        """Build the converter for an array node."""
+        items = schema["items"]
+        if "anyOf" in items or "$ref" in items:
+            raise UnsupportedSchema(f"anyOf/$ref items at {path} are not compiled")
+        if "type" not in items:
+            return lambda value, transformer: (isinstance(value, list), value)
+
+        convert = self.compile_node(items, path + ["items"])
+
+        def attempt_array(value, transformer):
+            if not isinstance(value, list):
+                return False, value
+            return True, [convert(row, transformer) for row in value]
+        return attempt_array
+
+    def transform(self, record: Dict, transformer: Transformer) -> Dict:
+        """Transform one record, falling back to the generic Transformer when needed."""
+        if transformer.integer_datetime_fmt != NO_INTEGER_DATETIME_PARSING or transformer.pre_hook:
+            return transformer.transform(record, self.schema, self.metadata)
+        try:
+            return self._transform(record, transformer)
+        except Mismatch:
+            return transformer.transform(record, self.schema, self.metadata)
@@ -0,0 +1,361 @@
+"""
+A local stand-in for the Mailjet REST API, for load and integration tests.
+
+Serves every stream path with Mailjet's `Limit`, `Offset`, `FromTS`, `ToTS`,
+`Sort` and `countOnly` query semantics, with optional latency and injected
+429 and 5xx responses. Pages carry an ETag and honour `If-None-Match`.
+Point the tap at it with the `base_url` config key:
+
+    python tests/unittests/fake_mailjet.py --records 100000 --port 8080
+    {"base_url": "http://127.0.0.1:8080/v3/REST", ...}
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from unittest.mock import MagicMock
+from urllib.parse import parse_qsl, urlsplit
+
+from synthetic_data import ShardedTable
+from tap_mailjet.client import Client
+from tap_mailjet.schema import get_schemas
+from tap_mailjet.streams import STREAMS
+
+API_PREFIX = "/v3/REST/"
+DEFAULT_LIMIT = 10
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+VIEW_CACHE_SIZE = 32
+
+
+def parse_timestamp(value: str) -> float:
+    """Seconds since the epoch of an ISO 8601 timestamp or a unix timestamp."""
+    try:
+        return float(value)
+    except ValueError:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+
+def generate_record(stream, index: int, timestamp: str) -> Dict:
+    """A minimal record of `stream` with unique key properties."""
+    record = {"ID": index + 1}
+    for key in stream.key_properties:
+        record[key] = f"https://example.com/{index}" if key == "Url" else index + 1
+    for key in stream.replication_keys:
+        record[key] = timestamp
+    return record
+
+
+def get_stream(stream_class, base_url: str, config: Optional[Dict] = None):
+    """A selected stream with its packaged schema, whose client talks to `base_url`."""
+    client = Client({
+        "api_key": "key",
+        "secret_key": "secret",
+        "start_date": "2024-12-31T00:00:00Z",
+        "base_url": base_url,
+        **(config or {}),
+    })
+    catalog = MagicMock()
+    catalog.schema.to_dict.return_value = get_schemas()[0][stream_class.tap_stream_id]
+    catalog.metadata = []
+    stream = stream_class(client=client, catalog=catalog)
+    stream.is_selected = MagicMock(return_value=True)
+    return stream
+
+
+class Dataset:
+    """
+    The records served for each REST path.
+    ~~~
+    Tables are sequences in the API's natural (ID) order; they only need
+    `len` and indexing, so a table can live on disk. `timestamp_fields` names
+    the field FromTS and ToTS filter on, for the paths that support them.
+    `timestamps` optionally holds that field of every row as epoch seconds,
+    and `ordered_fields` the fields already ascending in row order, which
+    lets windows be found by bisection and sorts be skipped.
+    """
+
+    def __init__(
+        self,
+        tables: Dict[str, Sequence[Dict]],
+        timestamp_fields: Dict[str, str],
+        timestamps: Optional[Dict[str, Sequence[float]]] = None,
+        ordered_fields: Optional[Dict[str, Set[str]]] = None,
+    ) -> None:
+        self.tables = tables
+        self.timestamp_fields = timestamp_fields
+        self.timestamps = timestamps or {}
+        self.ordered_fields = ordered_fields or {}
+
+    @classmethod
+    def from_directory(cls, directory: str) -> "Dataset":
+        """Serve the shards written by synthetic_data.write_dataset."""
+        tables, timestamp_fields, timestamps, ordered_fields = {}, {}, {}, {}
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".json"):
+                continue
+            table = ShardedTable(directory, name[:-len(".json")])
+            path = table.manifest["path"]
+            tables[path] = table
+            ordered_fields[path] = {"ID"}
+            replication_key = table.manifest["replication_key"]
+            if replication_key:
+                timestamp_fields[path] = replication_key
+                timestamps[path] = table.timestamps
+                ordered_fields[path].add(replication_key)
+        return cls(tables, timestamp_fields, timestamps, ordered_fields)
+
+    @classmethod
+    def generate(cls, records: int, start: datetime = START, interval: float = 60.0) -> "Dataset":
+        """`records` minimal records for every stream, one every `interval` seconds from `start`."""
+        timestamps = [
+            (start + timedelta(seconds=interval * i)).strftime("%Y-%m-%dT%H:%M:%SZ") for i in range(records)
+        ]
+        epochs = [parse_timestamp(timestamp) for timestamp in timestamps]
+        tables, timestamp_fields, ordered_fields = {}, {}, {}
+        for stream in STREAMS.values():
+            tables[stream.path] = [generate_record(stream, i, timestamps[i]) for i in range(records)]
+            ordered_fields[stream.path] = {"ID"}
+            if stream.replication_keys:
+                timestamp_fields[stream.path] = stream.replication_keys[0]
+                ordered_fields[stream.path].add(stream.replication_keys[0])
+        return cls(tables, timestamp_fields, {path: epochs for path in timestamp_fields}, ordered_fields)
+
+
+class FakeMailjet:
+    """
+    A threaded HTTP server answering like the Mailjet REST API.
+    ~~~
+    Every request is logged in `requests` as (path, params). `latency` is
+    added to every response and `latency_per_record` for every record in
+    it. `rate_429` and `rate_5xx` are the probabilities of answering with
+    a rate limit or a server error instead, and `rate_cut` the probability
+    of dropping the connection halfway through a page's body, all drawn
+    from a seeded generator.
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[Dataset] = None,
+        records: int = 1000,
+        latency: float = 0.0,
+        latency_per_record: float = 0.0,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        rate_cut: float = 0.0,
+        retry_after: int = 0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.dataset = dataset or Dataset.generate(records)
+        self.latency = latency
+        self.latency_per_record = latency_per_record
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.rate_cut = rate_cut
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.requests: List[Tuple[str, Dict]] = []
+        self.lock = threading.Lock()
+        self.views = OrderedDict()
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.server.fake = self
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX.rstrip('/')}"
+
+    def start(self) -> "FakeMailjet":
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-mailjet", daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread:
+            self.thread.join()
+
+    def __enter__(self) -> "FakeMailjet":
+        return self.start()
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.stop()
+
+    def draw_fault(self) -> Optional[int]:
+        """The error status to answer with, if any."""
+        with self.lock:
+            draw = self.random.random()
+        if draw < self.rate_429:
+            return 429
+        if draw < self.rate_429 + self.rate_5xx:
+            return 503
+        return None
+
+    def draw_cut(self) -> bool:
+        """Whether to drop the connection in the middle of a page."""
+        if not self.rate_cut:
+            return False
+        with self.lock:
+            return self.random.random() < self.rate_cut
+
+    def get_view(self, path: str, params: Dict) -> Sequence[int]:
+        """Indexes of the rows matching the FromTS/ToTS filter, in `Sort` order."""
+        table = self.dataset.tables[path]
+        field = self.dataset.timestamp_fields.get(path)
+        from_ts = params.get("FromTS") if field else None
+        to_ts = params.get("ToTS") if field else None
+        sort = params.get("Sort", "")
+        key = (path, from_ts, to_ts, sort)
+        with self.lock:
+            if key in self.views:
+                self.views.move_to_end(key)
+                return self.views[key]
+
+        rows = range(len(table))
+        ordered = self.dataset.ordered_fields.get(path, set())
+        if from_ts or to_ts:
+            # FromTS is exclusive like the real API, ToTS keeps windows half-open
+            low = parse_timestamp(from_ts) if from_ts else float("-inf")
+            high = parse_timestamp(to_ts) if to_ts else float("inf")
+            timestamps = self.dataset.timestamps.get(path)
+            if timestamps is not None and field in ordered:
+                rows = range(bisect_right(timestamps, low), bisect_left(timestamps, high))
+            elif timestamps is not None:
+                rows = [i for i in rows if low < timestamps[i] < high]
+            else:
+                rows = [i for i in rows if low < parse_timestamp(table[i][field]) < high]
+        if sort:
+            sort_field, _, direction = sort.partition(" ")
+            descending = direction.upper() == "DESC"
+            if sort_field in ordered:
+                rows = rows[::-1] if descending else rows
+            else:
+                rows = sorted(rows, key=lambda i: table[i].get(sort_field) or "", reverse=descending)
+
+        with self.lock:
+            self.views[key] = rows
+            if len(self.views) > VIEW_CACHE_SIZE:
+                self.views.popitem(last=False)
+        return rows
+
+    def respond(self, path: str, params: Dict) -> Tuple[int, Dict, Dict]:
+        """Status, headers and body for one request."""
+        with self.lock:
+            self.requests.append((path, params))
+        if path not in self.dataset.tables:
+            return 404, {}, {"ErrorMessage": f"Object {path} not found", "StatusCode": 404}
+
+        fault = self.draw_fault()
+        if fault == 429:
+            return 429, {"Retry-After": str(self.retry_after)}, {"ErrorMessage": "Too many requests", "StatusCode": 429}
+        if fault:
+            return fault, {}, {"ErrorMessage": "Service unavailable", "StatusCode": fault}
+
+        rows = self.get_view(path, params)
+        if str(params.get("countOnly", "0")).lower() in ("1", "true"):
+            return 200, {}, {"Count": len(rows), "Data": [], "Total": len(rows)}
+
+        limit = int(params.get("Limit", DEFAULT_LIMIT))
+        offset = int(params.get("Offset", 0))
+        table = self.dataset.tables[path]
+        data = [table[i] for i in rows[offset:offset + limit]] if limit > 0 else []
+        return 200, {}, {"Count": len(data), "Data": data, "Total": len(rows)}
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves the fake API over HTTP/1.1 keep-alive connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if not url.path.startswith(API_PREFIX):
+            self.send(404, {}, {"ErrorMessage": "Not found", "StatusCode": 404})
+            return
+        if self.headers.get("Content-Length"):
+            self.rfile.read(int(self.headers["Content-Length"]))
+        fake = self.server.fake
+        status, headers, body = fake.respond(url.path[len(API_PREFIX):].strip("/"), dict(parse_qsl(url.query)))
+        delay = fake.latency + fake.latency_per_record * len(body.get("Data") or [])
+        if delay:
+            time.sleep(delay)
+        self.send(status, headers, body)
+
+    do_POST = do_GET
+
+    def send(self, status: int, headers: Dict, body: Dict) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        if status == 200:
+            # Pages carry an ETag and are answered 304 when the client already has them
+            headers = {**headers, "ETag": f'"{hashlib.sha1(payload).hexdigest()[:16]}"'}
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                status, payload = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if status == 200 and self.server.fake.draw_cut():
+            # Announce the whole body but close the connection halfway through it
+            self.wfile.write(payload[:len(payload) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=1000, help="records per stream")
+    parser.add_argument("--data", help="directory written by synthetic_data.py, instead of generated records")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--latency-per-record", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="probability of a 429 response")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="probability of a 503 response")
+    parser.add_argument("--rate-cut", type=float, default=0.0, help="probability of a body cut short")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    fake = FakeMailjet(
+        dataset=Dataset.from_directory(args.data) if args.data else None,
+        records=args.records,
+        latency=args.latency,
+        latency_per_record=args.latency_per_record,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        rate_cut=args.rate_cut,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving {', '.join(sorted(fake.dataset.tables))} at {fake.base_url}", flush=True)
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        fake.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Seeded, schema-driven Mailjet datasets for benchmarks and load tests.
+
+Records follow `tap_mailjet/schemas/*.json`: every value has one of its
+schema's types, nullable fields are sometimes null, date-times are ISO 8601
+and key properties are unique. Key properties and the replication key are
+never null, and IDs and replication values ascend with the row number like
+Mailjet's natural order.
+
+Each stream is written as JSONL shards, each with an index of line offsets
+and of replication timestamps, so readers can reach any row through mmap
+without loading the dataset:
+
+    python tests/unittests/synthetic_data.py OUTPUT_DIR --records 1000000
+"""
+import argparse
+import json
+import mmap
+import os
+import random
+import zlib
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from tap_mailjet.schema import get_schemas
+from tap_mailjet.streams import STREAMS
+
+SHARD_RECORDS = 100000
+NULL_RATE = 0.1
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+INTERVAL_SECONDS = 60.0
+WORDS = ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet")
+
+
+class RecordGenerator:
+    """
+    Builds the rows of one stream from its JSON schema.
+    ~~~
+    Row `index` gets ID `index + 1` and a replication value `interval`
+    seconds after the previous row. The random values of a stream only
+    depend on `seed`, so the same arguments always give the same dataset.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        schema: Dict,
+        seed: int = 0,
+        start: datetime = START,
+        interval: float = INTERVAL_SECONDS,
+        null_rate: float = NULL_RATE,
+    ) -> None:
+        stream = STREAMS[stream_name]
+        self.schema = schema
+        self.key_properties = set(stream.key_properties)
+        self.replication_key = stream.replication_keys[0] if stream.replication_keys else None
+        self.random = random.Random(seed * 1000003 + zlib.crc32(stream_name.encode("utf-8")))
+        self.start = start
+        self.interval = interval
+        self.null_rate = null_rate
+
+    def timestamp(self, index: int) -> datetime:
+        return self.start + timedelta(seconds=self.interval * index)
+
+    def generate(self, index: int) -> Dict:
+        """The row at `index`."""
+        timestamp = self.timestamp(index)
+        record = {}
+        for field, schema in self.schema.get("properties", {}).items():
+            if field == "ID" or field == self.replication_key or field in self.key_properties:
+                record[field] = self.key_value(field, schema, index, timestamp)
+            else:
+                record[field] = self.value(schema, field)
+        return record
+
+    def key_value(self, field: str, schema: Dict, index: int, timestamp: datetime) -> Any:
+        """A non-null value unique to the row, for IDs, keys and the replication key."""
+        types = self.types(schema)
+        if schema.get("format") == "date-time":
+            return format_timestamp(timestamp)
+        if "integer" in types or "number" in types:
+            return index + 1
+        return f"https://example.com/{field.lower()}/{index + 1}" if field == "Url" else f"{field}-{index + 1}"
+
+    @staticmethod
+    def types(schema: Dict) -> List[str]:
+        types = schema.get("type", [])
+        return types if isinstance(types, list) else [types]
+
+    def value(self, schema: Dict, field: str = "") -> Any:
+        """A random value of the schema."""
+        types = self.types(schema)
+        if "null" in types and self.random.random() < self.null_rate:
+            return None
+        types = [typ for typ in types if typ != "null"]
+        if not types:
+            return None
+        typ = types[0] if len(types) == 1 else self.random.choice(types)
+        if typ == "object":
+            return {name: self.value(child, name) for name, child in schema.get("properties", {}).items()}
+        if typ == "array":
+            items = schema.get("items")
+            return [self.value(items) for _ in range(self.random.randint(0, 3))] if items else []
+        if typ == "integer":
+            return self.random.randint(0, 1000000)
+        if typ == "number":
+            return round(self.random.uniform(0, 1000), 2)
+        if typ == "boolean":
+            return self.random.random() < 0.5
+        if schema.get("format") == "date-time":
+            return format_timestamp(self.start + timedelta(seconds=self.random.randint(0, 365 * 86400)))
+        if "url" in field.lower():
+            return f"https://example.com/{self.random.choice(WORDS)}/{self.random.randint(0, 9999)}"
+        if "email" in field.lower():
+            return f"{self.random.choice(WORDS)}{self.random.randint(0, 99999)}@example.com"
+        return " ".join(self.random.choice(WORDS) for _ in range(self.random.randint(1, 4)))
+
+
+def format_timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def write_stream(
+    directory: str,
+    stream_name: str,
+    records: int,
+    seed: int = 0,
+    shard_records: int = SHARD_RECORDS,
+    **generator_args,
+) -> Dict:
+    """
+    Write `records` rows of `stream_name` as shards in `directory`, and
+    return the stream's manifest, also written as `<stream>.json`.
+    """
+    schema = get_schemas()[0][stream_name]
+    generator = RecordGenerator(stream_name, schema, seed, **generator_args)
+    shards = []
+    for first in range(0, records, shard_records):
+        name = f"{stream_name}-{len(shards):05d}"
+        offsets = array("Q", [0])
+        timestamps = array("d")
+        with open(os.path.join(directory, f"{name}.jsonl"), "wb") as shard:
+            for index in range(first, min(first + shard_records, records)):
+                line = json.dumps(generator.generate(index), separators=(",", ":")).encode("utf-8") + b"\n"
+                shard.write(line)
+                offsets.append(offsets[-1] + len(line))
+                timestamps.append(generator.timestamp(index).timestamp())
+        with open(os.path.join(directory, f"{name}.idx"), "wb") as index_file:
+            offsets.tofile(index_file)
+        if generator.replication_key:
+            with open(os.path.join(directory, f"{name}.ts"), "wb") as timestamp_file:
+                timestamps.tofile(timestamp_file)
+        shards.append({"name": name, "records": len(offsets) - 1})
+
+    manifest = {
+        "stream": stream_name,
+        "path": STREAMS[stream_name].path,
+        "records": records,
+        "seed": seed,
+        "replication_key": generator.replication_key,
+        "shards": shards,
+    }
+    with open(os.path.join(directory, f"{stream_name}.json"), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+def write_dataset(directory: str, records: int, seed: int = 0, streams: Optional[List[str]] = None, **kwargs) -> None:
+    """Write every stream, or the given ones, to `directory`."""
+    os.makedirs(directory, exist_ok=True)
+    for stream_name in streams or STREAMS:
+        write_stream(directory, stream_name, records, seed, **kwargs)
+
+
+class Shard:
+    """One memory-mapped shard and its line offsets."""
+
+    def __init__(self, directory: str, name: str) -> None:
+        with open(os.path.join(directory, f"{name}.jsonl"), "rb") as shard:
+            self.data = mmap.mmap(shard.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(shard.fileno()).st_size else b""
+        with open(os.path.join(directory, f"{name}.idx"), "rb") as index_file:
+            self.offsets = array("Q")
+            self.offsets.frombytes(index_file.read())
+        timestamp_path = os.path.join(directory, f"{name}.ts")
+        self.timestamps = array("d")
+        if os.path.exists(timestamp_path):
+            with open(timestamp_path, "rb") as timestamp_file:
+                self.timestamps.frombytes(timestamp_file.read())
+
+    def __getitem__(self, index: int) -> Dict:
+        return json.loads(self.data[self.offsets[index]:self.offsets[index + 1]])
+
+
+class ShardedTable(Sequence):
+    """
+    Read-only sequence over the shards of one stream.
+    ~~~
+    Rows are decoded from the memory-mapped shard on access, so only the
+    offsets and timestamps (16 bytes a row) are held in memory.
+    """
+
+    def __init__(self, directory: str, stream_name: str) -> None:
+        with open(os.path.join(directory, f"{stream_name}.json"), encoding="utf-8") as manifest_file:
+            self.manifest = json.load(manifest_file)
+        self.shards = [Shard(directory, shard["name"]) for shard in self.manifest["shards"]]
+        self.starts = []
+        total = 0
+        for shard in self.manifest["shards"]:
+            self.starts.append(total)
+            total += shard["records"]
+        self.total = total
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += self.total
+        if not 0 <= index < self.total:
+            raise IndexError(index)
+        shard = bisect_right(self.starts, index) - 1
+        return self.shards[shard][index - self.starts[shard]]
+
+    def __iter__(self) -> Iterator[Dict]:
+        for shard, info in zip(self.shards, self.manifest["shards"]):
+            for index in range(info["records"]):
+                yield shard[index]
+
+    @property
+    def timestamps(self) -> Sequence[float]:
+        """Replication timestamps of every row, in row order."""
+        timestamps = array("d")
+        for shard in self.shards:
+            timestamps.extend(shard.timestamps)
+        return timestamps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("directory")
+    parser.add_argument("--records", type=int, default=100000, help="records per stream")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-records", type=int, default=SHARD_RECORDS)
+    parser.add_argument("--streams", nargs="*", help="streams to write, all by default")
+    args = parser.parse_args()
+    write_dataset(args.directory, args.records, args.seed, args.streams, shard_records=args.shard_records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Unit tests for the asyncio transport - error mapping, backoff and concurrency limit."""
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, AsyncMock
+from parameterized import parameterized
+from tap_mailjet.async_transport import AsyncTransport, aiohttp, build_response
+from tap_mailjet.client import Client
+from tap_mailjet.exceptions import *
+
+
+default_config = {
+    "api_key": "test_key",
+    "secret_key": "test_secret",
+    "start_date": "2025-01-01T00:00:00Z",
+    "async_transport": True,
+    "async_concurrency": 3
+}
+
+
+def json_response(status_code, payload):
+    """Build a response object the way the transport does."""
+    return build_response(status_code, {}, json.dumps(payload).encode(), "https://api.example.com")
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class TestAsyncTransport(unittest.TestCase):
+    """Test AsyncTransport request handling."""
+
+    def setUp(self):
+        """Set up the client with the async transport enabled."""
+        self.client = Client(default_config)
+        self.transport = self.client._async_transport
+
+    def tearDown(self):
+        """Stop the event loop."""
+        self.transport.close()
+
+    def test_transport_enabled_from_config(self):
+        """Test that async_transport creates the transport with the configured limit."""
+        self.assertIsInstance(self.transport, AsyncTransport)
+        self.assertEqual(self.transport.concurrency, 3)
+
+    def test_make_request_keeps_contract(self):
+        """Test that make_request returns the decoded JSON body."""
+        send = AsyncMock(return_value=json_response(200, {"Data": [{"ID": 1}]}))
+        with patch.object(self.transport, "_send", send):
+            result = self.client.make_request("GET", None, {"Limit": 10}, path="message")
+
+        self.assertEqual(result, {"Data": [{"ID": 1}]})
+        args, kwargs = send.call_args
+        self.assertEqual(args, ("GET", "https://api.mailjet.com/v3/REST/message"))
+        self.assertEqual(kwargs["params"], {"Limit": 10})
+        self.assertEqual(kwargs["auth"], ("test_key", "test_secret"))
+        self.assertNotIn("data", kwargs)
+
+    @parameterized.expand([
+        ["400 error", 400, MailjetBadRequestError],
+        ["401 error", 401, MailjetUnauthorizedError],
+        ["404 error", 404, MailjetNotFoundError],
+    ])
+    def test_4xx_errors_no_retry(self, test_name, status_code, error):
+        """Test that 4xx errors are mapped and raised without retry."""
+        send = AsyncMock(return_value=json_response(status_code, {}))
+        with patch.object(self.transport, "_send", send):
+            with self.assertRaises(error):
+                self.client.make_request("GET", "https://api.example.com/resource")
+
+        self.assertEqual(send.call_count, 1)
+
+    @parameterized.expand([
+        ["429 error", 429, MailjetRateLimitError],
+        ["500 error", 500, MailjetInternalServerError],
+        ["unmapped 5xx", 507, MailjetBackoffError],
+    ])
+    def test_retryable_errors_back_off(self, test_name, status_code, error):
+        """Test that retryable errors are retried 5 times."""
+        send = AsyncMock(return_value=json_response(status_code, {}))
+        with patch.object(self.transport, "_send", send), \
+                patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with self.assertRaises(error):
+                self.client.make_request("GET", "https://api.example.com/resource")
+
+        self.assertEqual(send.call_count, 5)
+        self.assertTrue(mock_sleep.called)
+
+    def test_unsupported_method(self):
+        """Test that methods other than GET and POST are rejected."""
+        with self.assertRaises(ValueError):
+            self.client.make_request("DELETE", "https://api.example.com/resource")
+
+    def test_concurrency_limit(self):
+        """Test that make_requests never exceeds async_concurrency in-flight requests."""
+        in_flight = {"current": 0, "max": 0}
+
+        async def send(method, endpoint, params=None, **kwargs):
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return json_response(200, {"Offset": params["Offset"]})
+
+        request_kwargs = [
+            {"method": "GET", "endpoint": "https://api.example.com/message", "params": {"Offset": i}}
+            for i in range(12)
+        ]
+        with patch.object(self.transport, "_send", side_effect=send):
+            responses = list(self.client.make_requests(request_kwargs, 12))
+
+        self.assertEqual([r["Offset"] for r in responses], list(range(12)))
+        self.assertEqual(in_flight["max"], 3)
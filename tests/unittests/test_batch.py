@@ -0,0 +1,88 @@
+"""Unit tests for BATCH output mode."""
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from tap_mailjet import batch, emitter
+from tap_mailjet.batch import BatchFileWriter, BatchOutput
+
+
+def read_batch_file(uri):
+    """Read the records of a gzip batch file from its manifest URI."""
+    with gzip.open(uri[len("file://"):], "rt") as file:
+        return [json.loads(line) for line in file]
+
+
+class TestBatchFileWriter(unittest.TestCase):
+    """Test file rotation and BATCH messages."""
+
+    def setUp(self):
+        """Create a directory for batch files."""
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the batch files."""
+        self.directory.cleanup()
+
+    def test_rotate_on_rows(self):
+        """Test that a file is finished every max_rows records."""
+        writer = BatchFileWriter("contacts", self.directory.name, max_rows=3)
+
+        messages = [writer.write({"ID": i}) for i in range(7)]
+        messages.append(writer.finish())
+        messages = [message.asdict() for message in messages if message]
+
+        self.assertEqual(len(messages), 3)
+        self.assertEqual(messages[0]["encoding"], {"format": "jsonl", "compression": "gzip"})
+        records = [record for message in messages for record in read_batch_file(message["manifest"][0])]
+        self.assertEqual(records, [{"ID": i} for i in range(7)])
+
+    def test_rotate_on_bytes(self):
+        """Test that a file is finished once it holds max_bytes of JSON."""
+        writer = BatchFileWriter("contacts", self.directory.name, max_bytes=50)
+
+        message = writer.write({"ID": 1, "payload": "x" * 100})
+
+        self.assertIsNotNone(message)
+        self.assertIsNone(writer.finish())
+
+    def test_unknown_compression(self):
+        """Test that an unsupported compression is rejected."""
+        with self.assertRaises(ValueError):
+            BatchOutput({"batch_compression": "lz4"}, self.directory.name)
+
+    @patch.object(batch, "zstandard", None)
+    def test_zstd_requires_package(self):
+        """Test that zstd compression needs the zstandard package."""
+        with self.assertRaises(ValueError):
+            BatchOutput({"batch_compression": "zstd"}, self.directory.name)
+
+
+class TestBatchEmitter(unittest.TestCase):
+    """Test BATCH output through the emitter."""
+
+    def setUp(self):
+        """Enable BATCH output for the contacts stream."""
+        self.directory = tempfile.TemporaryDirectory()
+        emitter.configure({"batch_output_dir": self.directory.name, "batch_streams": "contacts"})
+
+    def tearDown(self):
+        """Restore RECORD output for other tests."""
+        emitter.configure({})
+        self.directory.cleanup()
+
+    def test_batch_written_before_state(self):
+        """Test that records go to files, announced by a BATCH message before the next STATE."""
+        output = io.StringIO()
+        with patch("sys.stdout", output):
+            emitter.write_record("contacts", {"ID": 1})
+            emitter.write_record("contacts", {"ID": 2})
+            emitter.write_record("messages", {"ID": 3})
+            emitter.write_state({"bookmarks": {}})
+
+        messages = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([message["type"] for message in messages], ["RECORD", "BATCH", "STATE"])
+        self.assertEqual(messages[0]["stream"], "messages")
+        self.assertEqual(read_batch_file(messages[1]["manifest"][0]), [{"ID": 1}, {"ID": 2}])
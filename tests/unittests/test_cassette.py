@@ -0,0 +1,114 @@
+"""Unit tests for recording and replaying response pages."""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet.cassette import Cassette, request_key
+from tap_mailjet.exceptions import MailjetCassetteMissError
+from tap_mailjet.streams.messages import Messages
+from fake_mailjet import FakeMailjet, get_stream
+
+RECORDS = 250
+
+
+class TestCassette(unittest.TestCase):
+    """Test the page store."""
+
+    def setUp(self):
+        """Create an empty cassette directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    @parameterized.expand([
+        ["same_request", ("GET", "https://api.mailjet.com/v3/REST/message", {"Limit": 100}), True],
+        ["other_host", ("GET", "http://127.0.0.1:8080/v3/REST/message/", {"Limit": "100"}), True],
+        ["other_params", ("GET", "https://api.mailjet.com/v3/REST/message", {"Limit": 100, "Offset": 100}), False],
+        ["other_method", ("POST", "https://api.mailjet.com/v3/REST/message", {"Limit": 100}), False],
+    ])
+    def test_request_key(self, name, request, expected):
+        """Test which requests share a key."""
+        key = request_key("GET", "https://api.mailjet.com/v3/REST/message", {"Limit": 100})
+        self.assertEqual(request_key(*request) == key, expected)
+
+    def test_segments(self):
+        """Test that segments rotate, the last recording wins and a cut index line is ignored."""
+        cassette = Cassette(self.directory.name, "record", segment_bytes=20)
+        cassette.record("a", b'{"Data": [1]}')
+        cassette.record("b", b'{"Data": [2]}')
+        cassette.record("a", b'{"Data": [3]}')
+        cassette.close()
+        with open(os.path.join(self.directory.name, "index.jsonl"), "a", encoding="utf-8") as index_file:
+            index_file.write('{"key": "c", "segm')
+
+        cassette = Cassette(self.directory.name, "replay")
+        self.addCleanup(cassette.close)
+
+        self.assertEqual(cassette.get("a"), {"Data": [3]})
+        self.assertEqual(cassette.get("b"), {"Data": [2]})
+        self.assertEqual(sorted(os.listdir(self.directory.name)), [
+            "clock.json", "index.jsonl", "segment-00000.bin", "segment-00001.bin", "segment-00002.bin"
+        ])
+        with self.assertRaises(MailjetCassetteMissError):
+            cassette.get("c")
+
+    @parameterized.expand([
+        ["no_mode", {"cassette_dir": "/tmp"}, None],
+        ["no_directory", {"cassette_mode": "record"}, ValueError],
+        ["unknown_mode", {"cassette_mode": "rewind", "cassette_dir": "/tmp"}, ValueError],
+    ])
+    def test_from_config(self, name, config, expected):
+        """Test the cassette options."""
+        if expected is None:
+            self.assertIsNone(Cassette.from_config(config))
+        else:
+            with self.assertRaises(expected):
+                Cassette.from_config(config)
+
+
+class TestCassetteSync(unittest.TestCase):
+    """Test a recorded sync replayed without the API."""
+
+    def setUp(self):
+        """Capture the written records."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.mock_write_record = patch("tap_mailjet.streams.abstracts.write_record").start()
+        patch("tap_mailjet.checkpoint.write_state").start()
+        self.addCleanup(patch.stopall)
+
+    def sync(self, base_url, config):
+        """Sync messages and return the written records and the final state."""
+        self.mock_write_record.reset_mock()
+        stream = get_stream(Messages, base_url, {"cassette_dir": self.directory.name, **config})
+        state = {}
+        with stream.client:
+            stream.sync(state, Transformer())
+        return [c[0][1] for c in self.mock_write_record.call_args_list], state
+
+    @parameterized.expand([
+        ["pages", {}],
+        ["streamed_pages", {"stream_pages": True}],
+        ["concurrent_pages", {"page_concurrency": 3}],
+        ["windowed", {"incremental_window_days": 30}],
+    ])
+    def test_replay(self, name, config):
+        """Test that a replay writes the recorded records and state with no request sent."""
+        with FakeMailjet(records=RECORDS) as fake:
+            recorded = self.sync(fake.base_url, {"cassette_mode": "record", **config})
+
+        with patch("requests.Session.request") as mock_request:
+            replayed = self.sync("http://127.0.0.1:9/v3/REST", {"cassette_mode": "replay", **config})
+
+        self.assertEqual(len(recorded[0]), RECORDS)
+        self.assertEqual(replayed, recorded)
+        mock_request.assert_not_called()
+
+    def test_replay_miss(self):
+        """Test that a request missing from the cassette fails the replay."""
+        with FakeMailjet(records=RECORDS) as fake:
+            self.sync(fake.base_url, {"cassette_mode": "record", "page_sizes": {"messages": 100}})
+
+        with self.assertRaises(MailjetCassetteMissError):
+            self.sync("http://127.0.0.1:9/v3/REST", {"cassette_mode": "replay", "page_sizes": {"messages": 50}})
@@ -0,0 +1,135 @@
+"""Unit tests for periodic STATE checkpoints."""
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet.checkpoint import Checkpointer
+from tap_mailjet.helpers import format_datetime
+from tap_mailjet.streams.messages import Messages
+
+
+class TestCheckpointer(unittest.TestCase):
+    """Test the record count and wall clock policy."""
+
+    @patch("tap_mailjet.checkpoint.write_state")
+    def test_due_on_record_count(self, mock_write_state):
+        """Test that a checkpoint is due every `records` records."""
+        checkpointer = Checkpointer(records=3, seconds=3600)
+
+        self.assertEqual([checkpointer.tick() for _ in range(3)], [False, False, True])
+
+    @patch("tap_mailjet.checkpoint.time.monotonic")
+    def test_due_on_time(self, mock_monotonic):
+        """Test that a checkpoint is due once `seconds` have passed with records pending."""
+        mock_monotonic.return_value = 100.0
+        checkpointer = Checkpointer(records=1000, seconds=30)
+
+        self.assertFalse(checkpointer.due())
+        mock_monotonic.return_value = 200.0
+        self.assertFalse(checkpointer.due())
+        self.assertTrue(checkpointer.tick())
+
+    @parameterized.expand([
+        ["moved", ["a", "b"], 2],
+        ["unchanged", ["a", "a"], 1],
+    ])
+    @patch("tap_mailjet.checkpoint.write_state")
+    def test_state_only_when_bookmark_moved(self, name, markers, expected, mock_write_state):
+        """Test that STATE is only written when the bookmark changed."""
+        checkpointer = Checkpointer(records=1, seconds=3600)
+        for marker in markers:
+            checkpointer.tick()
+            checkpointer.write({}, marker)
+
+        self.assertEqual(mock_write_state.call_count, expected)
+        self.assertFalse(checkpointer.due())
+
+
+class TestIncrementalCheckpoints(unittest.TestCase):
+    """Test STATE emission during incremental syncs."""
+
+    def setUp(self):
+        """Set up a messages stream and records spread over the last three days."""
+        self.now = datetime.now(timezone.utc)
+        self.config = {
+            "start_date": format_datetime(self.now - timedelta(days=3)),
+            "checkpoint_records": 2,
+        }
+        client = MagicMock()
+        client.config = self.config
+        client.now.side_effect = lambda: datetime.now(timezone.utc)
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {
+            "type": "object",
+            "properties": {"ID": {"type": "integer"}, "ArrivedAt": {"type": "string", "format": "date-time"}}
+        }
+        catalog.metadata = []
+        self.stream = Messages(client=client, catalog=catalog)
+        self.stream.is_selected = MagicMock(return_value=True)
+        self.records = [
+            {"ID": i, "ArrivedAt": format_datetime(self.now - timedelta(hours=60 - 12 * i))}
+            for i in range(5)
+        ]
+
+    def capture_states(self, mock_write_state):
+        """Record the bookmark of every STATE written, as it was when written."""
+        states = []
+        mock_write_state.side_effect = lambda state: states.append(state["bookmarks"]["messages"]["ArrivedAt"])
+        return states
+
+    @patch("tap_mailjet.checkpoint.write_state")
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_unsorted_pages_not_checkpointed(self, mock_write_record, mock_write_state):
+        """Test that a running maximum over unsorted pages is never emitted mid-stream."""
+        self.stream.sort_by_replication_key = False
+        self.stream.get_records = MagicMock(return_value=iter(self.records))
+
+        self.stream.sync({}, Transformer())
+
+        mock_write_state.assert_not_called()
+
+    @patch("tap_mailjet.checkpoint.write_state")
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_sorted_pages_checkpointed(self, mock_write_record, mock_write_state):
+        """Test that sorted pages emit STATE every checkpoint_records records."""
+        self.stream.get_records = MagicMock(return_value=iter(self.records))
+        states = self.capture_states(mock_write_state)
+
+        self.stream.sync({}, Transformer())
+
+        self.assertEqual(states, [
+            format_datetime(self.now - timedelta(hours=48)),
+            format_datetime(self.now - timedelta(hours=24)),
+        ])
+
+    @parameterized.expand([
+        ["unsorted", False, 3],
+        ["sorted", True, 5],
+    ])
+    @patch("tap_mailjet.checkpoint.write_state")
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_windowed_checkpoints(self, name, sort, expected, mock_write_record, mock_write_state):
+        """Test that windowed syncs emit STATE after complete windows, or per record when sorted."""
+        self.stream.sort_by_replication_key = sort
+        self.config["incremental_window_days"] = 1
+        self.config["checkpoint_records"] = 1
+
+        def get_window_records(window):
+            return [record for record in self.records if window[0] <= datetime.fromisoformat(
+                record["ArrivedAt"].replace("Z", "+00:00")) < window[1]]
+
+        self.stream.get_window_records = MagicMock(side_effect=get_window_records)
+        states = self.capture_states(mock_write_state)
+
+        self.stream.sync({}, Transformer())
+
+        self.assertEqual(states, sorted(states))
+        self.assertEqual(len(states), expected)
+
+    def test_sort_param(self):
+        """Test that incremental pages are requested sorted on the replication key."""
+        self.stream.set_incremental_params(self.config["start_date"])
+
+        self.assertEqual(self.stream.params["Sort"], "ArrivedAt")
+        self.assertTrue(self.stream.sorted_by_replication_key())
@@ -1,10 +1,10 @@
 """Unit tests for Client class - initialization, methods, backoff, and retry logic."""
 import unittest
 import requests
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from parameterized import parameterized
 from requests.exceptions import Timeout, ConnectionError, ChunkedEncodingError
-from tap_mailjet.client import Client
+from tap_mailjet.client import MAX_TRIES, Client
 from tap_mailjet.exceptions import *
 
 
@@ -162,6 +162,45 @@ class TestBackoffRetry(unittest.TestCase):
         self.assertEqual(mock_request.call_count, 3)
         self.assertTrue(mock_sleep.called)
 
+    @patch("time.sleep")
+    def test_rate_limit_honours_retry_after(self, mock_sleep):
+        """Test that a 429 waits for Retry-After instead of an exponential delay."""
+        responses = [
+            MockResponse(429, headers={"Retry-After": "7"}),
+            MockResponse(200, text={"Data": []}, raise_error=False)
+        ]
+
+        with patch.object(self.client._session, "request", side_effect=responses) as mock_request:
+            result = self.client._Client__make_request("GET", "https://api.mailjet.com/v3/REST/message")
+
+        self.assertEqual(result, {"Data": []})
+        self.assertEqual(mock_request.call_count, 2)
+        waits = [c[0][0] for c in mock_sleep.call_args_list if c[0][0] > 0]
+        self.assertEqual(len(waits), 1)
+        self.assertAlmostEqual(waits[0], 7, places=1)
+
+    @patch("time.sleep")
+    def test_rate_limits_share_retry_budget(self, mock_sleep):
+        """Test that 429s and 5xx errors draw from one budget of MAX_TRIES attempts."""
+        responses = [MockResponse(429), MockResponse(500)] * MAX_TRIES
+
+        with patch.object(self.client._session, "request", side_effect=responses) as mock_request:
+            with self.assertRaises(MailjetRateLimitError):
+                self.client._Client__make_request("GET", "https://api.mailjet.com/v3/REST/message")
+
+        self.assertEqual(mock_request.call_count, MAX_TRIES)
+
+    @patch("time.sleep")
+    def test_retried_rate_limit_not_logged_as_error(self, mock_sleep):
+        """Test that a 429 followed by a success logs no error."""
+        responses = [MockResponse(429), MockResponse(200, text={"Data": []}, raise_error=False)]
+
+        with patch.object(self.client._session, "request", side_effect=responses), \
+                self.assertLogs("backoff", level="DEBUG") as logs:
+            self.client._Client__make_request("GET", "https://api.mailjet.com/v3/REST/message")
+
+        self.assertEqual([record.levelname for record in logs.records], ["INFO"])
+
     @patch("time.sleep")
     def test_exponential_backoff_timing(self, mock_sleep):
         """Test that backoff uses exponential timing (factor=2)."""
@@ -241,3 +280,70 @@ class TestBackoffRetry(unittest.TestCase):
             # Should NOT retry (not a 5xx error)
             self.assertEqual(mock_request.call_count, 1)
             self.assertFalse(mock_sleep.called)
+
+
+class TestConcurrentRequests(unittest.TestCase):
+    """Test make_requests fan-out."""
+
+    def setUp(self):
+        """Set up the client with default configuration."""
+        self.client = Client(default_config)
+
+    def test_responses_keep_request_order(self):
+        """Test that responses are yielded in request order."""
+        def make_request(method, endpoint, params=None, **kwargs):
+            return {"Offset": params["Offset"]}
+
+        request_kwargs = [{"method": "GET", "endpoint": "url", "params": {"Offset": i}} for i in range(20)]
+        with patch.object(self.client, "make_request", side_effect=make_request):
+            responses = list(self.client.make_requests(request_kwargs, 4))
+
+        self.assertEqual([r["Offset"] for r in responses], list(range(20)))
+
+    def test_error_is_raised_to_caller(self):
+        """Test that a failing request surfaces its exception."""
+        def make_request(method, endpoint, params=None, **kwargs):
+            if params["Offset"] == 3:
+                raise MailjetNotFoundError("missing")
+            return {}
+
+        request_kwargs = [{"method": "GET", "endpoint": "url", "params": {"Offset": i}} for i in range(6)]
+        with patch.object(self.client, "make_request", side_effect=make_request):
+            with self.assertRaises(MailjetNotFoundError):
+                list(self.client.make_requests(request_kwargs, 2))
+
+
+class TestStreamedRequests(unittest.TestCase):
+    """Test stream_request decoding records from the response body."""
+
+    @patch("requests.Session.request")
+    def test_records_decoded_from_chunks(self, mock_request):
+        """Test that records are decoded from the body chunks and the response is closed."""
+        body = b'{"Count": 2, "Data": [{"ID": 1}, {"ID": 2}], "Total": 2}'
+        response = MockResponse(200, raise_error=False)
+        response.iter_content = lambda chunk_size: [body[i:i + 5] for i in range(0, len(body), 5)]
+        response.close = MagicMock()
+        mock_request.return_value = response
+
+        client = Client(default_config)
+        records = list(client.stream_request("GET", None, "Data", {"Limit": 2}, path="contact"))
+
+        self.assertEqual(records, [{"ID": 1}, {"ID": 2}])
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+        response.close.assert_called_once()
+
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_errors_retried_before_streaming(self, mock_request, mock_sleep):
+        """Test that an error response is retried like any other request."""
+        body = b'{"Data": [{"ID": 1}]}'
+        success = MockResponse(200, raise_error=False)
+        success.iter_content = lambda chunk_size: [body]
+        success.close = MagicMock()
+        mock_request.side_effect = [MockResponse(500), success]
+
+        client = Client(default_config)
+        records = list(client.stream_request("GET", None, "Data", path="contact"))
+
+        self.assertEqual(records, [{"ID": 1}])
+        self.assertEqual(mock_request.call_count, 2)
@@ -0,0 +1,113 @@
+"""Unit tests for de-duplicating records at the bookmark instant."""
+import unittest
+from unittest.mock import patch, MagicMock
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet.dedupe import BoundaryKeys
+from tap_mailjet.streams.messages import Messages
+
+BOOKMARK = "2025-01-03T00:00:00.000000Z"
+
+
+class TestBoundaryKeys(unittest.TestCase):
+    """Test how the keys at the bookmark are tracked and applied."""
+
+    def test_add_tracks_latest_instant(self):
+        """Test that only keys at the highest replication value are kept."""
+        boundary = BoundaryKeys(["ID"], "ArrivedAt", BOOKMARK)
+        boundary.add(BOOKMARK, {"ID": 1})
+        boundary.add("2025-01-04T00:00:00.000000Z", {"ID": 2})
+        boundary.add("2025-01-04T00:00:00.000000Z", {"ID": 3})
+        boundary.add("2025-01-02T00:00:00.000000Z", {"ID": 4})
+
+        self.assertEqual(boundary.value, "2025-01-04T00:00:00.000000Z")
+        self.assertEqual(boundary.keys, {(2,), (3,)})
+
+    def test_overflow_stores_no_keys(self):
+        """Test that more keys than the limit are dropped rather than stored partially."""
+        boundary = BoundaryKeys(["ID"], "ArrivedAt", BOOKMARK, limit=2)
+        for i in range(3):
+            boundary.add(BOOKMARK, {"ID": i})
+
+        self.assertEqual(boundary.to_state(), {"value": BOOKMARK, "keys": None})
+
+    @parameterized.expand([
+        ["same_instant", {"value": BOOKMARK, "keys": [[1]]}, [2, 3]],
+        ["other_instant", {"value": "2025-01-02T00:00:00.000000Z", "keys": [[1]]}, [1, 2, 3]],
+        ["overflowed", {"value": BOOKMARK, "keys": None}, [1, 2, 3]],
+        ["missing", None, [1, 2, 3]],
+    ])
+    def test_filter(self, name, saved, expected):
+        """Test that saved keys only drop rows at the same replication value."""
+        boundary = BoundaryKeys(["ID"], "ArrivedAt", BOOKMARK, saved)
+        records = [
+            {"ID": 1, "ArrivedAt": "2025-01-03T00:00:00Z"},
+            {"ID": 2, "ArrivedAt": "2025-01-03T00:00:00Z"},
+            {"ID": 3, "ArrivedAt": "2025-01-04T00:00:00Z"},
+        ]
+
+        self.assertEqual([record["ID"] for record in boundary.filter(records)], expected)
+
+    def test_filter_while_adding(self):
+        """Test that rows of the previous run's instant are dropped after a newer row was added."""
+        boundary = BoundaryKeys(["ID"], "ArrivedAt", BOOKMARK, {"value": BOOKMARK, "keys": [[1], [2]]})
+        records = [
+            {"ID": 3, "ArrivedAt": "2025-01-04T00:00:00Z"},
+            {"ID": 1, "ArrivedAt": "2025-01-03T00:00:00Z"},
+            {"ID": 2, "ArrivedAt": "2025-01-03T00:00:00Z"},
+        ]
+
+        written = []
+        for record in boundary.filter(records):
+            written.append(record["ID"])
+            boundary.add("2025-01-04T00:00:00.000000Z", record)
+
+        self.assertEqual(written, [3])
+        self.assertEqual(boundary.value, "2025-01-04T00:00:00.000000Z")
+
+
+class TestBoundaryDedupeSync(unittest.TestCase):
+    """Test that consecutive incremental runs do not re-emit boundary rows."""
+
+    def setUp(self):
+        """Set up a messages stream."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z"}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {
+            "type": "object",
+            "properties": {"ID": {"type": "integer"}, "ArrivedAt": {"type": "string", "format": "date-time"}}
+        }
+        catalog.metadata = []
+        self.stream = Messages(client=client, catalog=catalog)
+        self.stream.is_selected = MagicMock(return_value=True)
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_second_run_skips_boundary_rows(self, mock_write_record):
+        """Test that rows at the bookmark are emitted once, while new rows at the same second are not lost."""
+        first_run = [
+            {"ID": 1, "ArrivedAt": "2025-01-02T00:00:00Z"},
+            {"ID": 2, "ArrivedAt": "2025-01-03T00:00:00Z"},
+            {"ID": 3, "ArrivedAt": "2025-01-03T00:00:00Z"},
+        ]
+        # The FromTS overlap returns the boundary rows again, with a late row at the same second
+        second_run = first_run[1:] + [
+            {"ID": 4, "ArrivedAt": "2025-01-03T00:00:00Z"},
+            {"ID": 5, "ArrivedAt": "2025-01-04T00:00:00Z"},
+        ]
+        state = {}
+
+        self.stream.get_records = MagicMock(return_value=iter(first_run))
+        self.stream.sync(state, Transformer())
+        self.assertEqual(
+            state["bookmarks"]["messages"]["boundary_keys"]["value"],
+            state["bookmarks"]["messages"]["ArrivedAt"]
+        )
+
+        mock_write_record.reset_mock()
+        self.stream.get_records = MagicMock(return_value=iter(second_run))
+        self.stream.sync(state, Transformer())
+
+        written = [c[0][1]["ID"] for c in mock_write_record.call_args_list]
+        self.assertEqual(written, [4, 5])
+        self.assertEqual(state["bookmarks"]["messages"]["boundary_keys"]["keys"], [[5]])
@@ -0,0 +1,144 @@
+"""Sync tests against the local Mailjet stand-in server."""
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet.client import MAX_TRIES
+from tap_mailjet.exceptions import MailjetStreamInterruptedError
+from tap_mailjet.streams.contacts import Contacts
+from tap_mailjet.streams.messages import Messages
+from fake_mailjet import FakeMailjet, get_stream
+
+RECORDS = 250
+
+
+class TestFakeMailjetSync(unittest.TestCase):
+    """Test pagination and filtering end to end over HTTP."""
+
+    def setUp(self):
+        """Start a fake server with a few pages of every stream, and capture the output."""
+        self.fake = FakeMailjet(records=RECORDS).start()
+        self.addCleanup(self.fake.stop)
+        self.mock_write_record = patch("tap_mailjet.streams.abstracts.write_record").start()
+        patch("tap_mailjet.checkpoint.write_state").start()
+        self.addCleanup(patch.stopall)
+
+    def written_ids(self):
+        """IDs of the records written."""
+        return [c[0][1]["ID"] for c in self.mock_write_record.call_args_list]
+
+    @parameterized.expand([
+        ["serial", {}],
+        ["streamed_pages", {"stream_pages": True}],
+        ["windowed", {"incremental_window_days": 30}],
+        ["concurrent_pages", {"page_concurrency": 3}],
+    ])
+    def test_incremental(self, name, config):
+        """Test that every record is synced once, in order, whatever the paging mode."""
+        stream = get_stream(Messages, self.fake.base_url, config)
+        state = {}
+
+        stream.sync(state, Transformer())
+
+        self.assertEqual(self.written_ids(), list(range(1, RECORDS + 1)))
+        self.assertTrue(state["bookmarks"]["messages"]["ArrivedAt"].startswith("2025-01-01T04:09:00"))
+
+    @parameterized.expand([
+        ["serial", {}],
+        ["planned", {"window_target_records": 40}],
+    ])
+    def test_windows_inside_data(self, name, config):
+        """Test that windows ending between rows write every row once."""
+        stream = get_stream(Messages, self.fake.base_url, {"incremental_window_days": 60.5 / 86400, **config})
+        state = {"bookmarks": {"messages": {"ArrivedAt": "2025-01-01T00:00:00.000000Z"}}}
+
+        # End the sync just after the data, rather than running windows up to now
+        with patch("tap_mailjet.client.Client.now", return_value=datetime(2025, 1, 1, 4, 15, tzinfo=timezone.utc)):
+            stream.sync(state, Transformer())
+
+        self.assertEqual(self.written_ids(), list(range(1, RECORDS + 1)))
+
+    def test_incremental_from_bookmark(self):
+        """Test that FromTS only returns records after the bookmark, with the boundary row once."""
+        stream = get_stream(Messages, self.fake.base_url)
+        state = {"bookmarks": {"messages": {"ArrivedAt": "2025-01-01T04:00:00.000000Z"}}}
+
+        stream.sync(state, Transformer())
+
+        self.assertEqual(self.written_ids(), list(range(241, RECORDS + 1)))
+        self.assertEqual(self.fake.requests[0][1]["FromTS"], "2025-01-01T03:59:59.000000Z")
+
+    def test_full_table_cursor(self):
+        """Test a full-table stream paged in ID order."""
+        stream = get_stream(Contacts, self.fake.base_url, {"cursor_pagination": True})
+
+        stream.sync({}, Transformer())
+
+        self.assertEqual(self.written_ids(), list(range(1, RECORDS + 1)))
+        self.assertTrue(all(params["Sort"] == "ID" for _, params in self.fake.requests))
+
+
+class TestFakeMailjetFaults(unittest.TestCase):
+    """Test the client's retries against injected errors."""
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_rate_limits_retried(self, mock_write_record):
+        """Test that injected 429s are retried until every page is served."""
+        with FakeMailjet(records=RECORDS, rate_429=0.3, seed=7) as fake:
+            stream = get_stream(Contacts, fake.base_url)
+            stream.sync({}, Transformer())
+            statuses = len(fake.requests)
+
+        self.assertEqual(mock_write_record.call_count, RECORDS)
+        self.assertGreater(statuses, 3)
+
+    @patch("time.sleep")
+    def test_server_errors_retried(self, mock_sleep):
+        """Test that injected 5xx responses go through the backoff retries."""
+        with FakeMailjet(records=10, rate_5xx=0.5, seed=1) as fake:
+            client = get_stream(Contacts, fake.base_url).client
+            response = client.make_request("GET", f"{fake.base_url}/contact", {"Limit": 10})
+
+        self.assertEqual(len(response["Data"]), 10)
+        self.assertTrue(mock_sleep.called)
+
+    @patch("time.sleep")
+    @patch("tap_mailjet.client.STREAM_CHUNK_SIZE", 256)
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_cut_bodies_resumed(self, mock_write_record, mock_sleep):
+        """Test that streamed pages dropped mid-body are resumed after the records already read."""
+        with FakeMailjet(records=RECORDS, rate_cut=0.3, seed=2) as fake:
+            stream = get_stream(Messages, fake.base_url, {"stream_pages": True})
+            stream.sync({}, Transformer())
+            resumed = [params for _, params in fake.requests if int(params["Offset"]) % stream.page_size]
+
+        self.assertEqual([c[0][1]["ID"] for c in mock_write_record.call_args_list], list(range(1, RECORDS + 1)))
+        self.assertTrue(resumed)
+        self.assertTrue(all(int(p["Offset"]) + int(p["Limit"]) == int(p["Offset"]) // 100 * 100 + 100 for p in resumed))
+
+    @patch("time.sleep")
+    def test_cut_bodies_give_up(self, mock_sleep):
+        """Test that a page cut short on every try fails the sync after the client's retries."""
+        with FakeMailjet(records=RECORDS, rate_cut=1.0) as fake:
+            stream = get_stream(Messages, fake.base_url, {"stream_pages": True})
+            with self.assertRaises(MailjetStreamInterruptedError):
+                stream.sync({}, Transformer())
+
+        self.assertEqual(mock_sleep.call_count, MAX_TRIES - 1)
+
+    def test_unknown_path(self):
+        """Test that paths the API does not have answer 404."""
+        with FakeMailjet(records=1) as fake:
+            status, _, _ = fake.respond("nothing", {})
+
+        self.assertEqual(status, 404)
+
+    def test_count_only(self):
+        """Test countOnly with a FromTS/ToTS window."""
+        with FakeMailjet(records=100) as fake:
+            _, _, body = fake.respond("message", {
+                "countOnly": "1", "FromTS": "2025-01-01T00:09:59Z", "ToTS": "2025-01-01T00:20:00Z"
+            })
+
+        self.assertEqual(body["Total"], 10)
@@ -0,0 +1,103 @@
+"""Unit tests for raw record filtering before the transform."""
+import unittest
+from unittest.mock import patch, MagicMock
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet.filters import RecordFilter, field_predicate, replication_cutoff
+from tap_mailjet.streams.contacts import Contacts
+from tap_mailjet.streams.messages import Messages
+
+
+class TestPredicates(unittest.TestCase):
+    """Test the raw record predicates."""
+
+    @parameterized.expand([
+        ["after", {"ArrivedAt": "2025-01-04T00:00:00Z"}, True],
+        ["at", {"ArrivedAt": "2025-01-03T00:00:00.000000Z"}, True],
+        ["offset_after", {"ArrivedAt": "2025-01-03T01:00:00+02:00"}, False],
+        ["before", {"ArrivedAt": "2025-01-02T23:59:59Z"}, False],
+        ["missing", {}, True],
+        ["unparseable", {"ArrivedAt": "soon"}, True],
+    ])
+    def test_replication_cutoff(self, name, record, expected):
+        """Test that the cutoff compares values the way the transformed record would."""
+        predicate = replication_cutoff("ArrivedAt", "2025-01-03T00:00:00.000000Z")
+
+        self.assertEqual(predicate(record), expected)
+
+    @parameterized.expand([
+        ["single_value", "sent", {"Status": "sent"}, True],
+        ["list", ["sent", "opened"], {"Status": "opened"}, True],
+        ["other_value", ["sent"], {"Status": "bounce"}, False],
+        ["missing", "sent", {}, False],
+    ])
+    def test_field_predicate(self, name, allowed, record, expected):
+        """Test matching a field against the configured values."""
+        self.assertEqual(field_predicate("Status", allowed)(record), expected)
+
+    def test_from_config(self):
+        """Test that only the stream's own filters are built, and all of them must match."""
+        config = {"record_filters": {"messages": {"Status": "sent", "IsSpam": False}, "contacts": {"ID": 1}}}
+        record_filter = RecordFilter.from_config(config, "messages")
+
+        self.assertEqual(len(record_filter.predicates), 2)
+        self.assertTrue(record_filter.matches({"Status": "sent", "IsSpam": False}))
+        self.assertFalse(record_filter.matches({"Status": "sent", "IsSpam": True}))
+        self.assertFalse(RecordFilter.from_config({}, "messages"))
+
+
+class TestFilteredSync(unittest.TestCase):
+    """Test that rejected records never reach the transformer."""
+
+    def get_stream(self, stream_class, config, properties):
+        """Build a stream with the given config and schema properties."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z", **config}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {"type": "object", "properties": properties}
+        catalog.metadata = []
+        stream = stream_class(client=client, catalog=catalog)
+        stream.is_selected = MagicMock(return_value=True)
+        return stream
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_incremental_cutoff_before_transform(self, mock_write_record):
+        """Test that rows before the bookmark and filtered rows are skipped untransformed."""
+        stream = self.get_stream(Messages, {"record_filters": {"messages": {"Status": "sent"}}}, {
+            "ID": {"type": "integer"},
+            "Status": {"type": ["null", "string"]},
+            "ArrivedAt": {"type": "string", "format": "date-time"},
+        })
+        stream.get_records = MagicMock(return_value=iter([
+            {"ID": 1, "Status": "sent", "ArrivedAt": "2025-01-02T23:59:59Z"},
+            {"ID": 2, "Status": "sent", "ArrivedAt": "2025-01-03T00:00:00Z"},
+            {"ID": 3, "Status": "bounce", "ArrivedAt": "2025-01-04T00:00:00Z"},
+            {"ID": 4, "Status": "sent", "ArrivedAt": "2025-01-04T00:00:00Z"},
+        ]))
+        stream.transform_record = MagicMock(wraps=stream.transform_record)
+        state = {"bookmarks": {"messages": {"ArrivedAt": "2025-01-03T00:00:00.000000Z"}}}
+
+        stream.sync(state, Transformer())
+
+        transformed = [c[0][0]["ID"] for c in stream.transform_record.call_args_list]
+        self.assertEqual(transformed, [2, 4])
+        self.assertEqual([c[0][1]["ID"] for c in mock_write_record.call_args_list], [2, 4])
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_full_table_filters_keep_offset(self, mock_write_record):
+        """Test that filtered full-table rows are not emitted but still advance the checkpoint offset."""
+        stream = self.get_stream(
+            Contacts,
+            {"record_filters": {"contacts": {"IsExcludedFromCampaigns": False}}, "checkpoint_records": 2},
+            {"ID": {"type": "integer"}, "IsExcludedFromCampaigns": {"type": ["null", "boolean"]}}
+        )
+        stream.get_records = MagicMock(return_value=iter(
+            {"ID": i, "IsExcludedFromCampaigns": i % 2 == 0} for i in range(4)
+        ))
+        stream.write_checkpoint = MagicMock()
+
+        with patch("tap_mailjet.checkpoint.write_state"):
+            stream.sync({}, Transformer())
+
+        self.assertEqual([c[0][1]["ID"] for c in mock_write_record.call_args_list], [1, 3])
+        self.assertEqual([c[0][1] for c in stream.write_checkpoint.call_args_list], [2, 4])
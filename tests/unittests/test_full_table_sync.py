@@ -1,6 +1,7 @@
 """Unit tests for full table sync flow."""
 import unittest
 from unittest.mock import patch, MagicMock
+from parameterized import parameterized
 from singer import Transformer
 from tap_mailjet.streams.contacts import Contacts
 
@@ -164,3 +165,130 @@ class TestFullTableSync(unittest.TestCase):
         
         # No records should be written for unselected stream
         mock_write_record.assert_not_called()
+
+
+class TestCursorPagination(unittest.TestCase):
+    """Test full table paging in ID order with cursor_pagination enabled."""
+
+    def setUp(self):
+        """Set up a contacts stream over a fake, ID-sorted table."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z", "cursor_pagination": True}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {"type": "object", "properties": {"ID": {"type": "integer"}}}
+        catalog.metadata = []
+        self.stream = Contacts(client=client, catalog=catalog)
+        self.stream.page_size = 10
+        self.table = [{"ID": i} for i in range(1, 36)]
+        self.requests = []
+        client.make_request = MagicMock(side_effect=self.make_request)
+
+    def make_request(self, method, endpoint, params, *args, **kwargs):
+        """Serve a page of the table, sorted as requested."""
+        self.requests.append(dict(params))
+        rows = sorted(self.table, key=lambda row: row[params["Sort"]])
+        return {"Data": rows[params["Offset"]:params["Offset"] + params["Limit"]]}
+
+    def test_sorted_by_id(self):
+        """Test that every row is read once, in ID order."""
+        records = list(self.stream.get_records())
+
+        self.assertEqual([record["ID"] for record in records], list(range(1, 36)))
+        self.assertTrue(all(request["Sort"] == "ID" for request in self.requests))
+
+    def test_rows_deleted_during_scan(self):
+        """Test that deleting rows behind the cursor neither skips nor repeats rows."""
+        records = []
+        for record in self.stream.get_records():
+            records.append(record["ID"])
+            if record["ID"] == 15:
+                # Two rows before the cursor disappear, everything after shifts back
+                self.table = [row for row in self.table if row["ID"] not in (3, 4)]
+
+        self.assertEqual(records, list(range(1, 36)))
+
+    def test_rows_created_during_scan(self):
+        """Test that rows created during the scan are picked up at the end."""
+        records = []
+        for record in self.stream.get_records():
+            records.append(record["ID"])
+            if record["ID"] == 5:
+                self.table.append({"ID": 36})
+
+        self.assertEqual(records, list(range(1, 37)))
+
+    def test_resume_after_last_id(self):
+        """Test that a scan can start from an offset and last ID."""
+        records = list(self.stream.get_cursor_records({}, offset=20, last_id=20))
+
+        self.assertEqual([record["ID"] for record in records], list(range(21, 36)))
+        self.assertEqual(self.requests[0]["Offset"], 15)
+
+
+class TestFullTableCheckpoints(unittest.TestCase):
+    """Test resumable checkpoints of full table syncs."""
+
+    def get_stream(self, config):
+        """Build a contacts stream over a fake table of 25 rows."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z", "checkpoint_records": 10, **config}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {"type": "object", "properties": {"ID": {"type": "integer"}}}
+        catalog.metadata = []
+        stream = Contacts(client=client, catalog=catalog)
+        stream.is_selected = MagicMock(return_value=True)
+        stream.page_size = 10
+        table = [{"ID": i} for i in range(1, 26)]
+        client.make_request = MagicMock(
+            side_effect=lambda method, endpoint, params, *args, **kwargs: {
+                "Data": table[params["Offset"]:params["Offset"] + params["Limit"]]
+            }
+        )
+        return stream
+
+    @parameterized.expand([
+        ["offset", {}, None],
+        ["cursor", {"cursor_pagination": True}, 20],
+    ])
+    @patch("tap_mailjet.checkpoint.write_state")
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_checkpoints_written_and_cleared(self, name, config, last_id, mock_write_record, mock_write_state):
+        """Test that the position is checkpointed during the scan and cleared at the end."""
+        stream = self.get_stream(config)
+        checkpoints = []
+        mock_write_state.side_effect = lambda state: checkpoints.append(dict(state["bookmarks"]["contacts"]))
+        state = {}
+
+        stream.sync(state, Transformer())
+
+        self.assertEqual(mock_write_record.call_count, 25)
+        self.assertEqual([(c["offset"], c["last_id"]) for c in checkpoints], [(10, last_id and 10), (20, last_id)])
+        self.assertEqual(len({c["version"] for c in checkpoints}), 1)
+        self.assertNotIn("contacts", state.get("bookmarks", {}))
+
+    @parameterized.expand([
+        ["offset", {}, {"offset": 20, "last_id": None, "version": 1}],
+        ["cursor", {"cursor_pagination": True}, {"offset": 20, "last_id": 20, "version": 1}],
+    ])
+    @patch("tap_mailjet.checkpoint.write_state")
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_resume_from_checkpoint(self, name, config, checkpoint, mock_write_record, mock_write_state):
+        """Test that an interrupted sync resumes after its last checkpoint."""
+        stream = self.get_stream(config)
+        state = {"bookmarks": {"contacts": checkpoint}}
+
+        stream.sync(state, Transformer())
+
+        written = [c[0][1]["ID"] for c in mock_write_record.call_args_list]
+        self.assertEqual(written, list(range(21, 26)))
+
+    @patch("tap_mailjet.checkpoint.write_state")
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_checkpoint_from_other_mode_ignored(self, mock_write_record, mock_write_state):
+        """Test that an offset checkpoint is not used to resume a cursor scan."""
+        stream = self.get_stream({"cursor_pagination": True})
+        state = {"bookmarks": {"contacts": {"offset": 20, "last_id": None, "version": 1}}}
+
+        stream.sync(state, Transformer())
+
+        self.assertEqual(mock_write_record.call_count, 25)
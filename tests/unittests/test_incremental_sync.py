@@ -1,9 +1,12 @@
 """Unit tests for incremental sync with bookmark management."""
+import time
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
 from singer import Transformer
 from tap_mailjet.streams.messages import Messages
 from tap_mailjet.streams.abstracts import IncrementalStream
+from tap_mailjet.helpers import format_datetime, parse_datetime
 
 
 class TestIncrementalBookmark(unittest.TestCase):
@@ -265,3 +268,154 @@ class TestWriteBookmarkMethod(unittest.TestCase):
         result = self.stream.write_bookmark(state, "test_stream", "updated_at", 200)
         # Should preserve the higher bookmark value (300)
         self.assertEqual(result, {'bookmarks': {'test_stream': {'updated_at': 300}}})
+
+
+class TestTimeWindowedSync(unittest.TestCase):
+    """Test FromTS/ToTS window sharding of incremental syncs."""
+
+    def setUp(self):
+        """Set up a stream with daily windows over the last three days."""
+        self.now = datetime.now(timezone.utc)
+        config = {
+            "api_key": "test_key",
+            "secret_key": "test_secret",
+            "start_date": format_datetime(self.now - timedelta(days=3)),
+            "incremental_window_days": 1,
+            "window_concurrency": 3
+        }
+        client = MagicMock()
+        client.config = config
+        client.now.side_effect = lambda: datetime.now(timezone.utc)
+
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {
+            "type": "object",
+            "properties": {
+                "ID": {"type": "integer"},
+                "ArrivedAt": {"type": "string", "format": "date-time"}
+            }
+        }
+        catalog.metadata = []
+
+        self.stream = Messages(client=client, catalog=catalog)
+        self.stream.is_selected = MagicMock(return_value=True)
+        self.stream.page_size = 2
+        self.records = [
+            {"ID": i, "ArrivedAt": format_datetime(self.now - timedelta(hours=66 - 12 * i))}
+            for i in range(5)
+        ]
+        self.requests = []
+
+        def make_request(method, endpoint, params, headers, body=None, path=None):
+            self.requests.append(dict(params))
+            from_ts, to_ts = parse_datetime(params["FromTS"]), parse_datetime(params["ToTS"])
+            if from_ts < self.now - timedelta(days=2, hours=12):
+                # Slow down the first window so later windows finish first
+                time.sleep(0.05)
+            matching = [r for r in self.records if from_ts < parse_datetime(r["ArrivedAt"]) <= to_ts]
+            return {"Data": matching[params["Offset"]:params["Offset"] + params["Limit"]]}
+
+        client.make_request = MagicMock(side_effect=make_request)
+
+    def test_get_time_windows(self):
+        """Test that the range is split into contiguous windows ending at the upper bound."""
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2025, 1, 3, 12, tzinfo=timezone.utc)
+        windows = self.stream.get_time_windows(start, end, timedelta(days=1))
+
+        self.assertEqual(windows, [
+            (start, start + timedelta(days=1)),
+            (start + timedelta(days=1), start + timedelta(days=2)),
+            (start + timedelta(days=2), end),
+        ])
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    @patch("tap_mailjet.streams.abstracts.write_bookmark", side_effect=lambda state, *args: state)
+    def test_windows_emit_in_order_and_bookmark_contiguous_prefix(self, mock_write_bookmark, mock_write_record):
+        """Test that records keep window order and the bookmark only moves over finished windows."""
+        self.stream.sync({}, Transformer())
+
+        written = [c[0][1]["ID"] for c in mock_write_record.call_args_list]
+        self.assertEqual(written, [0, 1, 2, 3, 4])
+
+        bookmarks = [c[0][3] for c in mock_write_bookmark.call_args_list]
+        self.assertEqual(bookmarks, sorted(bookmarks))
+        self.assertTrue(bookmarks[-1].startswith(self.records[-1]["ArrivedAt"][:19]))
+
+        self.assertTrue(all("ToTS" in params for params in self.requests))
+        upper_bounds = {params["ToTS"] for params in self.requests}
+        self.assertLessEqual(max(parse_datetime(to_ts) for to_ts in upper_bounds), datetime.now(timezone.utc))
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_child_sync_is_not_windowed(self, mock_write_record):
+        """Test that parent-driven syncs keep the single FromTS scan."""
+        self.stream.get_url_endpoint = MagicMock(return_value="https://api.mailjet.com/v3/REST/message")
+        self.stream.get_records = MagicMock(return_value=iter([]))
+        self.stream.sync({}, Transformer(), parent_obj={"id": 1})
+
+        self.stream.get_records.assert_called_once_with()
+
+
+class TestAdaptiveWindowPlanning(unittest.TestCase):
+    """Test density-adaptive window sizing."""
+
+    def setUp(self):
+        """Set up a stream whose window counts come from a bursty timeline."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z"}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {"type": "object", "properties": {}}
+        catalog.metadata = []
+        self.stream = Messages(client=client, catalog=catalog)
+
+        self.start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        # A burst of 1000 records in one hour of day 2, a trickle elsewhere
+        burst = [self.start + timedelta(days=1, seconds=3.6 * i) for i in range(1000)]
+        trickle = [self.start + timedelta(hours=6 * i) for i in range(20)]
+        self.timestamps = sorted(burst + trickle)
+        self.probes = []
+
+        def get_window_count(window):
+            self.probes.append(window)
+            return sum(1 for ts in self.timestamps if window[0] <= ts < window[1])
+
+        self.stream.get_window_count = get_window_count
+
+    def plan(self, target):
+        """Plan five daily windows with the given target."""
+        windows = self.stream.get_time_windows(self.start, self.start + timedelta(days=5), timedelta(days=1))
+        return self.stream.plan_time_windows(windows, target, 4)
+
+    def count(self, window):
+        return sum(1 for ts in self.timestamps if window[0] <= ts < window[1])
+
+    def test_windows_are_contiguous(self):
+        """Test that the planned windows cover the range without gaps."""
+        planned = self.plan(100)
+
+        self.assertEqual(planned[0][0], self.start)
+        self.assertEqual(planned[-1][1], self.start + timedelta(days=5))
+        for previous, current in zip(planned, planned[1:]):
+            self.assertEqual(previous[1], current[0])
+
+    def test_dense_windows_are_split_under_target(self):
+        """Test that every planned window holds at most the target number of records."""
+        planned = self.plan(100)
+
+        self.assertTrue(all(self.count(window) <= 100 for window in planned))
+        self.assertEqual(sum(self.count(window) for window in planned), len(self.timestamps))
+
+    def test_sparse_windows_are_merged(self):
+        """Test that quiet days are merged into fewer windows."""
+        planned = self.plan(100)
+
+        quiet_windows = [w for w in planned if w[1] <= self.start + timedelta(days=1) or w[0] >= self.start + timedelta(days=2)]
+        self.assertLessEqual(len(quiet_windows), 2)
+
+    def test_split_stops_at_minimum_window(self):
+        """Test that a window denser than the target at the minimum size is kept."""
+        self.timestamps = [self.start + timedelta(days=1)] * 500
+        planned = self.plan(100)
+
+        densest = max(planned, key=self.count)
+        self.assertLessEqual(densest[1] - densest[0], timedelta(minutes=1))
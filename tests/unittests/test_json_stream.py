@@ -0,0 +1,68 @@
+"""Unit tests for the incremental JSON page decoder."""
+import json
+import unittest
+from parameterized import parameterized
+from tap_mailjet.json_stream import JSONArrayReader
+
+
+def chunked(text, size):
+    """Split encoded text into chunks of `size` bytes."""
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+PAGE = {
+    "Count": 3,
+    "Data": [
+        {"ID": 1, "Name": "Zoë", "Score": 12345.5, "Tags": ["a", "b"], "Nested": {"x": None}},
+        {"ID": 22, "Name": "日本", "Score": -1e-3, "Tags": [], "Nested": {"x": True}},
+        {"ID": 333, "Name": "quote \" and \\ slash", "Score": 0, "Tags": ["c"], "Nested": {}},
+    ],
+    "Total": 1234567
+}
+
+
+class TestJSONArrayReader(unittest.TestCase):
+    """Test decoding a Mailjet page from arbitrary chunk boundaries."""
+
+    @parameterized.expand([[1], [2], [3], [7], [64], [100000]])
+    def test_chunk_sizes(self, size):
+        """Test that every chunk split yields the same records and fields."""
+        reader = JSONArrayReader(chunked(json.dumps(PAGE, ensure_ascii=False, indent=1), size), "Data")
+
+        self.assertEqual(list(reader), PAGE["Data"])
+        self.assertEqual(reader.fields, {"Count": 3, "Total": 1234567})
+
+    def test_records_yielded_before_body_is_read(self):
+        """Test that the first record is available before the last chunk is read."""
+        chunks = chunked(json.dumps(PAGE), 16)
+        read = []
+
+        def source():
+            for chunk in chunks:
+                read.append(chunk)
+                yield chunk
+
+        first = next(iter(JSONArrayReader(source(), "Data")))
+
+        self.assertEqual(first, PAGE["Data"][0])
+        self.assertLess(len(read), len(chunks))
+
+    @parameterized.expand([
+        ["empty_array", '{"Count": 0, "Data": [], "Total": 0}', []],
+        ["missing_key", '{"Count": 0, "Total": 0}', []],
+        ["empty_object", '{}', []],
+    ])
+    def test_empty_pages(self, name, body, expected):
+        """Test pages without records."""
+        self.assertEqual(list(JSONArrayReader(chunked(body, 5), "Data")), expected)
+
+    @parameterized.expand([
+        ["truncated", '{"Count": 2, "Data": [{"ID": 1}, {"ID"'],
+        ["not_an_object", '[{"ID": 1}]'],
+        ["bad_separator", '{"Data": [{"ID": 1} {"ID": 2}]}'],
+    ])
+    def test_malformed_body(self, name, body):
+        """Test that malformed or truncated bodies raise JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            list(JSONArrayReader(chunked(body, 4), "Data"))
@@ -0,0 +1,116 @@
+"""Unit tests for adaptive page sizing."""
+import unittest
+from unittest.mock import MagicMock
+from parameterized import parameterized
+from requests.exceptions import ChunkedEncodingError, Timeout
+from tap_mailjet.exceptions import MailjetInternalServerError, MailjetNotFoundError, MailjetRateLimitError
+from tap_mailjet.page_size import PageSizer, is_page_size_error
+from tap_mailjet.streams.contacts import Contacts
+
+
+def error_with_status(error_class, status_code):
+    """Build a Mailjet error carrying a response with the given status."""
+    return error_class("error", MagicMock(status_code=status_code))
+
+
+class TestPageSizer(unittest.TestCase):
+    """Test how the page size follows page latency."""
+
+    @parameterized.expand([
+        ["slow_page_shrinks", 1000, 1000, 10.0, 500],
+        ["fast_page_grows", 200, 200, 1.0, 400],
+        ["on_target_page_stays", 1000, 1000, 4.0, 1000],
+        ["last_page_ignored", 1000, 20, 60.0, 1000],
+        ["growth_capped", 1000, 1000, 0.1, 1000],
+    ])
+    def test_record(self, name, page_size, record_count, seconds, expected):
+        """Test the size chosen after a page."""
+        sizer = PageSizer(page_size)
+        sizer.record(page_size, record_count, seconds)
+
+        self.assertEqual(sizer.size, expected)
+
+    def test_best_size(self):
+        """Test that the size with the best throughput is remembered."""
+        sizer = PageSizer(1000)
+        sizer.record(1000, 1000, 20.0)
+        sizer.record(250, 250, 1.0)
+
+        self.assertEqual(sizer.best_size, 250)
+
+    def test_shrink(self):
+        """Test that failures halve the size down to the minimum."""
+        sizer = PageSizer(40, min_size=10)
+        for _ in range(5):
+            sizer.shrink()
+
+        self.assertEqual(sizer.size, 10)
+        self.assertEqual(sizer.best_size, 10)
+
+    @parameterized.expand([
+        ["timeout", Timeout(), True],
+        ["chunked", ChunkedEncodingError(), True],
+        ["server_error", error_with_status(MailjetInternalServerError, 500), True],
+        ["rate_limit", error_with_status(MailjetRateLimitError, 429), False],
+        ["not_found", error_with_status(MailjetNotFoundError, 404), False],
+        ["other", ValueError(), False],
+    ])
+    def test_is_page_size_error(self, name, error, expected):
+        """Test which errors make the page smaller."""
+        self.assertEqual(is_page_size_error(error), expected)
+
+
+class TestAdaptivePaging(unittest.TestCase):
+    """Test get_records and sync with adaptive_page_size enabled."""
+
+    def get_stream(self, config):
+        """Build a contacts stream with the given config."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z", **config}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {"type": "object", "properties": {}}
+        catalog.metadata = []
+        return Contacts(client=client, catalog=catalog)
+
+    def test_failed_page_retried_smaller(self):
+        """Test that a failing page is retried with a smaller Limit at the same offset."""
+        stream = self.get_stream({"adaptive_page_size": True})
+        stream.setup_page_size({"bookmarks": {"contacts": {"page_size": 100}}})
+        limits = []
+
+        def make_request(method, endpoint, params, *args, **kwargs):
+            limits.append((params["Offset"], params["Limit"]))
+            if params["Limit"] > 50:
+                raise Timeout()
+            return {"Data": [{"ID": i} for i in range(params["Offset"], min(params["Offset"] + params["Limit"], 120))]}
+
+        stream.client.make_request = MagicMock(side_effect=make_request)
+
+        records = list(stream.get_records())
+
+        self.assertEqual([record["ID"] for record in records], list(range(120)))
+        self.assertEqual(limits[:3], [(0, 100), (0, 50), (50, 50)])
+
+    @parameterized.expand([
+        ["remembered", {"adaptive_page_size": True}, {"bookmarks": {"contacts": {"page_size": 300}}}, 300],
+        ["default_start", {"adaptive_page_size": True}, {}, 1000],
+        ["override", {"adaptive_page_size": True, "page_sizes": {"contacts": 250}}, {}, 250],
+        ["disabled", {}, {}, 100],
+    ])
+    def test_setup_page_size(self, name, config, state, expected):
+        """Test where the starting page size comes from."""
+        stream = self.get_stream(config)
+        stream.setup_page_size(state)
+
+        self.assertEqual(stream.page_size, expected)
+
+    def test_best_size_saved_in_state(self):
+        """Test that sync stores the best page size in the stream's bookmark."""
+        stream = self.get_stream({"adaptive_page_size": True})
+        stream.is_selected = MagicMock(return_value=False)
+        stream.client.make_request = MagicMock(return_value={"Data": []})
+        state = {"bookmarks": {"contacts": {"page_size": 400}}}
+
+        stream.sync(state, MagicMock())
+
+        self.assertEqual(state["bookmarks"]["contacts"]["page_size"], 400)
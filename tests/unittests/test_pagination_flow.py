@@ -1,6 +1,7 @@
 """Unit tests for pagination logic."""
 import unittest
 from unittest.mock import patch, MagicMock
+from tap_mailjet.client import Client
 from tap_mailjet.streams.messages import Messages
 
 
@@ -135,3 +136,107 @@ class TestPaginationFlow(unittest.TestCase):
         # Original params should be preserved
         self.assertIn("FromTS", self.stream.params)
         self.assertEqual(self.stream.params["FromTS"], "2025-01-01T00:00:00Z")
+
+
+class TestConcurrentPagination(unittest.TestCase):
+    """Test concurrent page fetching in get_records."""
+
+    def setUp(self):
+        """Set up a stream with page_concurrency enabled on a real client."""
+        config = {
+            "api_key": "test_key",
+            "secret_key": "test_secret",
+            "start_date": "2025-01-01T00:00:00Z",
+            "page_concurrency": 4
+        }
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {"type": "object", "properties": {}}
+        catalog.metadata = []
+
+        self.client = Client(config)
+        self.stream = Messages(client=self.client, catalog=catalog)
+        self.stream.page_size = 10
+
+    def fake_api(self, records, report_total=True):
+        """Serve `records` with Limit/Offset/countOnly semantics."""
+        def make_request(method, endpoint, params, headers, body=None, path=None):
+            if params.get("countOnly"):
+                return {"Count": len(records), "Data": [], "Total": len(records)}
+            page = records[params["Offset"]:params["Offset"] + params["Limit"]]
+            return {"Count": len(page), "Data": page, "Total": len(records) if report_total else len(page)}
+        return make_request
+
+    def test_records_yielded_in_offset_order(self):
+        """Test that all pages are fetched and records keep offset order."""
+        records = [{"ID": i} for i in range(95)]
+        with patch.object(self.client, "make_request", side_effect=self.fake_api(records)) as mock_request:
+            result = list(self.stream.get_records())
+
+        self.assertEqual(result, records)
+        self.assertEqual(mock_request.call_count, 10)
+
+    def test_count_only_probe_when_total_missing(self):
+        """Test that a countOnly probe sizes the result set when Total is not usable."""
+        records = [{"ID": i} for i in range(35)]
+        with patch.object(self.client, "make_request", side_effect=self.fake_api(records, report_total=False)) as mock_request:
+            result = list(self.stream.get_records())
+
+        self.assertEqual(result, records)
+        sent_params = [c.kwargs.get("params") or c.args[2] for c in mock_request.call_args_list]
+        probes = [params for params in sent_params if params.get("countOnly")]
+        self.assertEqual(len(probes), 1)
+        self.assertNotIn("Offset", probes[0])
+
+    def test_rows_beyond_total_are_fetched_serially(self):
+        """Test that paging continues past Total when the last page was full."""
+        records = [{"ID": i} for i in range(45)]
+
+        def make_request(method, endpoint, params, headers, body=None, path=None):
+            page = records[params["Offset"]:params["Offset"] + params["Limit"]]
+            # Report a stale total that ends on a page boundary
+            return {"Count": len(page), "Data": page, "Total": 30}
+
+        with patch.object(self.client, "make_request", side_effect=make_request):
+            result = list(self.stream.get_records())
+
+        self.assertEqual(result, records)
+
+    def test_single_short_page_skips_fan_out(self):
+        """Test that a short first page ends pagination without probing."""
+        records = [{"ID": i} for i in range(5)]
+        with patch.object(self.client, "make_request", side_effect=self.fake_api(records)) as mock_request:
+            result = list(self.stream.get_records())
+
+        self.assertEqual(result, records)
+        mock_request.assert_called_once()
+
+
+class TestStreamedPagination(unittest.TestCase):
+    """Test get_records with stream_pages enabled."""
+
+    def setUp(self):
+        """Set up a stream whose client streams pages."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z", "stream_pages": True}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {"type": "object", "properties": {}}
+        catalog.metadata = []
+        self.stream = Messages(client=client, catalog=catalog)
+        self.stream.page_size = 10
+
+    def test_pages_until_short_page(self):
+        """Test that paging counts streamed records to find the last page."""
+        pages = [[{"ID": i} for i in range(start, min(start + 10, 25))] for start in (0, 10, 20)]
+        offsets = []
+
+        def stream_request(method, endpoint, data_key, params, *args, **kwargs):
+            offsets.append(params["Offset"])
+            return iter(pages[len(offsets) - 1])
+
+        self.stream.client.stream_request = MagicMock(side_effect=stream_request)
+
+        records = list(self.stream.get_records())
+
+        self.assertEqual([record["ID"] for record in records], list(range(25)))
+        self.assertEqual(offsets, [0, 10, 20])
+        self.stream.client.make_request.assert_not_called()
@@ -0,0 +1,145 @@
+"""Unit tests for the fetch/transform/emit RecordPipeline."""
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+from singer import Transformer
+from tap_mailjet.pipeline import OrderedPrefetch, RecordPipeline
+from tap_mailjet.streams.contacts import Contacts
+
+
+class TestRecordPipeline(unittest.TestCase):
+    """Test ordering, error propagation and back-pressure."""
+
+    def test_results_keep_fetch_order(self):
+        """Test that results come back in fetch order across workers."""
+        pipeline = RecordPipeline(workers=4, queue_size=2, chunk_size=3)
+        results = list(pipeline.process(iter(range(50)), lambda value: value * 2))
+
+        self.assertEqual(results, [value * 2 for value in range(50)])
+
+    def test_transform_runs_on_worker_threads(self):
+        """Test that the transform stage does not run on the consumer thread."""
+        pipeline = RecordPipeline(workers=2, queue_size=2, chunk_size=5)
+        threads = set(pipeline.process(iter(range(20)), lambda value: threading.current_thread().name))
+
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    def test_fetch_error_is_raised(self):
+        """Test that an error raised while fetching reaches the consumer."""
+        def records():
+            yield 1
+            raise ConnectionError("fetch failed")
+
+        pipeline = RecordPipeline(workers=2, queue_size=2, chunk_size=1)
+        with self.assertRaises(ConnectionError):
+            list(pipeline.process(records(), lambda value: value))
+
+    def test_transform_error_is_raised(self):
+        """Test that an error raised by the transform reaches the consumer."""
+        def transform(value):
+            if value == 7:
+                raise ValueError("bad record")
+            return value
+
+        pipeline = RecordPipeline(workers=2, queue_size=2, chunk_size=2)
+        with self.assertRaises(ValueError):
+            list(pipeline.process(iter(range(20)), transform))
+
+    def test_fetcher_is_bounded_by_queue(self):
+        """Test that the fetcher stops reading ahead when the consumer does not keep up."""
+        fetched = []
+
+        def records():
+            for value in range(1000):
+                fetched.append(value)
+                yield value
+
+        pipeline = RecordPipeline(workers=1, queue_size=2, chunk_size=10)
+        results = pipeline.process(records(), lambda value: value)
+        self.assertEqual(next(results), 0)
+        # Give the fetcher time to fill every buffer it has
+        threading.Event().wait(0.3)
+
+        # queue + chunks being transformed + the chunk being built, never the whole source
+        self.assertLess(len(fetched), 100)
+        results.close()
+
+
+class TestOrderedPrefetch(unittest.TestCase):
+    """Test reading several sources ahead of the consumer."""
+
+    def test_sources_keep_order(self):
+        """Test that every source is read back whole and in order."""
+        sources = [range(start, start + 25) for start in range(0, 200, 25)]
+        prefetch = OrderedPrefetch(workers=3, queue_size=2, chunk_size=4)
+
+        results = [list(records) for records in prefetch.read_ahead(sources)]
+
+        self.assertEqual(results, [list(source) for source in sources])
+
+    def test_sources_are_bounded_by_queue(self):
+        """Test that sources fetched ahead stop at their queue instead of loading everything."""
+        fetched = []
+
+        def source(index):
+            for value in range(1000):
+                fetched.append((index, value))
+                yield value
+
+        prefetch = OrderedPrefetch(workers=3, queue_size=2, chunk_size=10)
+        sources = prefetch.read_ahead(source(index) for index in range(5))
+        self.assertEqual(next(next(sources)), 0)
+        threading.Event().wait(0.3)
+
+        # Three sources in flight, each holding its queue and the chunk being built
+        self.assertLess(len(fetched), 3 * 40)
+        self.assertEqual({index for index, _ in fetched}, {0, 1, 2})
+        sources.close()
+
+    def test_source_error_is_raised(self):
+        """Test that an error raised by a source reaches the consumer when it gets there."""
+        def failing():
+            yield 1
+            raise ConnectionError("fetch failed")
+
+        prefetch = OrderedPrefetch(workers=2, queue_size=2, chunk_size=1)
+        sources = prefetch.read_ahead([[0], failing()])
+        self.assertEqual(list(next(sources)), [0])
+        with self.assertRaises(ConnectionError):
+            list(next(sources))
+
+
+class TestPipelinedSync(unittest.TestCase):
+    """Test full table sync with pipeline_workers enabled."""
+
+    def setUp(self):
+        """Set up a contacts stream with the pipeline enabled."""
+        client = MagicMock()
+        client.config = {"start_date": "2025-01-01T00:00:00Z", "pipeline_workers": 3}
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {
+            "type": "object",
+            "properties": {
+                "ID": {"type": "integer"},
+                "CreatedAt": {"type": ["null", "string"], "format": "date-time"}
+            }
+        }
+        catalog.metadata = []
+        self.stream = Contacts(client=client, catalog=catalog)
+        self.stream.is_selected = MagicMock(return_value=True)
+        self.stream.page_size = 7
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_records_written_in_order(self, mock_write_record):
+        """Test that every record is transformed and written in fetch order."""
+        records = [{"ID": str(i), "CreatedAt": "2025-01-01T00:00:00Z", "Extra": 1} for i in range(100)]
+        self.stream.get_records = MagicMock(return_value=iter(records))
+        transformer = Transformer()
+
+        self.stream.sync({}, transformer)
+
+        written = [c[0][1] for c in mock_write_record.call_args_list]
+        self.assertEqual([r["ID"] for r in written], list(range(100)))
+        self.assertEqual(written[0]["CreatedAt"], "2025-01-01T00:00:00.000000Z")
+        # Paths removed by worker transformers are reported by the caller's transformer
+        self.assertIn("Extra", transformer.removed)
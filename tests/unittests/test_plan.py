@@ -0,0 +1,73 @@
+"""Unit tests for the per-stream sync plan."""
+import unittest
+from unittest.mock import patch, MagicMock
+from singer import Transformer
+from tap_mailjet.plan import SyncPlan, get_selected_fields
+from tap_mailjet.streams.contacts import Contacts
+from tap_mailjet.streams.messages import Messages
+
+
+def get_stream(stream_class, metadata=None):
+    """Build a stream with ID, ArrivedAt and Status properties."""
+    client = MagicMock()
+    client.config = {"start_date": "2025-01-01T00:00:00Z"}
+    catalog = MagicMock()
+    catalog.schema.to_dict.return_value = {
+        "type": "object",
+        "properties": {
+            "ID": {"type": "integer"},
+            "ArrivedAt": {"type": "string", "format": "date-time"},
+            "Status": {"type": ["null", "string"]},
+        }
+    }
+    catalog.metadata = metadata or []
+    return stream_class(client=client, catalog=catalog)
+
+
+class TestSyncPlan(unittest.TestCase):
+    """Test what the plan resolves from the catalog."""
+
+    def test_plan(self):
+        """Test the selection flag, selected fields, replication key and children."""
+        stream = get_stream(Messages, [
+            {"breadcrumb": [], "metadata": {"selected": True}},
+            {"breadcrumb": ["properties", "ID"], "metadata": {"inclusion": "automatic", "selected": False}},
+            {"breadcrumb": ["properties", "Status"], "metadata": {"selected": False}},
+        ])
+        child = MagicMock()
+        stream.child_to_sync = [child]
+
+        plan = SyncPlan(stream)
+
+        self.assertTrue(plan.selected)
+        self.assertEqual(plan.selected_fields, {"ID", "ArrivedAt"})
+        self.assertEqual(plan.replication_key, "ArrivedAt")
+        self.assertEqual(plan.children, (child,))
+
+    def test_full_table_plan(self):
+        """Test a full table stream's plan, which has no replication key."""
+        plan = SyncPlan(get_stream(Contacts))
+
+        self.assertFalse(plan.selected)
+        self.assertIsNone(plan.replication_key)
+
+    def test_unsupported_fields(self):
+        """Test that unsupported fields are not selected."""
+        mdata = {("properties", "Status"): {"inclusion": "unsupported"}}
+        schema = {"properties": {"ID": {}, "Status": {}}}
+
+        self.assertEqual(get_selected_fields(schema, mdata), {"ID"})
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_selection_resolved_once_per_sync(self, mock_write_record):
+        """Test that the sync loop no longer checks selection for every record."""
+        stream = get_stream(Messages)
+        stream.is_selected = MagicMock(return_value=True)
+        stream.get_records = MagicMock(return_value=iter(
+            {"ID": i, "ArrivedAt": f"2025-02-01T00:00:{i:02d}Z"} for i in range(20)
+        ))
+
+        stream.sync({}, Transformer())
+
+        self.assertEqual(mock_write_record.call_count, 20)
+        self.assertEqual(stream.is_selected.call_count, 1)
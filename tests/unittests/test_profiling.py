@@ -0,0 +1,105 @@
+"""Unit tests for the profiling mode."""
+import os
+import pstats
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet import profiling
+from tap_mailjet.client import Client
+from tap_mailjet.profiling import Profiler
+from tap_mailjet.streams.messages import Messages
+
+
+class TestProfiler(unittest.TestCase):
+    """Test stage accounting and reporting."""
+
+    def tearDown(self):
+        """Disable profiling again."""
+        profiling.PROFILER = None
+
+    @parameterized.expand([
+        ["stream_name", "messages", "messages"],
+        ["endpoint", "https://api.mailjet.com/v3/REST/message", "messages"],
+        ["trailing_slash", "https://api.mailjet.com/v3/REST/clickstatistics/", "click_statistics"],
+        ["unknown_endpoint", "https://api.mailjet.com/v3/REST/other", "https://api.mailjet.com/v3/REST/other"],
+        ["no_stream", None, "tap"],
+    ])
+    def test_get_stream(self, name, key, expected):
+        """Test which stream a timing is filed under."""
+        self.assertEqual(Profiler().get_stream(key), expected)
+
+    def test_stages_disabled(self):
+        """Test that stage and timed do nothing when profiling is off."""
+        with profiling.stage("messages", "http"):
+            pass
+
+        self.assertEqual(list(profiling.timed("messages", "decode", [1, 2])), [1, 2])
+        self.assertIsNone(profiling.PROFILER)
+
+    def test_timed_excludes_consumer(self):
+        """Test that timed counts one call for the whole iterable."""
+        profiling.configure({"profile": True})
+        for _ in profiling.timed("messages", "decode", range(3)):
+            pass
+
+        stats = profiling.PROFILER.stats["messages"]["decode"]
+        self.assertEqual(stats.calls, 1)
+
+    @patch("tap_mailjet.profiling.LOGGER")
+    def test_report(self, mock_logger):
+        """Test that a report logs every stage and forgets the stream."""
+        profiler = Profiler()
+        profiler.add("https://api.mailjet.com/v3/REST/message", "http", 1.5, 2097152)
+        profiler.add("messages", "transform", 0.5)
+        profiler.add("messages", "transform", 0.5)
+
+        profiler.report("messages", 4.0)
+
+        lines = [c[0][0] for c in mock_logger.info.call_args_list]
+        self.assertIn("4.000s", lines[0])
+        self.assertTrue(lines[1].split()[0] == "http" and "2.00 MB" in lines[1])
+        self.assertTrue(lines[2].split()[0] == "transform" and "2 calls" in lines[2])
+        self.assertEqual(profiler.stats, {})
+
+
+class TestProfiledSync(unittest.TestCase):
+    """Test the instrumented client, stream and emitter."""
+
+    def tearDown(self):
+        """Disable profiling again."""
+        profiling.PROFILER = None
+
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_stream_stages(self, mock_write_record):
+        """Test that a sync records http, decode, transform and bookmark timings for its stream."""
+        profiling.configure({"profile": True})
+        client = Client({"api_key": "key", "secret_key": "secret", "start_date": "2025-01-01T00:00:00Z"})
+        response = MagicMock(status_code=200, content=b"x" * 100, headers={})
+        response.json.return_value = {"Data": [{"ID": 1, "ArrivedAt": "2025-02-01T00:00:00Z"}]}
+        client._session.request = MagicMock(return_value=response)
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = {
+            "type": "object",
+            "properties": {"ID": {"type": "integer"}, "ArrivedAt": {"type": "string", "format": "date-time"}}
+        }
+        catalog.metadata = []
+        stream = Messages(client=client, catalog=catalog)
+
+        stream.sync({}, Transformer())
+
+        stages = profiling.PROFILER.stats["messages"]
+        self.assertEqual(stages["http"].bytes, 100)
+        self.assertTrue({"rate_limit", "http", "decode", "transform", "bookmark"} <= set(stages))
+
+    def test_cprofile_output(self):
+        """Test that profile_output writes stats pstats can read."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "sync.prof")
+            profiling.configure({"profile_output": output})
+            sorted(range(1000))
+            profiling.finish()
+
+            self.assertIsNone(profiling.PROFILER)
+            self.assertGreater(pstats.Stats(output).total_calls, 0)
@@ -0,0 +1,82 @@
+"""Unit tests for the adaptive RateLimiter."""
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+from tap_mailjet.rate_limiter import RateLimiter, parse_retry_after, MIN_RATE
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    """Test Retry-After header parsing."""
+
+    @parameterized.expand([
+        ["seconds", "7", 7.0],
+        ["float seconds", "1.5", 1.5],
+        ["negative", "-3", 0.0],
+        ["missing", None, None],
+        ["garbage", "soon", None],
+    ])
+    def test_parse_retry_after(self, test_name, value, expected):
+        """Test that Retry-After values are converted to seconds."""
+        self.assertEqual(parse_retry_after(value), expected)
+
+    @patch("tap_mailjet.rate_limiter.time.time", return_value=1700000000.0)
+    def test_parse_retry_after_http_date(self, mock_time):
+        """Test that the HTTP-date form is converted to a delay."""
+        self.assertEqual(parse_retry_after("Tue, 14 Nov 2023 22:13:30 GMT"), 10.0)
+
+
+@patch("tap_mailjet.rate_limiter.time.monotonic", return_value=100.0)
+class TestRateLimiter(unittest.TestCase):
+    """Test pacing and AIMD rate adjustments."""
+
+    def test_unpaced_without_rate(self, mock_monotonic):
+        """Test that requests are not delayed before any 429 is seen."""
+        limiter = RateLimiter()
+        self.assertEqual([limiter.reserve() for _ in range(5)], [0, 0, 0, 0, 0])
+
+    def test_paced_with_max_rate(self, mock_monotonic):
+        """Test that requests are spaced at the configured rate."""
+        limiter = RateLimiter(max_rate=2)
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0, 0.5, 1.0])
+
+    def test_retry_after_blocks_and_halves_rate(self, mock_monotonic):
+        """Test that a 429 holds requests for Retry-After and halves the rate."""
+        limiter = RateLimiter(max_rate=4)
+        limiter.update(429, {"Retry-After": "3"})
+
+        self.assertEqual(limiter.rate, 2)
+        self.assertEqual(limiter.reserve(), 3)
+
+    def test_429_without_retry_after_uses_growing_delay(self, mock_monotonic):
+        """Test that repeated 429s without Retry-After wait longer each time."""
+        limiter = RateLimiter()
+        limiter.update(429, {})
+        first = limiter.reserve()
+        limiter.update(429, None)
+
+        self.assertEqual(first, 1)
+        self.assertEqual(limiter._blocked_until, 102)
+        self.assertGreaterEqual(limiter.rate, MIN_RATE)
+
+    def test_success_increases_rate_up_to_max(self, mock_monotonic):
+        """Test that successful responses raise the rate without passing max_rate."""
+        limiter = RateLimiter(max_rate=4)
+        limiter.update(429, {"Retry-After": "0"})
+        limiter.update(200, {})
+        self.assertEqual(limiter.rate, 2.25)
+
+        for _ in range(50):
+            limiter.update(200, {})
+        self.assertEqual(limiter.rate, 4)
+
+    def test_server_errors_do_not_change_rate(self, mock_monotonic):
+        """Test that 5xx responses leave the rate untouched."""
+        limiter = RateLimiter(max_rate=4)
+        limiter.update(500, {})
+        self.assertEqual(limiter.rate, 4)
+
+    def test_exhausted_quota_blocks_until_reset(self, mock_monotonic):
+        """Test that X-RateLimit-Remaining: 0 holds requests until the reset."""
+        limiter = RateLimiter()
+        limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"})
+        self.assertEqual(limiter.reserve(), 5)
@@ -0,0 +1,170 @@
+"""Unit tests for the persistent response cache."""
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet.response_cache import ResponseCache
+from tap_mailjet.streams.contacts import Contacts
+from tap_mailjet.streams.messages import Messages
+from fake_mailjet import FakeMailjet, get_stream
+
+RECORDS = 250
+TTL = 3600
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the page store."""
+
+    def setUp(self):
+        """Create an empty cache directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    @parameterized.expand([
+        ["cached_stream", "https://api.mailjet.com/v3/REST/template", 60.0],
+        ["trailing_slash", "https://api.mailjet.com/v3/REST/contactslist/", 120.0],
+        ["uncached_stream", "https://api.mailjet.com/v3/REST/message", None],
+        ["unknown_endpoint", "https://api.mailjet.com/v3/REST/other", None],
+    ])
+    def test_get_ttl(self, name, endpoint, expected):
+        """Test which endpoints are cached, and for how long."""
+        cache = ResponseCache(self.directory.name, {"template": 60, "contacts_list": "120", "messages": 0})
+        self.addCleanup(cache.close)
+
+        self.assertEqual(cache.get_ttl(endpoint), expected)
+
+    @patch("tap_mailjet.response_cache.time.time")
+    def test_lru_eviction(self, mock_time):
+        """Test that the least recently used pages are dropped once the cache is too large."""
+        mock_time.side_effect = range(1000)
+        cache = ResponseCache(self.directory.name, {"template": 60}, max_bytes=25)
+        cache.put("a", b"x" * 10, 0)
+        cache.put("b", b"x" * 10, 0)
+        cache.get("a")
+        cache.put("c", b"x" * 10, 0)
+        cache.close()
+
+        cache = ResponseCache(self.directory.name, {"template": 60}, max_bytes=25)
+        self.addCleanup(cache.close)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.size, 20)
+
+    @parameterized.expand([
+        ["etag", {"etag": '"abc"'}, {"If-None-Match": '"abc"'}],
+        ["last_modified", {"last_modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, {"If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}],
+        ["no_validators", {}, {}],
+    ])
+    def test_conditional_headers(self, name, validators, expected):
+        """Test the headers a stale page is revalidated with."""
+        cache = ResponseCache(self.directory.name, {"template": 60})
+        self.addCleanup(cache.close)
+        cache.put("a", b"{}", 0, **validators)
+
+        self.assertEqual(cache.get("a").get_conditional_headers(), expected)
+
+    @parameterized.expand([
+        ["no_directory", {"response_cache_ttls": {"template": 60}}],
+        ["no_ttls", {"response_cache_dir": "/tmp"}],
+    ])
+    def test_from_config_disabled(self, name, config):
+        """Test that the cache needs both a directory and TTLs."""
+        self.assertIsNone(ResponseCache.from_config(config))
+
+
+class TestCachedSync(unittest.TestCase):
+    """Test full-table syncs served from the cache by the client."""
+
+    def setUp(self):
+        """Start a fake server and capture the written records."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.fake = FakeMailjet(records=RECORDS).start()
+        self.addCleanup(self.fake.stop)
+        self.mock_write_record = patch("tap_mailjet.streams.abstracts.write_record").start()
+        patch("tap_mailjet.checkpoint.write_state").start()
+        self.addCleanup(patch.stopall)
+
+    def sync(self, stream_class, config=None):
+        """Sync a stream and return the IDs written and the number of requests the server got."""
+        self.mock_write_record.reset_mock()
+        self.fake.requests.clear()
+        stream = get_stream(stream_class, self.fake.base_url, {
+            "response_cache_dir": self.directory.name,
+            "response_cache_ttls": {"contacts": TTL},
+            **(config or {}),
+        })
+        with stream.client:
+            stream.sync({}, Transformer())
+        return [c[0][1]["ID"] for c in self.mock_write_record.call_args_list], len(self.fake.requests)
+
+    @parameterized.expand([
+        ["pages", {}],
+        ["streamed_pages", {"stream_pages": True}],
+        ["concurrent_pages", {"page_concurrency": 3}],
+    ])
+    def test_fresh_pages_served_locally(self, name, config):
+        """Test that a second sync within the TTL sends no request."""
+        first = self.sync(Contacts, config)
+        second = self.sync(Contacts, config)
+
+        self.assertEqual(first[0], list(range(1, RECORDS + 1)))
+        self.assertGreater(first[1], 0)
+        self.assertEqual(second, (first[0], 0))
+
+    def test_stale_pages_revalidated(self):
+        """Test that stale pages are requested with their ETag and served from the cache on 304."""
+        ids, requests = self.sync(Contacts)
+
+        with patch("tap_mailjet.response_cache.time.time", return_value=time.time() + TTL + 1), \
+                patch.object(ResponseCache, "touch", autospec=True, side_effect=ResponseCache.touch) as mock_touch:
+            stale = self.sync(Contacts)
+
+        self.assertEqual(stale, (ids, requests))
+        self.assertEqual(mock_touch.call_count, requests)
+
+    def test_pages_expire_together(self):
+        """Test that pages stored later in a scan expire with its first page."""
+        now = time.time()
+        self.mock_write_record.side_effect = [None] * 100 + [RuntimeError("interrupted")]
+        with patch("tap_mailjet.response_cache.time.time", return_value=now), self.assertRaises(RuntimeError):
+            self.sync(Contacts)
+        self.mock_write_record.side_effect = None
+
+        with patch("tap_mailjet.response_cache.time.time", return_value=now + TTL / 2):
+            ids, requests = self.sync(Contacts)
+        with patch("tap_mailjet.response_cache.time.time", return_value=now + TTL - 1):
+            fresh = self.sync(Contacts)
+        with patch("tap_mailjet.response_cache.time.time", return_value=now + TTL + 1), \
+                patch.object(ResponseCache, "touch", autospec=True, side_effect=ResponseCache.touch) as mock_touch:
+            stale = self.sync(Contacts)
+
+        # The interrupted run stored the first two pages, the next one only the third
+        self.assertEqual((ids, requests), (list(range(1, RECORDS + 1)), 1))
+        self.assertEqual(fresh, (ids, 0))
+        self.assertEqual(stale, (ids, 3))
+        self.assertEqual(mock_touch.call_count, 3)
+
+    @patch("tap_mailjet.response_cache.time.time")
+    def test_scan_started_once_per_run(self, mock_time):
+        """Test that a scan turning stale during a run is kept until the next run."""
+        mock_time.return_value = 0
+        cache = ResponseCache(self.directory.name, {"contacts": TTL})
+        self.addCleanup(cache.close)
+        scan = cache.get_scan("https://api.mailjet.com/v3/REST/contact", TTL)
+        mock_time.return_value = TTL + 1
+
+        self.assertEqual(cache.get_scan("https://api.mailjet.com/v3/REST/contact", TTL), scan)
+        self.assertNotEqual(cache.get_scan("https://api.mailjet.com/v3/REST/template", TTL), scan)
+
+    def test_uncached_stream(self):
+        """Test that streams without a TTL always hit the API."""
+        first = self.sync(Messages)
+        second = self.sync(Messages)
+
+        self.assertEqual(second, first)
+        self.assertGreater(second[1], 0)
@@ -1,6 +1,11 @@
+import io
+import json
+from decimal import Decimal
+import threading
 import unittest
 from unittest.mock import patch, MagicMock, call
-from tap_mailjet.sync import sync, update_currently_syncing, write_schema
+from tap_mailjet import emitter
+from tap_mailjet.sync import sync, update_currently_syncing, write_schema, order_for_resume
 from singer import Catalog, CatalogEntry, Schema, metadata as singer_metadata
 
 class TestSync(unittest.TestCase):
@@ -221,3 +226,156 @@ class TestSync(unittest.TestCase):
         mock_set_currently_syncing.assert_called_once_with(state, "new_stream")
         mock_write_state.assert_called_once_with(state)
         self.assertNotIn("currently_syncing", state)
+
+
+class TestConcurrentSync(unittest.TestCase):
+    """Test the parallel multi-stream scheduler."""
+
+    def test_order_for_resume(self):
+        """Test that the interrupted stream is scheduled first."""
+        self.assertEqual(order_for_resume(["a", "b", "c"], "b"), ["b", "c", "a"])
+        self.assertEqual(order_for_resume(["a", "b", "c"], None), ["a", "b", "c"])
+        self.assertEqual(order_for_resume(["a", "b", "c"], "gone"), ["a", "b", "c"])
+
+    @patch("tap_mailjet.sync.write_state")
+    def test_streams_run_concurrently(self, mock_write_state):
+        """Test that streams overlap and currently_syncing tracks the first unfinished stream."""
+        barrier = threading.Barrier(2, timeout=5)
+        currently_syncing = []
+        state = {"currently_syncing": "campaigns"}
+
+        mock_write_state.side_effect = lambda s: currently_syncing.append(s.get("currently_syncing"))
+
+        def make_stream(name, wait):
+            instance = MagicMock()
+            instance.parent = ""
+            instance.children = []
+            instance.is_selected.return_value = True
+
+            def stream_sync(state, transformer):
+                if wait:
+                    # Only returns when both streams are running at the same time
+                    barrier.wait()
+                return 1
+            instance.sync.side_effect = stream_sync
+            return MagicMock(return_value=instance)
+
+        mock_catalog = MagicMock()
+        mock_catalog.get_selected_streams.return_value = [
+            MagicMock(stream="messages"), MagicMock(stream="campaigns"), MagicMock(stream="contacts")
+        ]
+        mock_streams_dict = {
+            "messages": make_stream("messages", False),
+            "campaigns": make_stream("campaigns", True),
+            "contacts": make_stream("contacts", True),
+        }
+
+        with patch.dict("tap_mailjet.sync.STREAMS", mock_streams_dict, clear=False):
+            sync(MagicMock(), {"stream_concurrency": 2}, mock_catalog, state)
+
+        # Resumes from campaigns, then clears currently_syncing when everything finished
+        self.assertEqual(currently_syncing[0], "campaigns")
+        self.assertIsNone(currently_syncing[-1])
+        self.assertNotIn("currently_syncing", state)
+        for name in mock_streams_dict:
+            self.assertEqual(mock_streams_dict[name].return_value.sync.call_count, 1)
+
+    @patch("tap_mailjet.sync.write_state")
+    def test_stream_failure_is_raised(self, mock_write_state):
+        """Test that an error in one stream fails the sync and keeps currently_syncing."""
+        failing = MagicMock()
+        failing.parent = ""
+        failing.children = []
+        failing.sync.side_effect = RuntimeError("boom")
+        mock_catalog = MagicMock()
+        mock_catalog.get_selected_streams.return_value = [MagicMock(stream="messages")]
+        state = {}
+
+        with patch.dict("tap_mailjet.sync.STREAMS", {"messages": MagicMock(return_value=failing)}, clear=False):
+            with self.assertRaises(RuntimeError):
+                sync(MagicMock(), {"stream_concurrency": 2}, mock_catalog, state)
+
+        self.assertEqual(state["currently_syncing"], "messages")
+
+
+class TestEmitter(unittest.TestCase):
+    """Test that concurrent writers never interleave lines."""
+
+    def test_concurrent_writes_are_whole_lines(self):
+        """Test that every stdout line is a complete message."""
+        output = io.StringIO()
+
+        def writer(name):
+            for i in range(200):
+                emitter.write_record(name, {"ID": i, "payload": "x" * 500})
+
+        with patch("sys.stdout", output):
+            threads = [threading.Thread(target=writer, args=(f"stream_{n}",)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 800)
+        self.assertTrue(all(json.loads(line)["type"] == "RECORD" for line in lines))
+
+
+class TestBufferedEmitter(unittest.TestCase):
+    """Test the buffered output mode of the emitter."""
+
+    def setUp(self):
+        """Enable buffering with a threshold above the test messages."""
+        emitter.configure({"output_buffer_bytes": 10000, "output_flush_seconds": 60})
+
+    def tearDown(self):
+        """Restore unbuffered output for other tests."""
+        emitter.configure({})
+
+    def test_records_buffered_until_state(self):
+        """Test that records are held back and written before the STATE that follows them."""
+        output = io.StringIO()
+        with patch("sys.stdout", output):
+            emitter.write_record("contacts", {"ID": 1})
+            emitter.write_record("contacts", {"ID": 2})
+            self.assertEqual(output.getvalue(), "")
+
+            emitter.write_state({"bookmarks": {"contacts": {"ID": 2}}})
+
+        messages = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([message["type"] for message in messages], ["RECORD", "RECORD", "STATE"])
+        self.assertEqual(messages[1]["record"], {"ID": 2})
+
+    def test_flush_on_size(self):
+        """Test that the buffer is written once it reaches output_buffer_bytes."""
+        output = io.StringIO()
+        with patch("sys.stdout", output):
+            for i in range(200):
+                emitter.write_record("contacts", {"ID": i, "payload": "x" * 100})
+
+            written = len(output.getvalue().splitlines())
+            emitter.flush()
+
+        self.assertGreater(written, 0)
+        self.assertLess(written, 200)
+        self.assertEqual(len(output.getvalue().splitlines()), 200)
+
+    def test_flush_on_time(self):
+        """Test that the buffer is written once output_flush_seconds have passed."""
+        emitter.configure({"output_buffer_bytes": 10000, "output_flush_seconds": 0.001})
+        output = io.StringIO()
+        with patch("sys.stdout", output):
+            emitter.write_record("contacts", {"ID": 1})
+            threading.Event().wait(0.01)
+            emitter.write_record("contacts", {"ID": 2})
+
+        self.assertEqual(len(output.getvalue().splitlines()), 2)
+
+    def test_decimal_uses_singer_encoder(self):
+        """Test that values the fast encoder rejects are still encoded."""
+        output = io.StringIO()
+        with patch("sys.stdout", output):
+            emitter.write_record("contacts", {"ID": Decimal("1.10")})
+            emitter.flush()
+
+        self.assertEqual(json.loads(output.getvalue())["record"], {"ID": 1.1})
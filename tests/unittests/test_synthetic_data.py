@@ -0,0 +1,90 @@
+"""Unit tests for the synthetic dataset generator."""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from parameterized import parameterized
+from singer import Transformer
+from tap_mailjet.client import Client
+from tap_mailjet.schema import get_schemas
+from tap_mailjet.streams import STREAMS
+from tap_mailjet.streams.messages import Messages
+from fake_mailjet import Dataset, FakeMailjet
+from synthetic_data import RecordGenerator, ShardedTable, write_dataset, write_stream
+
+RECORDS = 150
+
+
+class TestSyntheticData(unittest.TestCase):
+    """Test that generated rows match the packaged schemas."""
+
+    def setUp(self):
+        """Write a small dataset of every stream in several shards."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        write_dataset(self.directory.name, RECORDS, seed=3, shard_records=64)
+        self.schemas = get_schemas()[0]
+
+    @parameterized.expand([[name] for name in STREAMS])
+    def test_rows_match_schema(self, stream_name):
+        """Test that rows transform cleanly and have unique, non-null key properties."""
+        table = ShardedTable(self.directory.name, stream_name)
+        rows = list(table)
+        key_properties = STREAMS[stream_name].key_properties
+
+        self.assertEqual(len(table), RECORDS)
+        with Transformer() as transformer:
+            for row in rows:
+                transformer.transform(row, self.schemas[stream_name])
+        keys = [tuple(row[key] for key in key_properties) for row in rows]
+        self.assertTrue(all(None not in key for key in keys))
+        if key_properties:
+            self.assertEqual(len(set(keys)), RECORDS)
+
+    def test_random_access(self):
+        """Test that indexing across shard boundaries returns the generated rows."""
+        table = ShardedTable(self.directory.name, "click_statistics")
+        generator = RecordGenerator("click_statistics", self.schemas["click_statistics"], seed=3)
+        rows = [generator.generate(index) for index in range(RECORDS)]
+
+        for index in (0, 63, 64, 127, 128, RECORDS - 1, -1):
+            self.assertEqual(table[index], rows[index])
+        with self.assertRaises(IndexError):
+            table[RECORDS]
+        self.assertEqual(len(table.timestamps), RECORDS)
+        self.assertEqual(list(table.timestamps), sorted(table.timestamps))
+
+    @parameterized.expand([
+        ["same_seed", 3, True],
+        ["other_seed", 4, False],
+    ])
+    def test_deterministic(self, name, seed, expected):
+        """Test that a seed always gives the same bytes."""
+        with tempfile.TemporaryDirectory() as directory:
+            write_stream(directory, "messages", RECORDS, seed=seed, shard_records=64)
+            with open(os.path.join(directory, "messages-00001.jsonl"), "rb") as written, \
+                    open(os.path.join(self.directory.name, "messages-00001.jsonl"), "rb") as original:
+                self.assertEqual(written.read() == original.read(), expected)
+
+    @patch("tap_mailjet.checkpoint.write_state")
+    @patch("tap_mailjet.streams.abstracts.write_record")
+    def test_served_by_fake_mailjet(self, mock_write_record, mock_write_state):
+        """Test a windowed sync of the dataset through the stand-in server."""
+        with FakeMailjet(Dataset.from_directory(self.directory.name)) as fake:
+            client = Client({
+                "api_key": "key",
+                "secret_key": "secret",
+                "start_date": "2024-12-31T00:00:00Z",
+                "base_url": fake.base_url,
+                "incremental_window_days": 30,
+                "window_target_records": 50,
+            })
+            catalog = MagicMock()
+            catalog.schema.to_dict.return_value = self.schemas["messages"]
+            catalog.metadata = []
+            stream = Messages(client=client, catalog=catalog)
+            stream.is_selected = MagicMock(return_value=True)
+
+            stream.sync({}, Transformer())
+
+        self.assertEqual([c[0][1]["ID"] for c in mock_write_record.call_args_list], list(range(1, RECORDS + 1)))
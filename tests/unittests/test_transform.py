@@ -0,0 +1,142 @@
+"""Unit tests for the compiled per-stream transformer."""
+import copy
+import random
+import unittest
+from unittest.mock import MagicMock
+from parameterized import parameterized
+from singer import Transformer, metadata
+from singer.transform import SchemaMismatch
+from tap_mailjet.schema import get_schemas
+from tap_mailjet.streams.contacts import Contacts
+from tap_mailjet.transform import CompiledSchema, UnsupportedSchema, format_datetime
+
+SCHEMAS, METADATA = get_schemas()
+
+# Values singer accepts for each type, and values that fail the whole record
+VALID_VALUES = {
+    "string": ["text", "", None, 12, 1.5, True, {"a": 1}],
+    "integer": [7, "1,234", "12", "", None, 3.9, True],
+    "number": [1.25, "1,234.5", 3, "", None],
+    "boolean": [True, False, "false", "False", "true", 0, 1, "", None],
+    "date-time": [
+        "2025-01-02T03:04:05Z", "2025-01-02T03:04:05.5Z", "2025-01-02 03:04:05",
+        "2025-01-02T03:04:05+05:30", "2025-01-02T03:04:05.123456-02:00", "Jan 2 2025", "", None
+    ],
+}
+INVALID_VALUES = {
+    "integer": ["abc"],
+    "number": ["abc"],
+    "date-time": ["2025-02-30T00:00:00Z", "not a date", 1735787045],
+}
+
+
+def sample_value(rng, schema):
+    """Pick a valid or deliberately awkward value for a schema node."""
+    types = schema.get("type", [])
+    types = types if isinstance(types, list) else [types]
+    types = [typ for typ in types if typ != "null"] or ["string"]
+    typ = rng.choice(types)
+    if schema.get("format") == "date-time":
+        typ = "date-time"
+    if typ == "object":
+        return rng.choice([sample_record(rng, schema), None, "text"])
+    if typ == "array":
+        return rng.choice([[sample_value(rng, schema["items"]) for _ in range(3)], [], None])
+    if typ in INVALID_VALUES and rng.random() < 0.01:
+        return rng.choice(INVALID_VALUES[typ])
+    return rng.choice(VALID_VALUES.get(typ, [None]))
+
+
+def sample_record(rng, schema):
+    """Build a record for an object schema, with an extra field the schema does not know."""
+    record = {name: sample_value(rng, sub_schema) for name, sub_schema in schema.get("properties", {}).items()}
+    record["NotInSchema"] = "extra"
+    return record
+
+
+def deselect_one_field(mdata):
+    """Deselect the first field that is not automatically included."""
+    mdata = metadata.to_map(copy.deepcopy(mdata))
+    for breadcrumb, entry in mdata.items():
+        if breadcrumb and entry.get("inclusion") != "automatic":
+            entry["selected"] = False
+            break
+    return mdata
+
+
+def run(transform):
+    """Return the output or the exception type, with the transformer's bookkeeping."""
+    transformer = Transformer()
+    try:
+        result = transform(transformer)
+    except SchemaMismatch as err:
+        result = type(err)
+    return result, transformer.removed, transformer.filtered
+
+
+class TestCompiledSchema(unittest.TestCase):
+    """Test that the compiled transformer matches singer's Transformer."""
+
+    @parameterized.expand(sorted(SCHEMAS))
+    def test_matches_singer_transformer(self, stream_name):
+        """Test every packaged schema against seeded random records."""
+        schema = SCHEMAS[stream_name]
+        mdata = deselect_one_field(METADATA[stream_name])
+        compiled = CompiledSchema(schema, mdata)
+        rng = random.Random(stream_name)
+
+        for _ in range(200):
+            record = sample_record(rng, schema)
+            expected = run(lambda transformer: transformer.transform(copy.deepcopy(record), schema, mdata))
+            actual = run(lambda transformer: compiled.transform(copy.deepcopy(record), transformer))
+            self.assertEqual(actual, expected, record)
+
+    @parameterized.expand([
+        ["zulu", "2025-01-02T03:04:05Z", "2025-01-02T03:04:05.000000Z"],
+        ["fraction", "2025-01-02T03:04:05.12Z", "2025-01-02T03:04:05.120000Z"],
+        ["offset", "2025-01-02T01:00:00+02:00", "2025-01-01T23:00:00.000000Z"],
+        ["naive", "2025-01-02 03:04:05", "2025-01-02T03:04:05.000000Z"],
+        ["invalid_day", "2025-02-30T00:00:00Z", None],
+    ])
+    def test_format_datetime(self, name, value, expected):
+        """Test the ISO 8601 fast path and its fallback."""
+        self.assertEqual(format_datetime(value), expected)
+
+    def test_unsupported_schema(self):
+        """Test that schemas using anyOf are left to the generic transformer."""
+        with self.assertRaises(UnsupportedSchema):
+            CompiledSchema({"type": "object", "properties": {"a": {"anyOf": [{"type": "string"}]}}}, {})
+
+    def test_custom_transformer_settings_use_generic_path(self):
+        """Test that a Transformer with a pre_hook is used as is."""
+        compiled = CompiledSchema({"type": "object", "properties": {"a": {"type": "string"}}}, {})
+        transformer = Transformer(pre_hook=lambda data, typ, schema: "hooked" if typ == "string" else data)
+
+        self.assertEqual(compiled.transform({"a": "x"}, transformer), {"a": "hooked"})
+
+
+class TestCompiledTransformSync(unittest.TestCase):
+    """Test that streams use the compiled transformer when enabled."""
+
+    def get_stream(self, config):
+        """Build a contacts stream with the packaged schema."""
+        client = MagicMock()
+        client.config = config
+        catalog = MagicMock()
+        catalog.schema.to_dict.return_value = SCHEMAS["contacts"]
+        catalog.metadata = METADATA["contacts"]
+        return Contacts(client=client, catalog=catalog)
+
+    @parameterized.expand([
+        ["enabled", {"compiled_transform": "true"}, True],
+        ["disabled", {}, False],
+    ])
+    def test_compile_schema(self, name, config, expected):
+        """Test that the stream compiles its schema only when configured."""
+        stream = self.get_stream(config)
+        records = [{"ID": 1, "CreatedAt": "2025-01-02T03:04:05Z"}]
+
+        result = list(stream.transform_records(records, Transformer()))
+
+        self.assertEqual(stream.compiled_schema is not None, expected)
+        self.assertEqual(result[0][1]["CreatedAt"], "2025-01-02T03:04:05.000000Z")